@@ -1,13 +1,30 @@
 # pip install pyinstaller
 # executar quando o app estiver completo
 
-import tkinter as tk
-from tkinter import ttk
-from PIL import Image, ImageTk, ImageDraw
-import os
-import sys
-import math
-import json
+# modo trace da inicialização: --perfil-inicio ou GLA_PERFIL_INICIO=1 (ver perfil_inicio.py)
+import perfil_inicio
+
+with perfil_inicio.fase("imports (tkinter, núcleo de cálculo)"):
+    import tkinter as tk
+    from tkinter import ttk
+    import os
+    import sys
+    import time
+    import base64
+    import io
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from calculos import (
+        receitas, slots, crystals_per_up, TAXA_VENDA, NIVEL_MAXIMO, NIVEL_MAXIMO_CRISTAL,
+        plano_experiencia, custo_receita, plano_cristais, get_crystal_type_for_level,
+        alocar_orcamento, nivel_com_pocoes, recarregar_se_mudou, ao_recarregar, DadosInvalidos
+    )
+    from distribuicao import distribuicao_cristais
+    from reativo import Grafo
+    from sprites import abrir_pacote, FONTES, SPRITES_APP
+    from configuracoes import Configuracoes
+    from tabela import ModeloTabela, TabelaVirtual
 
 # Pequenas utilidades
 def _clamp(v, lo=0, hi=255):
@@ -64,30 +81,32 @@ DEFAULT_SETTINGS = {
     "receita_valor": "3200",
     "cristal_equip": "Emblema",
     "cristal_level": "0",
-    "cristal_values": {}
+    "cristal_values": {},
+    "exp_nivel_ini": "1",
+    "exp_nivel_fin": "70",
+    # poções que o jogador já tem (consulta inversa: até que nível elas levam)
+    "exp_pocoes": {},
+    # tabela de cristais: só o equipamento escolhido ou todos
+    "cristal_todos": False,
+    # orçamento (berry) para sugerir quais upgrades comprar em todos os equipamentos
+    "cristal_orcamento": "",
+    # segundos que uma tela escondida fica em memória antes de ser destruída (0 = nunca)
+    "tela_ociosa_segundos": 300
 }
-settings = DEFAULT_SETTINGS.copy()
+# dict que registra as chaves alteradas; só grava quando o conteúdo muda (ver configuracoes.py)
+settings = Configuracoes(SETTINGS_FILE, DEFAULT_SETTINGS)
 
 def load_settings():
-    global settings
-    try:
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-            s = json.load(f)
-            settings.update(s)
-    except Exception:
-        # keep defaults
-        pass
+    # arquivo ausente ou inválido: mantém os padrões
+    settings.carregar()
 
 # save_settings será usada mais tarde (quando a janela existir) — definimos uma versão básica aqui
 def save_settings():
-    try:
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+    settings.gravar()
 
 # carrega settings imediatamente
-load_settings()
+with perfil_inicio.fase("load_settings"):
+    load_settings()
 
 # Cores modernas
 COR_PRIMARIA = "#1e3a8a"      # Azul escuro
@@ -97,34 +116,6 @@ COR_FUNDO = "#0f172a"         # Preto azulado
 COR_TEXTO = "#f1f5f9"         # Branco gelado
 COR_CARD = "#1e293b"          # Cinza escuro
 
-# ================= DADOS =================
-receitas = {
-    "Paella de Camarão": {
-        # formato: (quantia_por_RECEITA, valor_unitario)
-        "Camarão Cru": (8, 300),
-        "Folhas Verdes": (1, 15),
-        "Tomates": (1, 10),
-        "Água": (3, 5),
-        "Trufa Branca": (3, 250),
-        "Sal": (1, 10),
-        "Pimenta": (1, 15),
-        "Arroz": (2, 10),
-        "Azeite": (1, 15)
-    },
-    "Frango Teriyaki": {
-        # formato: (quantia_por_RECEITA, valor_unitario)
-        "Galinha": (5, 300),
-        "Pimenta": (1, 15),
-        "Tomates": (3, 10),
-        "Sal": (2, 10),
-        "Azeite": (6, 15),
-        "Folhas Verdes": (3, 15),
-        "Alho": (3, 10),
-        "Trufa Branca": (3, 250),
-        "Creme de Leite": (3, 20)
-    }
-}
-
 # ================= FUNÇÕES UTILITÁRIAS =================
 def criar_botao_moderno(parent, texto, comando, cor_fundo=COR_PRIMARIA, cor_texto=COR_TEXTO, largura=30, altura_fonte=11):
     """Cria um botão moderno com efeito hover e feedback visual."""
@@ -174,23 +165,152 @@ def criar_botao_moderno(parent, texto, comando, cor_fundo=COR_PRIMARIA, cor_text
 
     return btn
 
+# Sprites: atlas pré-redimensionados por tamanho (assets/sprites.bin, gerado por
+# sprites.py), mapeados em memória e indexados uma vez. Sem o pacote, cada
+# imagem é aberta e redimensionada com PIL.
+#
+# A decodificação roda num pool de threads: PIL abre o atlas (ou o PNG avulso),
+# recorta e redimensiona fora da thread do Tk, que só converte o resultado em
+# PhotoImage. Enquanto isso o widget recebe um placeholder vazio do mesmo
+# tamanho, preenchido no lugar quando a imagem chega (entrega via janela.after).
+# Sem PIL, o atlas é decodificado pelo próprio Tk, de forma síncrona.
+with perfil_inicio.fase("sprites: abrir pacote"):
+    pacote_sprites = abrir_pacote(resource_path("sprites.bin"))
+# atlas já decodificados, por tamanho ("28x28", ...)
+atlas_tk = {}
+atlas_pil = {}
+_trava_atlas = threading.Lock()
+
+INTERVALO_IMAGENS_MS = 15
+pool_imagens = ThreadPoolExecutor(max_workers=2, thread_name_prefix="imagens")
+# (nome, tamanho) → Future com a imagem PIL pronta (ou None)
+imagens_decodificando = {}
+# placeholders à espera da imagem: (future, callback na thread do Tk)
+_entregas_pendentes = []
+_entregando = False
+
+def _decodificar_sprite(nome, tamanho, arquivo):
+    """Roda no pool: imagem PIL RGBA já no tamanho final, ou None."""
+    from PIL import Image
+    s = pacote_sprites.sprite(nome, tamanho) if pacote_sprites is not None else None
+    if s is not None:
+        with _trava_atlas:
+            atlas = atlas_pil.get(s["atlas"])
+            if atlas is None:
+                atlas = Image.open(io.BytesIO(pacote_sprites.dados_atlas(s["atlas"]))).convert("RGBA")
+                atlas_pil[s["atlas"]] = atlas
+        return atlas.crop((s["x"], s["y"], s["x"] + s["w"], s["y"] + s["h"]))
+    if not arquivo:
+        return None
+    with Image.open(resource_path(arquivo)) as img:
+        return img.convert("RGBA").resize(tamanho)
+
+def decodificar_em_segundo_plano(nome, tamanho, arquivo):
+    """Agenda (uma vez por sprite e tamanho) a decodificação no pool; devolve o Future."""
+    chave = (nome, tamanho)
+    fut = imagens_decodificando.get(chave)
+    if fut is None:
+        fut = imagens_decodificando[chave] = pool_imagens.submit(_decodificar_sprite, nome, tamanho, arquivo)
+    return fut
+
+def precarregar_imagens():
+    """Decodifica em segundo plano todos os sprites do app (chamado logo após abrir a janela)."""
+    for nome, tamanho in SPRITES_APP:
+        decodificar_em_segundo_plano(nome, tamanho, FONTES.get(nome, ""))
+
+def _resultado(fut):
+    try:
+        return fut.result()
+    except Exception:
+        # PIL ausente ou arquivo ilegível: quem chamou cai no caminho síncrono
+        return None
+
+def _entregar_imagens():
+    """Na thread do Tk: entrega as imagens prontas e reagenda enquanto houver espera."""
+    global _entregando
+    pendentes = _entregas_pendentes[:]
+    _entregas_pendentes.clear()
+    for fut, ao_pronto in pendentes:
+        if fut.done():
+            ao_pronto(_resultado(fut))
+        else:
+            _entregas_pendentes.append((fut, ao_pronto))
+    if _entregas_pendentes:
+        janela.after(INTERVALO_IMAGENS_MS, _entregar_imagens)
+    else:
+        _entregando = False
+
+def quando_pronta(fut, ao_pronto):
+    """Chama `ao_pronto(imagem PIL ou None)` na thread do Tk quando o Future terminar."""
+    global _entregando
+    _entregas_pendentes.append((fut, ao_pronto))
+    if not _entregando:
+        _entregando = True
+        janela.after(INTERVALO_IMAGENS_MS, _entregar_imagens)
+
+def _photo_pil(img):
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(img)
+
+def _sprite_existe(nome, tamanho, arquivo):
+    if pacote_sprites is not None and pacote_sprites.sprite(nome, tamanho) is not None:
+        return True
+    return bool(arquivo) and os.path.exists(resource_path(arquivo))
+
+def carregar_sprite(nome, tamanho, arquivo):
+    """PhotoImage de `nome` no `tamanho` pedido: recorte do atlas ou o PNG avulso redimensionado.
+
+    Se a decodificação ainda não terminou, devolve um placeholder do mesmo
+    tamanho que é preenchido quando a imagem ficar pronta; None se não houver imagem.
+    """
+    fut = decodificar_em_segundo_plano(nome, tamanho, arquivo)
+    if fut.done():
+        img = _resultado(fut)
+        with perfil_inicio.fase(f"imagem {nome} {tamanho[0]}x{tamanho[1]}"):
+            return _photo_pil(img) if img is not None else _carregar_sprite(nome, tamanho, arquivo)
+    if not _sprite_existe(nome, tamanho, arquivo):
+        return None
+    placeholder = tk.PhotoImage(width=tamanho[0], height=tamanho[1])
+
+    def preencher(img):
+        photo = _photo_pil(img) if img is not None else _carregar_sprite(nome, tamanho, arquivo)
+        if photo is not None:
+            try:
+                placeholder.tk.call(placeholder, "copy", photo)
+            except tk.TclError:
+                pass
+    quando_pronta(fut, preencher)
+    return placeholder
+
+def _carregar_sprite(nome, tamanho, arquivo):
+    """Caminho síncrono (sem PIL): o Tk decodifica o atlas."""
+    s = pacote_sprites.sprite(nome, tamanho) if pacote_sprites is not None else None
+    if s is not None:
+        try:
+            atlas = atlas_tk.get(s["atlas"])
+            if atlas is None:
+                atlas = tk.PhotoImage(data=base64.b64encode(pacote_sprites.dados_atlas(s["atlas"])))
+                atlas_tk[s["atlas"]] = atlas
+            photo = tk.PhotoImage(width=s["w"], height=s["h"])
+            photo.tk.call(photo, "copy", atlas, "-from", s["x"], s["y"], s["x"] + s["w"], s["y"] + s["h"], "-to", 0, 0)
+            return photo
+        except tk.TclError:
+            pass
+    return None
+
 # Logo loader (definido aqui para ficar disponível ao construir a UI do menu)
 # cache de imagens do logo por tamanho
 imagem_logo_cache = {}
 
 def carregar_logo(tamanho=(120,40)):
     """Carrega o logo do app para exibí-lo no rodapé do menu (cache por tamanho)."""
-    global imagem_logo_cache
     key = tamanho
     if key in imagem_logo_cache:
         return imagem_logo_cache[key]
-    caminho = resource_path("logo.png")
-    try:
-        img = Image.open(caminho).resize(tamanho)
-        imagem_logo_cache[key] = ImageTk.PhotoImage(img)
-        return imagem_logo_cache[key]
-    except Exception:
-        return None
+    photo = carregar_sprite("logo", tamanho, "logo.png")
+    if photo:
+        imagem_logo_cache[key] = photo
+    return photo
 
 class ToolTip:
     """Simples tooltip usando uma Toplevel pequena."""
@@ -216,7 +336,8 @@ class ToolTip:
             self.tipwindow = None
 
 # ================= JANELA PRINCIPAL =================
-janela = tk.Tk()
+with perfil_inicio.fase("tk.Tk()"):
+    janela = tk.Tk()
 janela.title("GLA Tools")
 # Aplica geometria salva, se houver
 janela.geometry(settings.get('geometry', f"{LARGURA}x{ALTURA}"))
@@ -229,37 +350,56 @@ janela.resizable(True, True)
 janela.minsize(600, 400)
 janela.config(bg=COR_FUNDO)
 # tenta aplicar ícone do app (icon.ico se existir, senão usa logo.png)
-try:
-    icon_path = resource_path("icon.ico")
-    if os.path.exists(icon_path):
-        janela.iconbitmap(icon_path)
-    else:
-        logo_icon_path = resource_path("logo.png")
-        if os.path.exists(logo_icon_path):
-            try:
-                logo_icon_img = ImageTk.PhotoImage(Image.open(logo_icon_path))
-                janela.iconphoto(False, logo_icon_img)
-                # mantém referência para evitar coleta de lixo
-                janela._logo_icon = logo_icon_img
-            except Exception:
-                pass
-except Exception:
-    pass
+with perfil_inicio.fase("ícone da janela"):
+    try:
+        icon_path = resource_path("icon.ico")
+        if os.path.exists(icon_path):
+            janela.iconbitmap(icon_path)
+        else:
+            logo_icon_path = resource_path("logo.png")
+            if os.path.exists(logo_icon_path):
+                def _abrir_icone():
+                    from PIL import Image
+                    with Image.open(logo_icon_path) as img:
+                        return img.convert("RGBA")
+                def _aplicar_icone(img):
+                    if img is None:
+                        return
+                    try:
+                        logo_icon_img = _photo_pil(img)
+                        janela.iconphoto(False, logo_icon_img)
+                        # mantém referência para evitar coleta de lixo
+                        janela._logo_icon = logo_icon_img
+                    except Exception:
+                        pass
+                # decodificado no pool; a janela aparece sem esperar o ícone
+                quando_pronta(pool_imagens.submit(_abrir_icone), _aplicar_icone)
+    except Exception:
+        pass
+
+# sprites do app decodificados em segundo plano desde já: as telas recebem
+# placeholders e o primeiro "CALCULAR" já encontra as imagens prontas
+precarregar_imagens()
 
 # ========= Persistência: debounce de salvamento e handlers =========
 save_job = None
 
+def _salvar_agendado():
+    global save_job
+    save_job = None
+    save_settings()
+
 def schedule_save(delay=800):
+    """Agenda uma gravação; pedidos em rajada dentro do intervalo viram uma só."""
     global save_job
-    try:
-        if save_job:
-            janela.after_cancel(save_job)
-    except Exception:
-        pass
-    save_job = janela.after(delay, save_settings)
+    if save_job is None and settings.sujas:
+        save_job = janela.after(delay, _salvar_agendado)
 
 # Atualiza settings com geometria/state (debounced)
 def _on_window_config(event):
+    # o bind na raiz recebe o <Configure> de todos os widgets filhos; só a janela interessa
+    if event.widget is not janela:
+        return
     try:
         st = janela.state()
         settings['state'] = st
@@ -273,6 +413,8 @@ janela.bind('<Configure>', _on_window_config)
 
 def on_close():
     try:
+        for nome in list(frames):
+            _salvar_estado_tela(nome)
         save_settings()
     except Exception:
         pass
@@ -285,15 +427,63 @@ container = tk.Frame(janela, bg=COR_FUNDO)
 container.pack(fill=tk.BOTH, expand=True)
 
 frames = {}
+# construtores de cada tela (preenchido após as funções construir_*)
+construtores = {}
+# instante (time.monotonic) em que cada tela construída foi escondida
+ocultas_desde = {}
+INTERVALO_EVICCAO_MS = 30000
+# polling do arquivo de dados do jogo (recarregamento a quente)
+INTERVALO_DADOS_MS = 2000
+# grafo reativo de cada tela construída (recalcula enquanto o usuário digita)
+grafos = {}
+
+def _novo_grafo(nome):
+    """Cria o grafo reativo da tela `nome`, descartando o da construção anterior."""
+    antigo = grafos.pop(nome, None)
+    if antigo:
+        antigo.parar()
+    grafos[nome] = Grafo(agendar=janela.after, cancelar=janela.after_cancel)
+    return grafos[nome]
+
+def _ligar_entrada(grafo, nome, widget, eventos=("<KeyRelease>",)):
+    """Declara `nome` como entrada do grafo e publica o texto do widget a cada evento."""
+    grafo.entrada(nome, widget.get())
+    def _publicar(event=None):
+        grafo.definir(nome, widget.get())
+    for ev in eventos:
+        widget.bind(ev, _publicar, add="+")
+
+def _substituir_trecho(texto, tag, conteudo):
+    """Troca só o trecho marcado com `tag` num tk.Text (sem redesenhar o resto)."""
+    faixa = texto.tag_ranges(tag)
+    if not faixa:
+        return
+    texto.config(state="normal")
+    texto.delete(faixa[0], faixa[1])
+    texto.insert(faixa[0], conteudo, tag)
+    texto.config(state="disabled")
 
 def mostrar_tela(nome):
-    """Mostra a tela escondendo as demais e exibindo apenas a solicitada."""
+    """Mostra a tela escondendo as demais e exibindo apenas a solicitada.
+
+    A tela é construída na primeira vez que é pedida (ou após ter sido
+    descartada por ociosidade).
+    """
+    if nome not in construtores:
+        nome = "menu"
     # Esconde todas as telas
-    for frame in frames.values():
+    for n, frame in frames.items():
+        if n == nome:
+            continue
         try:
             frame.pack_forget()
         except Exception:
             pass
+        ocultas_desde.setdefault(n, time.monotonic())
+    if nome not in frames:
+        with perfil_inicio.fase(f"construir tela {nome}"):
+            frames[nome] = construtores[nome]()
+    ocultas_desde.pop(nome, None)
     # Mostra somente a tela solicitada e faz com que ela ocupe todo o container
     frames[nome].pack(fill=tk.BOTH, expand=True)
     try:
@@ -307,336 +497,245 @@ def mostrar_tela(nome):
     except Exception:
         pass
 
-# ================= TELA MENU =================
-menu = tk.Frame(container, bg=COR_FUNDO)
-menu.pack(fill=tk.BOTH, expand=True)
-frames["menu"] = menu
-
-# Título estilizado
-titulo_frame = tk.Frame(menu, bg=COR_FUNDO)
-titulo_frame.pack(pady=40)
-
-tk.Label(
-    titulo_frame,
-    text="⚙️ GLA",
-    bg=COR_FUNDO,
-    fg=COR_ACENTO,
-    font=("Segoe UI", 24, "bold")
-).pack()
-
-tk.Label(
-    titulo_frame,
-    text="TOOLS",
-    bg=COR_FUNDO,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 18, "normal")
-).pack()
-
-tk.Label(
-    titulo_frame,
-    text="Desenvolvido por Liniker",
-    bg=COR_FUNDO,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 6, "normal")
-).pack()
-
-# Cards de opções (sem scrollbar)
-cards_frame = tk.Frame(menu, bg=COR_FUNDO)
-cards_frame.pack(pady=30, padx=20, fill=tk.BOTH, expand=True)
-
-# Crie os cards e organize em duas colunas (grid)
-cards = []
-
-card1 = tk.Frame(cards_frame, bg=COR_CARD, relief=tk.FLAT, bd=1)
-cards.append((card1, {
-    'title': '📊 CALCULADORA DE EXPERIÊNCIA',
-    'desc': 'Calcule quantas poções você precisa\npara subir de nível por tier',
-    'btn_text': 'ABRIR CALCULADORA',
-    'btn_cmd': lambda: mostrar_tela('exp'),
-    'btn_bg': COR_ACENTO,
-    'btn_fg': '#000'
-}))
-
-card2 = tk.Frame(cards_frame, bg=COR_CARD, relief=tk.FLAT, bd=1)
-cards.append((card2, {
-    'title': '🍲 CALCULADORA DE RECEITAS',
-    'desc': 'Calcule custo, lucro e ingredientes\npara suas receitas gourmet',
-    'btn_text': 'ABRIR CALCULADORA',
-    'btn_cmd': lambda: mostrar_tela('receitas'),
-    'btn_bg': COR_SECUNDARIA,
-    'btn_fg': COR_TEXTO
-}))
-
-card3 = tk.Frame(cards_frame, bg=COR_CARD, relief=tk.FLAT, bd=1)
-cards.append((card3, {
-    'title': '💎 CALCULADORA DE CRISTAIS',
-    'desc': 'Calcule cristais necessários por equipamento\ncom opção de valor em berry',
-    'btn_text': 'ABRIR CALCULADORA',
-    'btn_cmd': lambda: mostrar_tela('cristais'),
-    'btn_bg': '#06b6d4',
-    'btn_fg': '#000'
-}))
-
-# Configure grid
-cards_frame.grid_columnconfigure(0, weight=1)
-cards_frame.grid_columnconfigure(1, weight=1)
-
-for idx, (card, data) in enumerate(cards):
-    r = idx // 2
-    c = idx % 2
-    card.grid(row=r, column=c, sticky='nsew', padx=8, pady=8)
-    tk.Label(
-        card,
-        text=data['title'],
-        bg=COR_CARD,
-        fg=COR_ACENTO,
-        font=("Segoe UI", 11, "bold")
-    ).pack(pady=8, padx=10)
-    tk.Label(
-        card,
-        text=data['desc'],
-        bg=COR_CARD,
-        fg="#cbd5e1",
-        font=("Segoe UI", 9, "normal"),
-        justify=tk.CENTER
-    ).pack(pady=4, padx=10)
-    criar_botao_moderno(
-        card,
-        data['btn_text'],
-        data['btn_cmd'],
-        cor_fundo=data['btn_bg'],
-        cor_texto=data['btn_fg']
-    ).pack(pady=8)
-
-    # efeito hover: clareia levemente o card inteiro, mas NÃO altera botões/entradas para evitar flicker
-    def _on_card_enter(e, c=card):
-        try:
-            newbg = adjust_color(COR_CARD, 1.06)
-            c.config(bg=newbg)
-            for child in c.winfo_children():
-                try:
-                    # evita alterar widgets interativos que possuem seu próprio estilo
-                    cls = child.winfo_class()
-                    if cls in ("Button", "TButton", "Entry", "Text", "Canvas", "Scrollbar", "Listbox", "Combobox"):
-                        continue
-                    child.config(bg=newbg)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-    def _on_card_leave(e, c=card):
-        try:
-            c.config(bg=COR_CARD)
-            for child in c.winfo_children():
-                try:
-                    cls = child.winfo_class()
-                    if cls in ("Button", "TButton", "Entry", "Text", "Canvas", "Scrollbar", "Listbox", "Combobox"):
-                        continue
-                    child.config(bg=COR_CARD)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-    card.bind("<Enter>", _on_card_enter)
-    card.bind("<Leave>", _on_card_leave)
-
-# Footer do menu com logo centralizado
-footer_menu = tk.Frame(menu, bg=COR_FUNDO)
-footer_menu.pack(side=tk.BOTTOM, fill=tk.X, pady=10)
-# logo com altura levemente maior
-logo_img = carregar_logo((160,80))
-if logo_img:
-    logo_lbl = tk.Label(footer_menu, image=logo_img, bg=COR_FUNDO, cursor="hand2")
-    logo_lbl.image = logo_img
-    logo_lbl.pack()
-    ToolTip(logo_lbl, "Desenvolvido por Liniker")
-    # hover: aumenta o logo levemente
-    big_logo = carregar_logo((180,90))
-    def _logo_enter(e):
-        try:
-            if big_logo:
-                logo_lbl.config(image=big_logo)
-                logo_lbl.image = big_logo
-        except Exception:
-            pass
-    def _logo_leave(e):
-        try:
-            logo_lbl.config(image=logo_img)
-            logo_lbl.image = logo_img
-        except Exception:
-            pass
-    logo_lbl.bind("<Enter>", _logo_enter)
-    logo_lbl.bind("<Leave>", _logo_leave)
-else:
-    lbl = tk.Label(footer_menu, text="GLA", bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 10, "bold"))
-    lbl.pack()
-    ToolTip(lbl, "Desenvolvido por Liniker")
-
-# ================= TELA EXPERIÊNCIA =================
-tela_exp = tk.Frame(container, bg=COR_FUNDO)
-tela_exp.pack(fill=tk.BOTH, expand=True)
-frames["exp"] = tela_exp
-
-# Header
-header_exp = tk.Frame(tela_exp, bg=COR_PRIMARIA, height=70)
-header_exp.pack(fill=tk.X)
-
-tk.Label(
-    header_exp,
-    text="📊 CALCULADORA DE EXPERIÊNCIA",
-    bg=COR_PRIMARIA,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 14, "bold")
-).pack(pady=15)
-
-# Conteúdo — scrollable (mantém botões fixos no rodapé em monitores pequenos)
-content_exp_container = tk.Frame(tela_exp, bg=COR_FUNDO)
-content_exp_container.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
-content_exp_canvas = tk.Canvas(content_exp_container, bg=COR_FUNDO, highlightthickness=0)
-content_exp_scroll = tk.Scrollbar(content_exp_container, orient=tk.VERTICAL, command=content_exp_canvas.yview)
-content_exp_canvas.configure(yscrollcommand=content_exp_scroll.set)
-content_exp_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=10)
-content_exp_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-content_exp = tk.Frame(content_exp_canvas, bg=COR_FUNDO)
-content_exp_window = content_exp_canvas.create_window((0,0), window=content_exp, anchor='nw')
-# Ajusta região de rolagem quando o frame interno muda
-def _on_config_exp(event):
-    content_exp_canvas.configure(scrollregion=content_exp_canvas.bbox("all"))
-content_exp.bind("<Configure>", _on_config_exp)
-# Faz o frame interno preencher toda a largura do canvas (corrige desalinhamento)
-def _on_canvas_config_exp(event):
+def _salvar_estado_tela(nome):
+    """Copia os valores dos campos da tela para `settings` (antes de destruí-la)."""
     try:
-        content_exp_canvas.itemconfig(content_exp_window, width=event.width)
+        if nome == "exp":
+            settings['exp_nivel_ini'] = entry_nivel_ini.get()
+            settings['exp_nivel_fin'] = entry_nivel_fin.get()
+            settings['exp_pocoes'] = {t: e.get() for t, e in entries_pocoes.items()}
+        elif nome == "receitas":
+            settings['receita'] = combo.get()
+            settings['receita_qtd'] = entry_qtd.get()
+            settings['receita_valor'] = entry_valor.get()
+        elif nome == "cristais":
+            settings['cristal_equip'] = combo_equip.get()
+            settings['cristal_level'] = combo_level.get()
+            settings['cristal_values'] = {k: e.get() for k, e in valor_entries.items()}
+            settings['cristal_orcamento'] = entry_orcamento.get()
     except Exception:
         pass
-content_exp_canvas.bind("<Configure>", _on_canvas_config_exp)
-# Suporte a roda do mouse quando o cursor estiver sobre o conteúdo
-def _bind_mousewheel_exp(event):
-    content_exp_canvas.bind_all("<MouseWheel>", lambda e: content_exp_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-def _unbind_mousewheel_exp(event):
-    content_exp_canvas.unbind_all("<MouseWheel>")
-content_exp.bind("<Enter>", _bind_mousewheel_exp)
-content_exp.bind("<Leave>", _unbind_mousewheel_exp)
-
-# Seleção de Tier
-tier_label = tk.Label(
-    content_exp,
-    text="Selecione o Tier do Personagem",
-    bg=COR_FUNDO,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 10, "bold")
-)
-tier_label.pack(anchor=tk.W, pady=(0, 10))
-
-tier_selecionado = tk.StringVar(value=settings.get('tier', "Diamante"))
-# atualiza settings quando o tier muda
-def _on_tier_change(*args):
+
+def _descartar_tela(nome):
+    """Guarda o estado da tela e a destrói; ela é reconstruída quando for mostrada de novo."""
+    _salvar_estado_tela(nome)
+    grafo = grafos.pop(nome, None)
+    if grafo:
+        grafo.parar()
     try:
-        settings['tier'] = tier_selecionado.get()
-        schedule_save()
+        frames.pop(nome).destroy()
     except Exception:
         pass
+    ocultas_desde.pop(nome, None)
 
-try:
-    # use trace_add em vez de trace (compatível com Tcl 9+)
-    tier_selecionado.trace_add("write", _on_tier_change)
-except Exception:
-    pass
+def descartar_telas_ociosas():
+    """Destrói telas escondidas há mais de `tela_ociosa_segundos`; são reconstruídas ao reabrir."""
+    try:
+        limite = float(settings.get('tela_ociosa_segundos', 0) or 0)
+    except (TypeError, ValueError):
+        limite = 0
+    if limite > 0:
+        agora = time.monotonic()
+        descartou = False
+        for nome, desde in list(ocultas_desde.items()):
+            if agora - desde < limite or nome not in frames:
+                continue
+            _descartar_tela(nome)
+            descartou = True
+        if descartou:
+            schedule_save()
+    janela.after(INTERVALO_EVICCAO_MS, descartar_telas_ociosas)
 
-tier_frame = tk.Frame(content_exp, bg=COR_FUNDO)
-tier_frame.pack(fill=tk.X, pady=10)
+# ================= TELA MENU =================
+def construir_menu():
+    """Constrói os widgets do menu principal."""
+    menu = tk.Frame(container, bg=COR_FUNDO)
 
-cores_tier = {
-    "Diamante": "#06b6d4",
-    "Ouro": "#eab308",
-    "Prata": "#a78bfa",
-    "Bronze": "#f97316"
-}
+    # Título estilizado
+    titulo_frame = tk.Frame(menu, bg=COR_FUNDO)
+    titulo_frame.pack(pady=40)
 
-for tier in ["Diamante", "Ouro", "Prata", "Bronze"]:
-    btn_tier = tk.Button(
-        tier_frame,
-        text=f"⭐ {tier}",
-        command=lambda t=tier: tier_selecionado.set(t),
-        bg=cores_tier[tier],
-        fg="#000" if tier in ["Ouro", "Prata"] else "#fff",
-        font=("Segoe UI", 9, "bold"),
-        bd=0,
-        padx=12,
-        pady=8,
-        relief=tk.FLAT,
-        cursor="hand2",
-        activebackground=cores_tier[tier]
-    )
-    btn_tier.pack(side=tk.LEFT, padx=5)
-
-# Inputs
-input_frame = tk.Frame(content_exp, bg=COR_FUNDO)
-input_frame.pack(fill=tk.X, pady=15)
-
-tk.Label(
-    input_frame,
-    text="Nível Inicial",
-    bg=COR_FUNDO,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 9, "bold")
-).pack(anchor=tk.W)
-
-entry_nivel_ini = tk.Entry(
-    input_frame,
-    bg=COR_CARD,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 10),
-    bd=0,
-    relief=tk.FLAT,
-    insertbackground=COR_ACENTO
-)
-entry_nivel_ini.insert(0, "1")
-entry_nivel_ini.pack(fill=tk.X, pady=(5, 10), ipady=8)
-
-tk.Label(
-    input_frame,
-    text="Nível Final",
-    bg=COR_FUNDO,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 9, "bold")
-).pack(anchor=tk.W)
-
-entry_nivel_fin = tk.Entry(
-    input_frame,
-    bg=COR_CARD,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 10),
-    bd=0,
-    relief=tk.FLAT,
-    insertbackground=COR_ACENTO
-)
-entry_nivel_fin.insert(0, "70")
-entry_nivel_fin.pack(fill=tk.X, pady=(5, 10), ipady=8)
-
-# Canvas de resultado com poções
-resultado_frame = tk.Frame(content_exp, bg=COR_CARD, relief=tk.FLAT, height=140)
-resultado_frame.pack(fill=tk.BOTH, pady=10)
-
-pocoes_canvas = tk.Canvas(
-    resultado_frame,
-    bg=COR_CARD,
-    highlightthickness=0,
-    height=180
-)
-# Reposiciona dinamicamente quando o canvas muda de tamanho
-pocoes_canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-# Flag para saber se já desenhamos um resultado de XP (usada para redraw no resize)
-exp_drawn = False
+    tk.Label(
+        titulo_frame,
+        text="⚙️ GLA",
+        bg=COR_FUNDO,
+        fg=COR_ACENTO,
+        font=("Segoe UI", 24, "bold")
+    ).pack()
 
-def on_pocoes_resize(event):
-    # Redesenha o resultado de XP se já tivermos um cálculo anterior
-    global exp_drawn
-    if exp_drawn:
-        calcular_experiencia()
+    tk.Label(
+        titulo_frame,
+        text="TOOLS",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 18, "normal")
+    ).pack()
 
-pocoes_canvas.bind('<Configure>', on_pocoes_resize)
+    tk.Label(
+        titulo_frame,
+        text="Desenvolvido por Liniker",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 6, "normal")
+    ).pack()
+
+    # Cards de opções (sem scrollbar)
+    cards_frame = tk.Frame(menu, bg=COR_FUNDO)
+    cards_frame.pack(pady=30, padx=20, fill=tk.BOTH, expand=True)
+
+    # Crie os cards e organize em duas colunas (grid)
+    cards = []
+
+    card1 = tk.Frame(cards_frame, bg=COR_CARD, relief=tk.FLAT, bd=1)
+    cards.append((card1, {
+        'title': '📊 CALCULADORA DE EXPERIÊNCIA',
+        'desc': 'Calcule quantas poções você precisa\npara subir de nível por tier',
+        'btn_text': 'ABRIR CALCULADORA',
+        'btn_cmd': lambda: mostrar_tela('exp'),
+        'btn_bg': COR_ACENTO,
+        'btn_fg': '#000'
+    }))
+
+    card2 = tk.Frame(cards_frame, bg=COR_CARD, relief=tk.FLAT, bd=1)
+    cards.append((card2, {
+        'title': '🍲 CALCULADORA DE RECEITAS',
+        'desc': 'Calcule custo, lucro e ingredientes\npara suas receitas gourmet',
+        'btn_text': 'ABRIR CALCULADORA',
+        'btn_cmd': lambda: mostrar_tela('receitas'),
+        'btn_bg': COR_SECUNDARIA,
+        'btn_fg': COR_TEXTO
+    }))
+
+    card3 = tk.Frame(cards_frame, bg=COR_CARD, relief=tk.FLAT, bd=1)
+    cards.append((card3, {
+        'title': '💎 CALCULADORA DE CRISTAIS',
+        'desc': 'Calcule cristais necessários por equipamento\ncom opção de valor em berry',
+        'btn_text': 'ABRIR CALCULADORA',
+        'btn_cmd': lambda: mostrar_tela('cristais'),
+        'btn_bg': '#06b6d4',
+        'btn_fg': '#000'
+    }))
+
+    # Configure grid
+    cards_frame.grid_columnconfigure(0, weight=1)
+    cards_frame.grid_columnconfigure(1, weight=1)
+
+    for idx, (card, data) in enumerate(cards):
+        r = idx // 2
+        c = idx % 2
+        card.grid(row=r, column=c, sticky='nsew', padx=8, pady=8)
+        tk.Label(
+            card,
+            text=data['title'],
+            bg=COR_CARD,
+            fg=COR_ACENTO,
+            font=("Segoe UI", 11, "bold")
+        ).pack(pady=8, padx=10)
+        tk.Label(
+            card,
+            text=data['desc'],
+            bg=COR_CARD,
+            fg="#cbd5e1",
+            font=("Segoe UI", 9, "normal"),
+            justify=tk.CENTER
+        ).pack(pady=4, padx=10)
+        criar_botao_moderno(
+            card,
+            data['btn_text'],
+            data['btn_cmd'],
+            cor_fundo=data['btn_bg'],
+            cor_texto=data['btn_fg']
+        ).pack(pady=8)
+
+        # efeito hover: clareia levemente o card inteiro, mas NÃO altera botões/entradas para evitar flicker
+        def _on_card_enter(e, c=card):
+            try:
+                newbg = adjust_color(COR_CARD, 1.06)
+                c.config(bg=newbg)
+                for child in c.winfo_children():
+                    try:
+                        # evita alterar widgets interativos que possuem seu próprio estilo
+                        cls = child.winfo_class()
+                        if cls in ("Button", "TButton", "Entry", "Text", "Canvas", "Scrollbar", "Listbox", "Combobox"):
+                            continue
+                        child.config(bg=newbg)
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+        def _on_card_leave(e, c=card):
+            try:
+                c.config(bg=COR_CARD)
+                for child in c.winfo_children():
+                    try:
+                        cls = child.winfo_class()
+                        if cls in ("Button", "TButton", "Entry", "Text", "Canvas", "Scrollbar", "Listbox", "Combobox"):
+                            continue
+                        child.config(bg=COR_CARD)
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+        card.bind("<Enter>", _on_card_enter)
+        card.bind("<Leave>", _on_card_leave)
+
+    # Footer do menu com logo centralizado
+    footer_menu = tk.Frame(menu, bg=COR_FUNDO)
+    footer_menu.pack(side=tk.BOTTOM, fill=tk.X, pady=10)
+    # logo com altura levemente maior
+    logo_img = carregar_logo((160,80))
+    if logo_img:
+        logo_lbl = tk.Label(footer_menu, image=logo_img, bg=COR_FUNDO, cursor="hand2")
+        logo_lbl.image = logo_img
+        logo_lbl.pack()
+        ToolTip(logo_lbl, "Desenvolvido por Liniker")
+        # hover: aumenta o logo levemente
+        big_logo = carregar_logo((180,90))
+        def _logo_enter(e):
+            try:
+                if big_logo:
+                    logo_lbl.config(image=big_logo)
+                    logo_lbl.image = big_logo
+            except Exception:
+                pass
+        def _logo_leave(e):
+            try:
+                logo_lbl.config(image=logo_img)
+                logo_lbl.image = logo_img
+            except Exception:
+                pass
+        logo_lbl.bind("<Enter>", _logo_enter)
+        logo_lbl.bind("<Leave>", _logo_leave)
+    else:
+        lbl = tk.Label(footer_menu, text="GLA", bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 10, "bold"))
+        lbl.pack()
+        ToolTip(lbl, "Desenvolvido por Liniker")
+
+    return menu
+
+
+# ================= TELA EXPERIÊNCIA =================
+# Itens persistentes do canvas de poções (criados uma vez por construção da tela);
+# o resultado só troca textos/imagens e o redimensionamento só move com coords()
+itens_pocoes = {}
+TIPOS_POCAO = [("grande", "Grande"), ("média", "Média"), ("pequena", "Pequena")]
+QUADRO_MS = 16
+reposicionar_job = None
+
+def on_pocoes_resize(event):
+    # Reposiciona no máximo uma vez por quadro durante o arrasto (o plano não é recalculado)
+    global reposicionar_job
+    if reposicionar_job is None:
+        reposicionar_job = pocoes_canvas.after(QUADRO_MS, _reposicionar_agendado)
+
+def _reposicionar_agendado():
+    global reposicionar_job
+    reposicionar_job = None
+    try:
+        posicionar_pocoes()
+    except tk.TclError:
+        # tela descartada antes do quadro
+        pass
 
 imagens_pocoes = {}
 
@@ -651,483 +750,674 @@ def carregar_imagem_pocao(tipo):
         "pequena": "Smallexppot.png"
     }
     
-    caminho = resource_path(mapa_imagens[tipo])
-    try:
-        img = Image.open(caminho).resize((60, 60))
-        photo = ImageTk.PhotoImage(img)
+    photo = carregar_sprite(f"pocao/{tipo}", (60, 60), mapa_imagens[tipo])
+    if photo:
         imagens_pocoes[tipo] = photo
-        return photo
-    except Exception as e:
-        return None
+    return photo
 
 
-# Config XP
-XP_NECESSARIO = {
-    (1, 70): 5246500,
-    (1, 140): 43813000,
-    (70, 140): 38566500
-}
+def _plano_exp(nivel_ini, nivel_fin, tier):
+    """Plano de XP para os textos digitados, ou a mensagem de erro a exibir."""
+    try:
+        plano = plano_experiencia(int(nivel_ini), int(nivel_fin), tier)
+    except ValueError:
+        return "❌ Digite números válidos!"
+    if plano is None:
+        return "❌ Nível inválido!\n1 ≤ Inicial < Final ≤ 140"
+    return plano
 
-XP_POCAO_POR_TIER = {
-    "Diamante": {"grande": 50000, "média": 5000, "pequena": 500},
-    "Ouro": {"grande": 100000, "média": 10000, "pequena": 1000},
-    "Prata": {"grande": 200000, "média": 20000, "pequena": 2000},
-    "Bronze": {"grande": 300000, "média": 30000, "pequena": 3000}
-}
 
-TIERS = {
-    "Diamante": 0.5,
-    "Ouro": 1.0,
-    "Prata": 2.0,
-    "Bronze": 3.0
-}
+def criar_itens_pocoes():
+    """Cria (uma vez) os itens do resultado de XP; começam escondidos."""
+    itens_pocoes.clear()
+    itens_pocoes["titulo"] = pocoes_canvas.create_text(
+        0, 18, text="", fill=COR_ACENTO, font=("Segoe UI", 10, "bold"), tags=("resultado",)
+    )
+    for tipo, nome in TIPOS_POCAO:
+        itens_pocoes["img", tipo] = pocoes_canvas.create_image(0, 0, tags=("resultado",))
+        itens_pocoes["qtd", tipo] = pocoes_canvas.create_text(
+            0, 0, text="", fill=COR_ACENTO, font=("Segoe UI", 12, "bold"), tags=("resultado",)
+        )
+        itens_pocoes["nome", tipo] = pocoes_canvas.create_text(
+            0, 0, text=nome, fill="#cbd5e1", font=("Segoe UI", 8), tags=("resultado",)
+        )
+    itens_pocoes["xp"] = pocoes_canvas.create_text(
+        0, 160, text="", fill=COR_TEXTO, font=("Segoe UI", 9), tags=("resultado",)
+    )
+    itens_pocoes["erro"] = pocoes_canvas.create_text(
+        0, 0, text="", fill=COR_ACENTO, font=("Segoe UI", 11, "bold"), tags=("erro",)
+    )
+    pocoes_canvas.itemconfigure("resultado", state="hidden")
+    pocoes_canvas.itemconfigure("erro", state="hidden")
+
+
+def posicionar_pocoes():
+    """Move os itens para o tamanho atual do canvas (só coords, nada é recriado)"""
+    largura = pocoes_canvas.winfo_width()
+    w = max(200, largura)
+    h = max(120, pocoes_canvas.winfo_height())
+    # Poções — posições baseadas na largura do canvas (mais centralizadas)
+    x_positions = [w * 0.25, w * 0.5, w * 0.75]
+    y_image = h * 0.45
+    y_count = y_image + 45
+    y_label = y_count + 14
+
+    pocoes_canvas.coords(itens_pocoes["titulo"], largura // 2, 18)
+    for idx, (tipo, _) in enumerate(TIPOS_POCAO):
+        x = int(x_positions[idx])
+        pocoes_canvas.coords(itens_pocoes["img", tipo], x, int(y_image))
+        pocoes_canvas.coords(itens_pocoes["qtd", tipo], x, int(y_count))
+        pocoes_canvas.coords(itens_pocoes["nome", tipo], x, int(y_label))
+    pocoes_canvas.coords(itens_pocoes["xp"], largura // 2, 160)
+    pocoes_canvas.coords(itens_pocoes["erro"], largura // 2, pocoes_canvas.winfo_height() // 2)
+
+
+def desenhar_experiencia(plano):
+    """Atualiza o plano de XP (ou a mensagem de erro) nos itens já existentes do canvas"""
+    if isinstance(plano, str):
+        pocoes_canvas.itemconfigure(itens_pocoes["erro"], text=plano)
+        pocoes_canvas.itemconfigure("resultado", state="hidden")
+        pocoes_canvas.itemconfigure("erro", state="normal")
+        return plano
+
+    # Info header
+    texto_info = f"⭐ {plano['tier']} | Nível {plano['nivel_inicial']}→{plano['nivel_final']}"
+    pocoes_canvas.itemconfigure(itens_pocoes["titulo"], text=texto_info)
+    for tipo, _ in TIPOS_POCAO:
+        img = carregar_imagem_pocao(tipo)
+        pocoes_canvas.itemconfigure(itens_pocoes["img", tipo], image=img or "")
+        pocoes_canvas.itemconfigure(itens_pocoes["qtd", tipo], text=f"×{plano['pocoes'][tipo]}")
+    # XP Info
+    pocoes_canvas.itemconfigure(itens_pocoes["xp"], text=f"XP Total: {int(plano['xp']):,}")
+    pocoes_canvas.itemconfigure("erro", state="hidden")
+    pocoes_canvas.itemconfigure("resultado", state="normal")
+    return plano
+
+
+def _alcance_exp(nivel_ini, tier, *quantidades):
+    """Nível alcançado com as poções digitadas (campos vazios contam como 0)."""
+    pocoes = {}
+    for (tipo, _), texto in zip(TIPOS_POCAO, quantidades):
+        texto = str(texto).strip()
+        if texto:
+            try:
+                pocoes[tipo] = max(0, int(texto))
+            except ValueError:
+                return None
+    if not any(pocoes.values()):
+        return None
+    try:
+        return nivel_com_pocoes(int(nivel_ini), tier, pocoes)
+    except ValueError:
+        return None
 
-# Valores precisos por nível fornecidos pelo usuário
-xpPerLevel = [
-    0,
-    98, 101, 189, 402, 708, 1067, 1611, 2221, 2833, 3726,
-    4640, 5487, 6747, 7965, 9029, 10674, 12196, 13459, 15507, 17333,
-    18777, 21246, 23376, 24983, 27891, 30325, 32077, 35442, 38180, 40059,
-    43899, 46941, 48929, 53626, 56608, 58687, 63531, 67181, 69333, 74706,
-    78660, 80867, 86787, 91045, 93289, 99774, 104336, 106599, 113667, 118533,
-    120797, 128466, 133636, 135883, 144171, 149645, 151857, 160782, 166560, 168719,
-    178299, 184381, 186469, 196722, 203108, 205107, 216051, 222741, 224633, 236286,
-    243280, 245047, 257427, 264725, 266349, 279474, 287076, 288539, 302427, 310333,
-    311617, 326286, 334496, 335583, 351051, 359565, 360437, 376722, 385540, 386179,
-    403299, 412421, 412809, 430782, 440208, 440327, 459171, 468901, 468733, 488466,
-    498500, 498027, 518667, 529005, 528209, 549774, 560416, 559279, 581787, 592733,
-    591237, 614706, 625956, 624083, 648531, 660085, 657817, 683262, 695120, 692439,
-    718899, 731061, 727949, 755442, 767908, 764347, 792891, 805661, 801633, 831246,
-    844320, 839807, 870507, 883885, 878869, 910674, 924356, 918819, 951747,
-    0
-]
 
-xpTotalByLevel = [
-    0,
-    0, 98, 199, 388, 790, 1498, 2565, 4176, 6397, 9230,
-    12956, 17596, 23083, 29830, 37795, 46824, 57498, 69694, 83153, 98660,
-    115993, 134770, 156016, 179392, 204375, 232266, 262591, 294668, 330110, 368290,
-    408349, 452248, 499189, 548118, 601744, 658352, 717039, 780570, 847751, 917084,
-    991790, 1070450, 1151317, 1238104, 1329149, 1422438, 1522212, 1626548, 1733147, 1846814,
-    1965347, 2086144, 2214610, 2348246, 2484129, 2628300, 2777945, 2929802, 3090584, 3257144,
-    3425863, 3604162, 3788543, 3975012, 4171734, 4374842, 4579949, 4796000, 5018741, 5243374,
-    5479660, 5722940, 5967987, 6225414, 6490139, 6756488, 7035962, 7323038, 7611577, 7914004,
-    8224337, 8535954, 8862240, 9196736, 9532319, 9883370, 10242935, 10603372, 10980094, 11365634,
-    11751813, 12155112, 12567533, 12980342, 13411124, 13851332, 14291659, 14750830, 15219731, 15688464,
-    16176930, 16675430, 17173457, 17692124, 18221129, 18749338, 19299112, 19859528, 20418807, 21000594,
-    21593327, 22184564, 22799270, 23425226, 24049309, 24697840, 25357925, 26015742, 26699004, 27394124,
-    28086563, 28805462, 29536523, 30264472, 31019914, 31787822, 32552169, 33345060, 34150721, 34952354,
-    35783600, 36627920, 37467727, 38338234, 39222119, 40100988, 41011662, 41936018, 42854837, 43806584
-]
+def desenhar_alcance_exp(alcance):
+    if alcance is None:
+        texto = "Digite quantas poções você tem para ver até que nível elas levam"
+    elif alcance["nivel_final"] >= NIVEL_MAXIMO:
+        texto = f"🏁 Nível {alcance['nivel_final']} (máximo) — sobram {alcance['sobra']:,} XP"
+    else:
+        texto = (f"🏁 Nível {alcance['nivel_inicial']} → {alcance['nivel_final']} "
+                 f"(+{100 * alcance['fracao']:.1f}% do nível, faltam {alcance['xp_para_proximo']:,} XP)")
+    label_alcance.config(text=texto)
+    return alcance
 
 
-def calcular_xp_necessaria(nivel_inicial, nivel_final):
-    """Calcula XP necessária entre dois níveis usando as tabelas precisas.
+def calcular_experiencia():
+    """Calcula e exibe resultado"""
+    grafos["exp"].recalcular()
 
-    Usa os arrays `xpTotalByLevel` para retornar a diferença de XP acumulada
-    entre níveis inteiros (1..140). Retorna None para entradas inválidas.
-    """
-    if nivel_inicial < 1 or nivel_inicial >= nivel_final or nivel_final > 140:
-        return None
 
-    # Ambos níveis são inteiros e estão dentro da tabela — diferença direta
-    return xpTotalByLevel[nivel_final] - xpTotalByLevel[nivel_inicial]
+def construir_tela_exp():
+    """Constrói os widgets da calculadora de experiência a partir de `settings`."""
+    global tier_selecionado, entry_nivel_ini, entry_nivel_fin, pocoes_canvas, entries_pocoes, label_alcance
+    tela_exp = tk.Frame(container, bg=COR_FUNDO)
 
-def pocoes_para_xp(xp_necessaria, tier):
-    """Converte XP em poções"""
-    xp_valores = XP_POCAO_POR_TIER[tier]
-    xp_necessaria = int(xp_necessaria)
-    
-    grandes = xp_necessaria // xp_valores["grande"]
-    resto = xp_necessaria % xp_valores["grande"]
-    
-    medias = resto // xp_valores["média"]
-    resto = resto % xp_valores["média"]
-    
-    pequenas = resto // xp_valores["pequena"]
-    
-    return grandes, medias, pequenas
+    # Header
+    header_exp = tk.Frame(tela_exp, bg=COR_PRIMARIA, height=70)
+    header_exp.pack(fill=tk.X)
+
+    tk.Label(
+        header_exp,
+        text="📊 CALCULADORA DE EXPERIÊNCIA",
+        bg=COR_PRIMARIA,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 14, "bold")
+    ).pack(pady=15)
+
+    # Conteúdo — scrollable (mantém botões fixos no rodapé em monitores pequenos)
+    content_exp_container = tk.Frame(tela_exp, bg=COR_FUNDO)
+    content_exp_container.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+    content_exp_canvas = tk.Canvas(content_exp_container, bg=COR_FUNDO, highlightthickness=0)
+    content_exp_scroll = tk.Scrollbar(content_exp_container, orient=tk.VERTICAL, command=content_exp_canvas.yview)
+    content_exp_canvas.configure(yscrollcommand=content_exp_scroll.set)
+    content_exp_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=10)
+    content_exp_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+    content_exp = tk.Frame(content_exp_canvas, bg=COR_FUNDO)
+    content_exp_window = content_exp_canvas.create_window((0,0), window=content_exp, anchor='nw')
+    # Ajusta região de rolagem quando o frame interno muda
+    def _on_config_exp(event):
+        content_exp_canvas.configure(scrollregion=content_exp_canvas.bbox("all"))
+    content_exp.bind("<Configure>", _on_config_exp)
+    # Faz o frame interno preencher toda a largura do canvas (corrige desalinhamento)
+    def _on_canvas_config_exp(event):
+        try:
+            content_exp_canvas.itemconfig(content_exp_window, width=event.width)
+        except Exception:
+            pass
+    content_exp_canvas.bind("<Configure>", _on_canvas_config_exp)
+    # Suporte a roda do mouse quando o cursor estiver sobre o conteúdo
+    def _bind_mousewheel_exp(event):
+        content_exp_canvas.bind_all("<MouseWheel>", lambda e: content_exp_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+    def _unbind_mousewheel_exp(event):
+        content_exp_canvas.unbind_all("<MouseWheel>")
+    content_exp.bind("<Enter>", _bind_mousewheel_exp)
+    content_exp.bind("<Leave>", _unbind_mousewheel_exp)
+
+    # Seleção de Tier
+    tier_label = tk.Label(
+        content_exp,
+        text="Selecione o Tier do Personagem",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 10, "bold")
+    )
+    tier_label.pack(anchor=tk.W, pady=(0, 10))
+
+    tier_selecionado = tk.StringVar(value=settings.get('tier', "Diamante"))
+    # atualiza settings quando o tier muda
+    def _on_tier_change(*args):
+        try:
+            settings['tier'] = tier_selecionado.get()
+            schedule_save()
+        except Exception:
+            pass
 
-def calcular_experiencia():
-    """Calcula e exibe resultado"""
-    global exp_drawn
     try:
-        nivel_ini = int(entry_nivel_ini.get())
-        nivel_fin = int(entry_nivel_fin.get())
-        tier = tier_selecionado.get()
-        
-        if nivel_ini < 1 or nivel_fin > 140 or nivel_ini >= nivel_fin:
-            exp_drawn = False
-            pocoes_canvas.delete("all")
-            pocoes_canvas.create_text(
-                pocoes_canvas.winfo_width()//2,
-                pocoes_canvas.winfo_height()//2,
-                text="❌ Nível inválido!\n1 ≤ Inicial < Final ≤ 140",
-                fill=COR_ACENTO,
-                font=("Segoe UI", 11, "bold")
-            )
-            return
-        
-        xp_necessaria = calcular_xp_necessaria(nivel_ini, nivel_fin)
-        grandes, medias, pequenas = pocoes_para_xp(xp_necessaria, tier)
-        
-        pocoes_canvas.delete("all")
-        
-        # Info header
-        texto_info = f"⭐ {tier} | Nível {nivel_ini}→{nivel_fin}"
-        # Posiciona title dinamicamente (no topo)
-        pocoes_canvas.create_text(
-            pocoes_canvas.winfo_width()//2,
-            18,
-            text=texto_info,
-            fill=COR_ACENTO,
-            font=("Segoe UI", 10, "bold")
-        )
-        
-        # Poções — posições baseadas na largura do canvas (mais centralizadas)
-        img_grande = carregar_imagem_pocao("grande")
-        img_media = carregar_imagem_pocao("média")
-        img_pequena = carregar_imagem_pocao("pequena")
-        
-        w = max(200, pocoes_canvas.winfo_width())
-        h = max(120, pocoes_canvas.winfo_height())
-        x_positions = [w * 0.25, w * 0.5, w * 0.75]
-        y_image = h * 0.45
-        y_count = y_image + 45
-        y_label = y_count + 14
-        
-        pocoes_info = [
-            (img_grande, grandes, "Grande"),
-            (img_media, medias, "Média"),
-            (img_pequena, pequenas, "Pequena")
-        ]
-        
-        for idx, (img, qtd, nome) in enumerate(pocoes_info):
-            x = int(x_positions[idx])
-            
-            if img:
-                pocoes_canvas.create_image(x, int(y_image), image=img)
-            
-            pocoes_canvas.create_text(
-                x, int(y_count),
-                text=f"×{qtd}",
-                fill=COR_ACENTO,
-                font=("Segoe UI", 12, "bold")
-            )
-            
-            pocoes_canvas.create_text(
-                x, int(y_label),
-                text=nome,
-                fill="#cbd5e1",
-                font=("Segoe UI", 8)
-            )
-        
-        # XP Info
-        pocoes_canvas.create_text(
-            pocoes_canvas.winfo_width()//2,
-            160,
-            text=f"XP Total: {int(xp_necessaria):,}",
-            fill=COR_TEXTO,
-            font=("Segoe UI", 9)
-        )
-        # marca que existe um desenho de XP válido para redimensionamento
-        exp_drawn = True
-    except ValueError:
-        exp_drawn = False
-        pocoes_canvas.delete("all")
-        pocoes_canvas.create_text(
-            pocoes_canvas.winfo_width()//2,
-            pocoes_canvas.winfo_height()//2,
-            text="❌ Digite números válidos!",
-            fill=COR_ACENTO,
-            font=("Segoe UI", 11, "bold")
+        # use trace_add em vez de trace (compatível com Tcl 9+)
+        tier_selecionado.trace_add("write", _on_tier_change)
+    except Exception:
+        pass
+
+    tier_frame = tk.Frame(content_exp, bg=COR_FUNDO)
+    tier_frame.pack(fill=tk.X, pady=10)
+
+    cores_tier = {
+        "Diamante": "#06b6d4",
+        "Ouro": "#eab308",
+        "Prata": "#a78bfa",
+        "Bronze": "#f97316"
+    }
+
+    for tier in ["Diamante", "Ouro", "Prata", "Bronze"]:
+        btn_tier = tk.Button(
+            tier_frame,
+            text=f"⭐ {tier}",
+            command=lambda t=tier: tier_selecionado.set(t),
+            bg=cores_tier[tier],
+            fg="#000" if tier in ["Ouro", "Prata"] else "#fff",
+            font=("Segoe UI", 9, "bold"),
+            bd=0,
+            padx=12,
+            pady=8,
+            relief=tk.FLAT,
+            cursor="hand2",
+            activebackground=cores_tier[tier]
         )
+        btn_tier.pack(side=tk.LEFT, padx=5)
+
+    # Inputs
+    input_frame = tk.Frame(content_exp, bg=COR_FUNDO)
+    input_frame.pack(fill=tk.X, pady=15)
+
+    tk.Label(
+        input_frame,
+        text="Nível Inicial",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 9, "bold")
+    ).pack(anchor=tk.W)
+
+    entry_nivel_ini = tk.Entry(
+        input_frame,
+        bg=COR_CARD,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 10),
+        bd=0,
+        relief=tk.FLAT,
+        insertbackground=COR_ACENTO
+    )
+    entry_nivel_ini.insert(0, settings.get('exp_nivel_ini', "1"))
+    entry_nivel_ini.pack(fill=tk.X, pady=(5, 10), ipady=8)
+
+    tk.Label(
+        input_frame,
+        text="Nível Final",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 9, "bold")
+    ).pack(anchor=tk.W)
+
+    entry_nivel_fin = tk.Entry(
+        input_frame,
+        bg=COR_CARD,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 10),
+        bd=0,
+        relief=tk.FLAT,
+        insertbackground=COR_ACENTO
+    )
+    entry_nivel_fin.insert(0, settings.get('exp_nivel_fin', "70"))
+    entry_nivel_fin.pack(fill=tk.X, pady=(5, 10), ipady=8)
+
+    # Consulta inversa: até que nível as poções que o jogador já tem levam
+    tk.Label(
+        input_frame,
+        text="Poções que você tem (a partir do nível inicial)",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 9, "bold")
+    ).pack(anchor=tk.W)
+    pocoes_frame = tk.Frame(input_frame, bg=COR_FUNDO)
+    pocoes_frame.pack(fill=tk.X, pady=(5, 4))
+    entries_pocoes = {}
+    salvas = settings.get('exp_pocoes') or {}
+    for tipo, nome in TIPOS_POCAO:
+        tk.Label(pocoes_frame, text=nome, bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 8)).pack(side=tk.LEFT, padx=(0, 4))
+        e = tk.Entry(pocoes_frame, bg=COR_CARD, fg=COR_TEXTO, font=("Segoe UI", 9), bd=0, relief=tk.FLAT,
+                     width=8, justify='center', insertbackground=COR_ACENTO)
+        e.insert(0, str(salvas.get(tipo, "")))
+        e.pack(side=tk.LEFT, padx=(0, 12), ipady=4)
+        e.bind("<FocusOut>", lambda ev: (settings.update({'exp_pocoes': {t: x.get() for t, x in entries_pocoes.items()}}), schedule_save()))
+        entries_pocoes[tipo] = e
+    label_alcance = tk.Label(input_frame, text="", bg=COR_FUNDO, fg=COR_ACENTO, font=("Segoe UI", 9, "bold"), anchor="w")
+    label_alcance.pack(fill=tk.X)
+
+    # Canvas de resultado com poções
+    resultado_frame = tk.Frame(content_exp, bg=COR_CARD, relief=tk.FLAT, height=140)
+    resultado_frame.pack(fill=tk.BOTH, pady=10)
+
+    pocoes_canvas = tk.Canvas(
+        resultado_frame,
+        bg=COR_CARD,
+        highlightthickness=0,
+        height=180
+    )
+    # Reposiciona dinamicamente quando o canvas muda de tamanho
+    pocoes_canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    criar_itens_pocoes()
+    pocoes_canvas.bind('<Configure>', on_pocoes_resize)
+
+    # Recalcula enquanto o usuário digita: níveis/tier → plano → desenho
+    grafo = _novo_grafo("exp")
+    _ligar_entrada(grafo, "nivel_ini", entry_nivel_ini)
+    _ligar_entrada(grafo, "nivel_fin", entry_nivel_fin)
+    grafo.entrada("tier", tier_selecionado.get())
+    tier_selecionado.trace_add("write", lambda *args: grafo.definir("tier", tier_selecionado.get()))
+    grafo.no("plano", ("nivel_ini", "nivel_fin", "tier"), _plano_exp)
+    grafo.no("desenho", ("plano",), desenhar_experiencia)
+    for tipo, e in entries_pocoes.items():
+        _ligar_entrada(grafo, f"pocao_{tipo}", e)
+    grafo.no("alcance", ("nivel_ini", "tier") + tuple(f"pocao_{t}" for t, _ in TIPOS_POCAO), _alcance_exp)
+    grafo.no("desenho_alcance", ("alcance",), desenhar_alcance_exp)
+    grafo.iniciar()
+
+    # Botões experiência (fixos no rodapé)
+    btn_frame_exp = tk.Frame(tela_exp, bg=COR_FUNDO)
+    btn_frame_exp.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=12)
+
+    criar_botao_moderno(
+        btn_frame_exp,
+        "⚓ CALCULAR",
+        calcular_experiencia,
+        cor_fundo=COR_ACENTO,
+        cor_texto="#000"
+    ).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+
+    criar_botao_moderno(
+        btn_frame_exp,
+        "⬅ VOLTAR",
+        lambda: mostrar_tela("menu"),
+        cor_fundo=COR_SECUNDARIA
+    ).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+
+    return tela_exp
 
-# Botões experiência (fixos no rodapé)
-btn_frame_exp = tk.Frame(tela_exp, bg=COR_FUNDO)
-btn_frame_exp.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=12)
-
-criar_botao_moderno(
-    btn_frame_exp,
-    "⚓ CALCULAR",
-    calcular_experiencia,
-    cor_fundo=COR_ACENTO,
-    cor_texto="#000"
-).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
-
-criar_botao_moderno(
-    btn_frame_exp,
-    "⬅ VOLTAR",
-    lambda: mostrar_tela("menu"),
-    cor_fundo=COR_SECUNDARIA
-).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
 
 # ================= TELA RECEITAS =================
-tela_receitas = tk.Frame(container, bg=COR_FUNDO)
-tela_receitas.pack(fill=tk.BOTH, expand=True)
-frames["receitas"] = tela_receitas
-
-# Header
-header_receitas = tk.Frame(tela_receitas, bg=COR_SECUNDARIA, height=70)
-header_receitas.pack(fill=tk.X)
-
-tk.Label(
-    header_receitas,
-    text="🍲 CALCULADORA DE RECEITAS",
-    bg=COR_SECUNDARIA,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 14, "bold")
-).pack(pady=15)
-
-# Conteúdo — scrollable (mantém botões fixos no rodapé em monitores pequenos)
-content_receitas_container = tk.Frame(tela_receitas, bg=COR_FUNDO)
-content_receitas_container.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
-content_receitas_canvas = tk.Canvas(content_receitas_container, bg=COR_FUNDO, highlightthickness=0)
-content_receitas_scroll = tk.Scrollbar(content_receitas_container, orient=tk.VERTICAL, command=content_receitas_canvas.yview)
-content_receitas_canvas.configure(yscrollcommand=content_receitas_scroll.set)
-content_receitas_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=10)
-content_receitas_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-content_receitas = tk.Frame(content_receitas_canvas, bg=COR_FUNDO)
-content_receitas_window = content_receitas_canvas.create_window((0,0), window=content_receitas, anchor='nw')
-# Ajusta região de rolagem quando o frame interno muda
-def _on_config_receitas(event):
-    content_receitas_canvas.configure(scrollregion=content_receitas_canvas.bbox("all"))
-content_receitas.bind("<Configure>", _on_config_receitas)
-# Faz o frame interno preencher toda a largura do canvas (corrige desalinhamento)
-def _on_canvas_config_receitas(event):
+# Preços de ingredientes importados (precos.db ao lado do app), se existir
+loja_precos = None
+
+def _loja_precos():
+    global loja_precos
+    if loja_precos is None:
+        caminho = os.path.join(BASE_DIR, "precos.db")
+        if not os.path.exists(caminho):
+            return None
+        try:
+            from precos import LojaPrecos
+            loja_precos = LojaPrecos(caminho)
+        except Exception:
+            return None
+    else:
+        # aplica planilhas importadas por outro processo desde o último cálculo
+        try:
+            loja_precos.recarregar()
+        except Exception:
+            pass
+    return loja_precos
+
+def _custo_itens(receita, qtd):
+    """Custo dos ingredientes de `qtd` unidades (None se a quantidade for inválida)."""
     try:
-        content_receitas_canvas.itemconfig(content_receitas_window, width=event.width)
-    except Exception:
-        pass
-content_receitas_canvas.bind("<Configure>", _on_canvas_config_receitas)
-def _bind_mousewheel_receitas(event):
-    content_receitas_canvas.bind_all("<MouseWheel>", lambda e: content_receitas_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-def _unbind_mousewheel_receitas(event):
-    content_receitas_canvas.unbind_all("<MouseWheel>")
-content_receitas.bind("<Enter>", _bind_mousewheel_receitas)
-content_receitas.bind("<Leave>", _unbind_mousewheel_receitas)
-
-# Recipe selection
-tk.Label(
-    content_receitas,
-    text="Selecione a Receita",
-    bg=COR_FUNDO,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 10, "bold")
-).pack(anchor=tk.W, pady=(0, 5))
-
-combo = ttk.Combobox(
-    content_receitas,
-    values=list(receitas.keys()),
-    state="readonly",
-    font=("Segoe UI", 10)
-)
-# restaura valor salvo
-saved_receita = settings.get('receita')
-if saved_receita and saved_receita in receitas:
+        qtd = int(qtd)
+    except ValueError:
+        return None
+    loja = _loja_precos()
+    if loja:
+        return loja.custo_receita(receita, qtd, 0)
+    return custo_receita(receita, qtd, 0)
+
+
+def _resumo_receita(r, valor):
+    """Venda, taxa e lucro a partir do custo já calculado (não refaz os itens)."""
+    if r is None:
+        return None
     try:
-        combo.set(saved_receita)
-    except Exception:
-        combo.current(0)
-else:
-    combo.current(0)
-combo.pack(fill=tk.X, pady=(0, 15))
-# atualiza settings quando o usuário escolher outra receita
-combo.bind("<<ComboboxSelected>>", lambda e: (settings.update({'receita': combo.get()}), schedule_save()))
-# restauração de entradas e bindings será aplicada após criar os widgets `entry_qtd` e `entry_valor` para evitar NameError
-
-# Inputs
-tk.Label(
-    content_receitas,
-    text="Quantidade",
-    bg=COR_FUNDO,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 9, "bold")
-).pack(anchor=tk.W)
-
-entry_qtd = tk.Entry(
-    content_receitas,
-    bg=COR_CARD,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 10),
-    bd=0,
-    relief=tk.FLAT,
-    insertbackground=COR_ACENTO
-)
-entry_qtd.insert(0, "100")
-entry_qtd.pack(fill=tk.X, pady=(5, 10), ipady=8)
-
-tk.Label(
-    content_receitas,
-    text="Valor Unitário",
-    bg=COR_FUNDO,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 9, "bold")
-).pack(anchor=tk.W)
-
-entry_valor = tk.Entry(
-    content_receitas,
-    bg=COR_CARD,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 10),
-    bd=0,
-    relief=tk.FLAT,
-    insertbackground=COR_ACENTO
-)
-entry_valor.insert(0, "3200")
-entry_valor.pack(fill=tk.X, pady=(5, 15), ipady=8)
-
-# Restaura valores salvos para quantidade/valor e cria bindings para persistir alterações
-try:
-    entry_qtd.delete(0, tk.END); entry_qtd.insert(0, settings.get('receita_qtd', entry_qtd.get()))
-    entry_valor.delete(0, tk.END); entry_valor.insert(0, settings.get('receita_valor', entry_valor.get()))
-except Exception:
-    pass
-entry_qtd.bind("<FocusOut>", lambda e: (settings.update({'receita_qtd': entry_qtd.get()}), schedule_save()))
-entry_valor.bind("<FocusOut>", lambda e: (settings.update({'receita_valor': entry_valor.get()}), schedule_save()))
-
-# Resultado
-tk.Label(
-    content_receitas,
-    text="Resultado",
-    bg=COR_FUNDO,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 10, "bold")
-).pack(anchor=tk.W, pady=(0, 5))
-
-# Container para texto de resultado com scrollbar vertical ✅
-resultado_frame_text = tk.Frame(content_receitas, bg=COR_FUNDO)
-resultado_frame_text.pack(fill=tk.BOTH, pady=(0, 10), expand=True)
-
-resultado = tk.Text(
-    resultado_frame_text,
-    width=40,
-    bg=COR_CARD,
-    fg=COR_TEXTO,
-    font=("Segoe UI", 9),
-    bd=0,
-    relief=tk.FLAT,
-    state="disabled",
-    wrap="word"
-)
-scroll_result = tk.Scrollbar(resultado_frame_text, orient=tk.VERTICAL, command=resultado.yview)
-resultado['yscrollcommand'] = scroll_result.set
-resultado.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-scroll_result.pack(side=tk.RIGHT, fill=tk.Y)
+        valor = int(valor)
+    except ValueError:
+        return None
+    venda = r["quantidade"] * valor
+    taxa = venda * TAXA_VENDA
+    return {"custo": r["custo"], "venda": venda, "taxa": taxa, "lucro": venda - r["custo"] - taxa}
 
-def calcular_receita():
-    """Calcula receita"""
-    receita = combo.get()
-    qtd = int(entry_qtd.get())
-    valor = int(entry_valor.get())
 
-    texto = f"📋 {receita}\n"
+def desenhar_itens_receita(r):
+    """Reescreve a lista de ingredientes; o resumo fica num trecho marcado ("resumo")."""
+    resultado.config(state="normal")
+    resultado.delete("1.0", tk.END)
+    if r is None:
+        resultado.insert(tk.END, "❌ Digite números válidos!")
+        resultado.config(state="disabled")
+        return None
+
+    texto = f"📋 {r['receita']}\n"
     texto += f"{'─' * 32}\n\n"
-    custo = 0
 
-    for item, val in receitas[receita].items():
-        # Novo formato: val = (quantia_por_unidade, valor_unitario)
-        if isinstance(val, (tuple, list)) and len(val) >= 2:
-            quantia_por_unidade, valor_unitario = val
-            total_quantia = quantia_por_unidade * qtd
-            try:
-                custo_item = int(total_quantia * float(valor_unitario))
-            except Exception:
-                custo_item = 0
-            custo += custo_item
-            texto += f"• {item}: {total_quantia} unidades — Custo: {custo_item:,} berry (preço unitário: {valor_unitario})\n"
+    for it in r["itens"]:
+        if it["valor_unitario"] is not None:
+            texto += f"• {it['item']}: {it['quantidade']} unidades — Custo: {it['custo']:,} berry (preço unitário: {it['valor_unitario']})\n"
         else:
             # Compatibilidade com formato antigo (valor por unidade/porção)
-            try:
-                total = int(val) * qtd
-            except Exception:
-                total = 0
-            custo += total
-            texto += f"• {item}: {total}\n"
-
-    venda = qtd * valor
-    taxa = venda * 0.03
-    lucro = venda - custo - taxa
+            texto += f"• {it['item']}: {it['custo']}\n"
 
     texto += f"\n{'─' * 32}\n"
-    texto += f"Custo: {custo:,}\n"
-    texto += f"Venda: {venda:,}\n"
-    texto += f"Taxa (3%): {int(taxa):,}\n"
-    texto += f"💰 Lucro: {int(lucro):,}"
-
-    resultado.config(state="normal")
-    resultado.delete("1.0", tk.END)
     resultado.insert(tk.END, texto)
+    resultado.insert(tk.END, "…", "resumo")
     resultado.config(state="disabled")
+    return r
 
-# Botões receitas
-btn_frame_receitas = tk.Frame(tela_receitas, bg=COR_FUNDO)
-# fixa os botões no rodapé mesmo quando a janela crescer
-btn_frame_receitas.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=12)
-
-criar_botao_moderno(
-    btn_frame_receitas,
-    "⚓ CALCULAR",
-    calcular_receita,
-    cor_fundo=COR_ACENTO,
-    cor_texto="#000"
-).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
-
-criar_botao_moderno(
-    btn_frame_receitas,
-    "⬅ VOLTAR",
-    lambda: mostrar_tela("menu"),
-    cor_fundo=COR_SECUNDARIA
-).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
 
-# ================= TELA CRISTAIS ================= ✅
-tela_cristais = tk.Frame(container, bg=COR_FUNDO)
-tela_cristais.pack(fill=tk.BOTH, expand=True)
-frames["cristais"] = tela_cristais
-
-# Header
-header_cristais = tk.Frame(tela_cristais, bg="#0b74a6", height=70)
-header_cristais.pack(fill=tk.X)
-
-tk.Label(
-    header_cristais,
-    text="💎 CALCULADORA DE CRISTAIS",
-    bg="#0b74a6",
-    fg=COR_TEXTO,
-    font=("Segoe UI", 14, "bold")
-).pack(pady=15)
-
-# Conteúdo — scrollable (mantém botões fixos no rodapé em monitores pequenos)
-content_cristais_container = tk.Frame(tela_cristais, bg=COR_FUNDO)
-content_cristais_container.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
-content_cristais_canvas = tk.Canvas(content_cristais_container, bg=COR_FUNDO, highlightthickness=0)
-content_cristais_scroll = tk.Scrollbar(content_cristais_container, orient=tk.VERTICAL, command=content_cristais_canvas.yview)
-content_cristais_canvas.configure(yscrollcommand=content_cristais_scroll.set)
-content_cristais_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=10)
-content_cristais_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-content_cristais = tk.Frame(content_cristais_canvas, bg=COR_FUNDO)
-content_cristais_window = content_cristais_canvas.create_window((0,0), window=content_cristais, anchor='nw')
-# Ajusta região de rolagem quando o frame interno muda
-def _on_config_cristais(event):
-    content_cristais_canvas.configure(scrollregion=content_cristais_canvas.bbox("all"))
-content_cristais.bind("<Configure>", _on_config_cristais)
-# Faz o frame interno preencher toda a largura do canvas (corrige desalinhamento)
-def _on_canvas_config_cristais(event):
+def desenhar_resumo_receita(r, resumo):
+    """Atualiza só custo/venda/taxa/lucro (ex.: ao editar o valor unitário)."""
+    if resumo is None:
+        texto = "❌ Digite números válidos!"
+    else:
+        texto = f"Custo: {resumo['custo']:,}\n"
+        texto += f"Venda: {resumo['venda']:,}\n"
+        texto += f"Taxa (3%): {int(resumo['taxa']):,}\n"
+        texto += f"💰 Lucro: {int(resumo['lucro']):,}"
+    _substituir_trecho(resultado, "resumo", texto)
+    return resumo
+
+
+# Colunas do relatório do catálogo (mesmo modelo/tabela da tela de cristais)
+COLUNAS_RECEITAS = [
+    {"chave": "receita", "titulo": "Receita", "largura": 150},
+    {"chave": "custo_unitario", "titulo": "Custo/un.", "largura": 75, "alinhar": "e", "formato": "{:,.0f}"},
+    {"chave": "custo", "titulo": "Custo", "largura": 85, "alinhar": "e", "formato": "{:,}"},
+    {"chave": "venda", "titulo": "Venda", "largura": 85, "alinhar": "e", "formato": "{:,}"},
+    {"chave": "lucro", "titulo": "Lucro", "largura": 85, "alinhar": "e", "formato": "{:,.0f}"}
+]
+
+
+def _linhas_catalogo(qtd, valor):
+    """Uma linha por receita do catálogo para a quantidade e o valor de venda digitados."""
+    try:
+        qtd, valor = int(qtd), int(valor)
+    except ValueError:
+        return []
+    loja = _loja_precos()
+    linhas = []
+    for receita in receitas:
+        r = loja.custo_receita(receita, qtd, valor) if loja else custo_receita(receita, qtd, valor)
+        linhas.append({
+            "receita": receita,
+            "custo_unitario": r["custo"] / qtd if qtd else 0,
+            "custo": r["custo"],
+            "venda": r["venda"],
+            "lucro": r["lucro"]
+        })
+    return linhas
+
+
+def calcular_receita():
+    """Calcula receita"""
+    grafos["receitas"].recalcular()
+
+
+def construir_tela_receitas():
+    """Constrói os widgets da calculadora de receitas a partir de `settings`."""
+    global combo, entry_qtd, entry_valor, resultado
+    tela_receitas = tk.Frame(container, bg=COR_FUNDO)
+
+    # Header
+    header_receitas = tk.Frame(tela_receitas, bg=COR_SECUNDARIA, height=70)
+    header_receitas.pack(fill=tk.X)
+
+    tk.Label(
+        header_receitas,
+        text="🍲 CALCULADORA DE RECEITAS",
+        bg=COR_SECUNDARIA,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 14, "bold")
+    ).pack(pady=15)
+
+    # Conteúdo — scrollable (mantém botões fixos no rodapé em monitores pequenos)
+    content_receitas_container = tk.Frame(tela_receitas, bg=COR_FUNDO)
+    content_receitas_container.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+    content_receitas_canvas = tk.Canvas(content_receitas_container, bg=COR_FUNDO, highlightthickness=0)
+    content_receitas_scroll = tk.Scrollbar(content_receitas_container, orient=tk.VERTICAL, command=content_receitas_canvas.yview)
+    content_receitas_canvas.configure(yscrollcommand=content_receitas_scroll.set)
+    content_receitas_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=10)
+    content_receitas_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+    content_receitas = tk.Frame(content_receitas_canvas, bg=COR_FUNDO)
+    content_receitas_window = content_receitas_canvas.create_window((0,0), window=content_receitas, anchor='nw')
+    # Ajusta região de rolagem quando o frame interno muda
+    def _on_config_receitas(event):
+        content_receitas_canvas.configure(scrollregion=content_receitas_canvas.bbox("all"))
+    content_receitas.bind("<Configure>", _on_config_receitas)
+    # Faz o frame interno preencher toda a largura do canvas (corrige desalinhamento)
+    def _on_canvas_config_receitas(event):
+        try:
+            content_receitas_canvas.itemconfig(content_receitas_window, width=event.width)
+        except Exception:
+            pass
+    content_receitas_canvas.bind("<Configure>", _on_canvas_config_receitas)
+    def _bind_mousewheel_receitas(event):
+        content_receitas_canvas.bind_all("<MouseWheel>", lambda e: content_receitas_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+    def _unbind_mousewheel_receitas(event):
+        content_receitas_canvas.unbind_all("<MouseWheel>")
+    content_receitas.bind("<Enter>", _bind_mousewheel_receitas)
+    content_receitas.bind("<Leave>", _unbind_mousewheel_receitas)
+
+    # Recipe selection
+    tk.Label(
+        content_receitas,
+        text="Selecione a Receita",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 10, "bold")
+    ).pack(anchor=tk.W, pady=(0, 5))
+
+    combo = ttk.Combobox(
+        content_receitas,
+        values=list(receitas.keys()),
+        state="readonly",
+        font=("Segoe UI", 10)
+    )
+    # restaura valor salvo
+    saved_receita = settings.get('receita')
+    if saved_receita and saved_receita in receitas:
+        try:
+            combo.set(saved_receita)
+        except Exception:
+            combo.current(0)
+    else:
+        combo.current(0)
+    combo.pack(fill=tk.X, pady=(0, 15))
+    # atualiza settings quando o usuário escolher outra receita
+    combo.bind("<<ComboboxSelected>>", lambda e: (settings.update({'receita': combo.get()}), schedule_save()))
+    # restauração de entradas e bindings será aplicada após criar os widgets `entry_qtd` e `entry_valor` para evitar NameError
+
+    # Inputs
+    tk.Label(
+        content_receitas,
+        text="Quantidade",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 9, "bold")
+    ).pack(anchor=tk.W)
+
+    entry_qtd = tk.Entry(
+        content_receitas,
+        bg=COR_CARD,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 10),
+        bd=0,
+        relief=tk.FLAT,
+        insertbackground=COR_ACENTO
+    )
+    entry_qtd.insert(0, "100")
+    entry_qtd.pack(fill=tk.X, pady=(5, 10), ipady=8)
+
+    tk.Label(
+        content_receitas,
+        text="Valor Unitário",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 9, "bold")
+    ).pack(anchor=tk.W)
+
+    entry_valor = tk.Entry(
+        content_receitas,
+        bg=COR_CARD,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 10),
+        bd=0,
+        relief=tk.FLAT,
+        insertbackground=COR_ACENTO
+    )
+    entry_valor.insert(0, "3200")
+    entry_valor.pack(fill=tk.X, pady=(5, 15), ipady=8)
+
+    # Restaura valores salvos para quantidade/valor e cria bindings para persistir alterações
     try:
-        content_cristais_canvas.itemconfig(content_cristais_window, width=event.width)
+        entry_qtd.delete(0, tk.END); entry_qtd.insert(0, settings.get('receita_qtd', entry_qtd.get()))
+        entry_valor.delete(0, tk.END); entry_valor.insert(0, settings.get('receita_valor', entry_valor.get()))
     except Exception:
         pass
-content_cristais_canvas.bind("<Configure>", _on_canvas_config_cristais)
-# Suporte a roda do mouse quando o cursor estiver sobre o conteúdo
-def _bind_mousewheel_cristais(event):
-    content_cristais_canvas.bind_all("<MouseWheel>", lambda e: content_cristais_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-def _unbind_mousewheel_cristais(event):
-    content_cristais_canvas.unbind_all("<MouseWheel>")
-content_cristais.bind("<Enter>", _bind_mousewheel_cristais)
-content_cristais.bind("<Leave>", _unbind_mousewheel_cristais)
+    entry_qtd.bind("<FocusOut>", lambda e: (settings.update({'receita_qtd': entry_qtd.get()}), schedule_save()))
+    entry_valor.bind("<FocusOut>", lambda e: (settings.update({'receita_valor': entry_valor.get()}), schedule_save()))
+
+    # Resultado
+    tk.Label(
+        content_receitas,
+        text="Resultado",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 10, "bold")
+    ).pack(anchor=tk.W, pady=(0, 5))
+
+    # Container para texto de resultado com scrollbar vertical ✅
+    resultado_frame_text = tk.Frame(content_receitas, bg=COR_FUNDO)
+    resultado_frame_text.pack(fill=tk.BOTH, pady=(0, 10), expand=True)
+
+    resultado = tk.Text(
+        resultado_frame_text,
+        width=40,
+        bg=COR_CARD,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 9),
+        bd=0,
+        relief=tk.FLAT,
+        state="disabled",
+        wrap="word"
+    )
+    scroll_result = tk.Scrollbar(resultado_frame_text, orient=tk.VERTICAL, command=resultado.yview)
+    resultado['yscrollcommand'] = scroll_result.set
+    resultado.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scroll_result.pack(side=tk.RIGHT, fill=tk.Y)
+
+    # Relatório do catálogo (tabela virtualizada; clique na linha escolhe a receita)
+    tk.Label(
+        content_receitas,
+        text="Catálogo (mesma quantidade e valor)",
+        bg=COR_FUNDO,
+        fg=COR_TEXTO,
+        font=("Segoe UI", 10, "bold")
+    ).pack(anchor=tk.W, pady=(0, 5))
+
+    def _escolher_receita(linha):
+        if linha["receita"] != combo.get():
+            combo.set(linha["receita"])
+            combo.event_generate("<<ComboboxSelected>>")
+    tabela_receitas = TabelaVirtual(content_receitas, ModeloTabela(COLUNAS_RECEITAS), bg=COR_CARD,
+                                    bg_cabecalho=COR_FUNDO, fg=COR_TEXTO, fg_cabecalho=COR_ACENTO,
+                                    comando=_escolher_receita, height=200)
+    tabela_receitas.pack(fill=tk.X, pady=(0, 10))
+
+    # Recalcula enquanto o usuário digita: a quantidade refaz os itens,
+    # o valor unitário só o resumo
+    grafo = _novo_grafo("receitas")
+    _ligar_entrada(grafo, "receita", combo, ("<<ComboboxSelected>>",))
+    _ligar_entrada(grafo, "qtd", entry_qtd)
+    _ligar_entrada(grafo, "valor", entry_valor)
+    grafo.no("custo", ("receita", "qtd"), _custo_itens)
+    grafo.no("resumo", ("custo", "valor"), _resumo_receita)
+    grafo.no("itens", ("custo",), desenhar_itens_receita)
+    grafo.no("linhas_resumo", ("itens", "resumo"), desenhar_resumo_receita)
+    grafo.no("catalogo", ("qtd", "valor"), _linhas_catalogo)
+    grafo.no("tabela", ("catalogo",), tabela_receitas.definir_linhas)
+    grafo.iniciar()
+
+    # Botões receitas
+    btn_frame_receitas = tk.Frame(tela_receitas, bg=COR_FUNDO)
+    # fixa os botões no rodapé mesmo quando a janela crescer
+    btn_frame_receitas.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=12)
+
+    criar_botao_moderno(
+        btn_frame_receitas,
+        "⚓ CALCULAR",
+        calcular_receita,
+        cor_fundo=COR_ACENTO,
+        cor_texto="#000"
+    ).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+
+    criar_botao_moderno(
+        btn_frame_receitas,
+        "⬅ VOLTAR",
+        lambda: mostrar_tela("menu"),
+        cor_fundo=COR_SECUNDARIA
+    ).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
 
+    return tela_receitas
+
+
+# ================= TELA CRISTAIS ================= ✅
 # Dados e imagens
-cristais_tipos = ["Cristais do Céu", "Cristais do Sábio", "Cristais Carmesim", "Cristais Radiante"]
 mapa_imagens_cristais = {
     "Cristais do Céu": "cristal do ceu.png",
     "Cristais do Sábio": "cristal do sabio.png",
@@ -1135,99 +1425,19 @@ mapa_imagens_cristais = {
     "Cristais Radiante": "cristal radiante.png"
 }
 
-MAX_CRISTAIS = {
-    "Cristais do Céu": {"Emblema":36, "Capacete":36, "Calça":36, "Peito":72, "Arma":72, "Colar":72, "Total":324},
-    "Cristais do Sábio": {"Emblema":60, "Capacete":60, "Calça":60, "Peito":120, "Arma":120, "Colar":120, "Total":540},
-    "Cristais Carmesim": {"Emblema":102, "Capacete":102, "Calça":102, "Peito":204, "Arma":204, "Colar":204, "Total":918},
-    "Cristais Radiante": {"Emblema":196, "Capacete":196, "Calça":196, "Peito":392, "Arma":392, "Colar":392, "Total":1764}
-}
-
-# Top controls — escolha de equipamento e nível alvo
-controls_frame = tk.Frame(content_cristais, bg=COR_FUNDO)
-controls_frame.grid(row=0, column=0, sticky='ew')
-content_cristais.grid_rowconfigure(1, weight=1)
-content_cristais.grid_columnconfigure(0, weight=1)
-
-slots = ["Emblema", "Capacete", "Calça", "Peito", "Arma", "Colar"]
-
-# Equipamento (escolha única)
-tk.Label(controls_frame, text="Equipamento", bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 9, "bold")).grid(row=0, column=0, sticky="w")
-combo_equip = ttk.Combobox(controls_frame, values=slots, state="readonly", font=("Segoe UI", 10))
-# restaura valor salvo
-if settings.get('cristal_equip') in slots:
-    combo_equip.set(settings.get('cristal_equip'))
-else:
-    combo_equip.current(0)
-combo_equip.grid(row=1, column=0, sticky="we", pady=(5,8))
-combo_equip.bind("<<ComboboxSelected>>", lambda e: (settings.update({'cristal_equip': combo_equip.get()}), schedule_save()))
-
-# Nível atual (0..16)
-tk.Label(controls_frame, text="Nível atual", bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 9, "bold")).grid(row=0, column=1, sticky="w", padx=(15,0))
-combo_level = ttk.Combobox(controls_frame, values=[str(i) for i in range(0,17)], state="readonly", font=("Segoe UI", 10))
-# restaura valor salvo
-if settings.get('cristal_level') and settings.get('cristal_level') in [str(i) for i in range(0,17)]:
-    try:
-        combo_level.set(settings.get('cristal_level'))
-    except Exception:
-        combo_level.current(0)
-else:
-    combo_level.current(0)
-combo_level.grid(row=1, column=1, sticky="we", pady=(5,8), padx=(15,0))
-combo_level.bind("<<ComboboxSelected>>", lambda e: (settings.update({'cristal_level': combo_level.get()}), schedule_save()))
-
-# Valor por cristal por tipo (Céu, Sábio, Carmesim, Radiante)
-tk.Label(controls_frame, text="Valor por Cristal (berry)", bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 9, "bold")).grid(row=0, column=2, sticky="w", padx=(15,0))
-valor_frame = tk.Frame(controls_frame, bg=COR_FUNDO)
-valor_frame.grid(row=1, column=2, sticky="we", pady=(5,8), padx=(15,0))
-
-# labels e entries compactos
-labels = ["Céu", "Sábio", "Carmesim", "Radiante"]
-crystal_keys = ["Cristais do Céu", "Cristais do Sábio", "Cristais Carmesim", "Cristais Radiante"]
-valor_entries = {}
-for i, (lbl, key) in enumerate(zip(labels, crystal_keys)):
-    tk.Label(valor_frame, text=lbl, bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 8)).grid(row=0, column=i, padx=4)
-    e = tk.Entry(valor_frame, bg=COR_CARD, fg=COR_TEXTO, font=("Segoe UI", 9), bd=0, relief=tk.FLAT, width=8, justify='center')
-    # restaura valor salvo para cada tipo de cristal
-    saved_vals = settings.get('cristal_values', {})
-    e.insert(0, str(saved_vals.get(key, "0")))
-    e.grid(row=1, column=i, padx=4)
-    valor_entries[key] = e
-    # atualiza settings ao perder foco
-    e.bind("<FocusOut>", lambda ev, k=key: (settings.setdefault('cristal_values', {}).__setitem__(k, valor_entries[k].get()), schedule_save()))
-
-# Ajuste de colunas
-controls_frame.grid_columnconfigure(0, weight=1)
-controls_frame.grid_columnconfigure(1, weight=0)
-controls_frame.grid_columnconfigure(2, weight=0)
-
-# Resultado (com scrollbar)
-resultado_cristais_frame = tk.Frame(content_cristais, bg=COR_FUNDO)
-resultado_cristais_frame.grid(row=1, column=0, sticky='nsew', pady=(10,5))
-
-resultado_cristais = tk.Text(resultado_cristais_frame, bg=COR_CARD, fg=COR_TEXTO, font=("Segoe UI", 10), bd=0, relief=tk.FLAT, state="disabled", wrap="word")
-scroll_cristais = tk.Scrollbar(resultado_cristais_frame, orient=tk.VERTICAL, command=resultado_cristais.yview)
-resultado_cristais['yscrollcommand'] = scroll_cristais.set
-resultado_cristais.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-scroll_cristais.pack(side=tk.RIGHT, fill=tk.Y)
-
-# Botões na parte inferior (calcular/voltar) — fixados no rodapé da tela
-footer_cristais = tk.Frame(tela_cristais, bg=COR_FUNDO)
-footer_cristais.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=12)
-
-criar_botao_moderno(
-    footer_cristais,
-    "⚓ CALCULAR",
-    lambda: calcular_cristais(),
-    cor_fundo=COR_ACENTO,
-    cor_texto="#000"
-).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
-
-criar_botao_moderno(
-    footer_cristais,
-    "⬅ VOLTAR",
-    lambda: mostrar_tela("menu"),
-    cor_fundo=COR_SECUNDARIA
-).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+TIPOS_CRISTAL = ("Cristais do Céu", "Cristais do Sábio", "Cristais Carmesim", "Cristais Radiante")
+
+# Colunas da tabela de cristais (modelo compartilhado com a tabela de receitas)
+COLUNAS_CRISTAIS = [
+    {"chave": "slot", "titulo": "Equipamento", "largura": 110},
+    {"chave": "nivel", "titulo": "Nível", "largura": 55, "alinhar": "e", "formato": "+{}"},
+    {"chave": "tipo", "titulo": "Cristal", "largura": 130},
+    {"chave": "media", "titulo": "Média", "largura": 60, "alinhar": "e", "formato": "{:.1f}"},
+    {"chave": "minimo", "titulo": "Mín.", "largura": 50, "alinhar": "e"},
+    {"chave": "maximo", "titulo": "Máx.", "largura": 50, "alinhar": "e"},
+    {"chave": "custo_minimo", "titulo": "Custo mín.", "largura": 95, "alinhar": "e", "formato": "{:,}"},
+    {"chave": "custo_maximo", "titulo": "Custo máx.", "largura": 95, "alinhar": "e", "formato": "{:,}"}
+]
 
 # Imagens cache
 imagens_cristais = {}
@@ -1238,175 +1448,63 @@ def carregar_gema(tamanho=(20,20)):
     global imagem_gema
     if imagem_gema:
         return imagem_gema
-    caminho = resource_path("gema.png")
-    try:
-        img = Image.open(caminho).resize(tamanho)
-        imagem_gema = ImageTk.PhotoImage(img)
-        return imagem_gema
-    except Exception:
-        return None
+    imagem_gema = carregar_sprite("gema", tamanho, "gema.png")
+    return imagem_gema
 
 def carregar_imagem_cristal(nome, tamanho=(36,36)):
     if nome in imagens_cristais:
         return imagens_cristais[nome]
-    caminho = resource_path(mapa_imagens_cristais.get(nome, ""))
-    try:
-        img = Image.open(caminho).resize(tamanho)
-        photo = ImageTk.PhotoImage(img)
+    photo = carregar_sprite(f"cristal/{nome}", tamanho, mapa_imagens_cristais.get(nome, ""))
+    if photo:
         imagens_cristais[nome] = photo
-        return photo
-    except Exception:
-        return None
+    return photo
 
 def carregar_imagem_equip(nome, tamanho=(28,28)):
     if nome in imagens_equip:
         return imagens_equip[nome]
     # map to files (same names as found)
-    arquivos = {"Emblema":"emblema.png","Capacete":"capacete.png","Calça":"calça.png","Peito":"peito.png","Arma":"arma.png","Colar":"colar.png"}
-    caminho = resource_path(arquivos.get(nome, ""))
-    try:
-        img = Image.open(caminho).resize(tamanho)
-        photo = ImageTk.PhotoImage(img)
+    arquivos = {"Emblema":"emblema.png","Capacete":"capacete.png","Calça":"calça.png","Peito":"peito.png","Arma":"Arma.png","Colar":"colar.png"}
+    photo = carregar_sprite(f"equip/{nome}", tamanho, arquivos.get(nome, ""))
+    if photo:
         imagens_equip[nome] = photo
-        return photo
-    except Exception:
-        return None
-
-# Lógica de cálculo
-crystals_per_up = {"Emblema":2, "Capacete":2, "Calça":2, "Peito":4, "Arma":4, "Colar":4}
-
-# Tabela de chance e tentativa garantida (pity)
-SUCCESS_TABLE = {
-    1: (0.35, 3),
-    2: (0.30, 4),
-    3: (0.25, 5),
-    4: (0.20, 6),
-    5: (0.22, 5),
-    6: (0.18, 6),
-    7: (0.14, 8),
-    8: (0.10, 11),
-    9: (0.10, 11),
-    10: (0.09, 12),
-    11: (0.08, 13),
-    12: (0.07, 15),
-    13: (0.06, 17),
-    14: (0.05, 21),
-    15: (0.04, 26),
-    16: (0.03, 34)
-}
-
-# Tabela de custo de transferência (gemas) por nível alvo (baseada na imagem)
-# As chaves representam o nível teto da faixa (4, 8, 12, 16)
-TRANSFER_COSTS = {
-    4: {
-        "Capacete": 1,
-        "Peito": 2,
-        "Calça": 1,
-        "Emblema": 1,
-        "Arma": 2,
-        "Colar": 2
-    },
-    8: {
-        "Capacete": 3,
-        "Peito": 5,
-        "Calça": 3,
-        "Emblema": 3,
-        "Arma": 5,
-        "Colar": 5
-    },
-    12: {
-        "Capacete": 6,
-        "Peito": 10,
-        "Calça": 6,
-        "Emblema": 6,
-        "Arma": 10,
-        "Colar": 10
-    },
-    16: {
-        "Capacete": 10,
-        "Peito": 15,
-        "Calça": 10,
-        "Emblema": 10,
-        "Arma": 15,
-        "Colar": 15
-    }
-}
-
-def get_transfer_cost(slot, level):
-    """Retorna o custo em gemas para transferir boost do equipamento dado seu nível atual."""
-    if level <= 0:
-        return 0
-    if level <= 4:
-        key = 4
-    elif level <= 8:
-        key = 8
-    elif level <= 12:
-        key = 12
-    else:
-        key = 16
-    return TRANSFER_COSTS.get(key, {}).get(slot, 0)
-
-# Mapeamento de níveis por cristal
-TIERS_LEVELS = {
-    "Cristais do Céu": range(1, 5),
-    "Cristais do Sábio": range(5, 9),
-    "Cristais Carmesim": range(9, 13),
-    "Cristais Radiante": range(13, 17)
-}
-
-def expected_attempts(p, guarantee):
-    """Calcula o número esperado de tentativas até o sucesso com pity garantido na tentativa 'guarantee'."""
-    q = 1 - p
-    E = 0.0
-    # tentativa 1..guarantee-1 com prob p a cada tentativa
-    for k in range(1, guarantee):
-        E += k * (q ** (k - 1)) * p
-    # se falhar até guarantee-1, a guarantee faz com que a tentativa guarantee resulte em sucesso
-    E += guarantee * (q ** (guarantee - 1))
-    return E
-
-def expected_crystals_for_level(slot, level):
-    if level < 1:
-        return 0
-    if level > 16:
-        # limite na tabela
-        level = 16
-    p, guarantee = SUCCESS_TABLE[level]
-    atts = expected_attempts(p, guarantee)
-    return atts * crystals_per_up[slot]
-
-
-
-
-def get_crystal_type_for_level(lvl):
-    if 1 <= lvl <= 4:
-        return "Cristais do Céu"
-    if 5 <= lvl <= 8:
-        return "Cristais do Sábio"
-    if 9 <= lvl <= 12:
-        return "Cristais Carmesim"
-    return "Cristais Radiante"
+    return photo
 
-
-def calcular_cristais():
-    # Leitura de valores
+def _plano_base_cristais(slot, nivel):
+    """Plano do slot sem preços (os custos por nível são nós separados)."""
     try:
-        current = int(combo_level.get())
+        current = int(nivel)
     except Exception:
         current = 1
     current = max(1, min(current, 16))
-
-    slot = combo_equip.get()
     if slot not in crystals_per_up:
-        resultado_cristais.config(state="normal")
-        resultado_cristais.delete("1.0", tk.END)
-        resultado_cristais.insert(tk.END, "❌ Selecione um equipamento válido!")
-        resultado_cristais.config(state="disabled")
-        return
+        return None
+    return plano_cristais(slot, current)
+
+
+def _preco_nivel(lvl):
+    """Nó do custo do nível `lvl`: depende só do plano e do preço do tipo do nível."""
+    def preco(plano, valor):
+        if plano is None or lvl <= plano["nivel_atual"]:
+            return None
+        n = plano["niveis"][lvl - plano["nivel_atual"] - 1]
+        try:
+            valor = int(valor)
+        except Exception:
+            valor = 0
+        return dict(n, slot=plano["slot"], valor=valor, custo_minimo=n["minimo"] * valor, custo_maximo=n["maximo"] * valor)
+    return preco
+
 
+def desenhar_estrutura_cristais(plano):
+    """Reescreve o resultado de cristais com um trecho marcado por nível e pelo total."""
     resultado_cristais.config(state="normal")
     resultado_cristais.delete("1.0", tk.END)
+    if plano is None:
+        resultado_cristais.insert(tk.END, "❌ Selecione um equipamento válido!")
+        resultado_cristais.config(state="disabled")
+        return None
 
+    slot, current = plano["slot"], plano["nivel_atual"]
     # Cabeçalho
     imge = carregar_imagem_equip(slot)
     if imge:
@@ -1415,54 +1513,346 @@ def calcular_cristais():
     resultado_cristais.insert(tk.END, f"{slot} — Nível atual +{current}\n")
 
     # Custo de transferência (gema)
-    custo_gemas = get_transfer_cost(slot, current)
     gem = carregar_gema((18,18))
     if gem:
         resultado_cristais.image_create(tk.END, image=gem)
         resultado_cristais.insert(tk.END, " ")
-    resultado_cristais.insert(tk.END, f"Custo para transferir o boost: {custo_gemas} gemas\n\n")
+    resultado_cristais.insert(tk.END, f"Custo para transferir o boost: {plano['gemas_transferencia']} gemas\n")
 
-    total_avg = 0.0
-    total_max = 0
-    total_cost_low = 0
-    total_cost_high = 0
+    # Custo por nível: na tabela abaixo (nós "preco<N>" → "linhas" → "tabela")
+    resultado_cristais.insert(tk.END, "…", "total")
+    resultado_cristais.insert(tk.END, "\n")
+    # Sugestão de compras para o orçamento (nó "alocacao" → "linha_orcamento")
+    resultado_cristais.insert(tk.END, "…\n", "orcamento")
+    # Distribuição exata: quantos cristais bastam em 50/90/99% dos casos
+    dist = distribuicao_cristais(slot, current)
+    p50, p90, p99 = dist.percentil(0.5), dist.percentil(0.9), dist.percentil(0.99)
+    resultado_cristais.insert(tk.END, f"90% das vezes você precisa de ≤ {p90:,} cristais (P50: {p50:,} | P99: {p99:,} | desvio: {dist.desvio_padrao():,.1f})\n")
+    resultado_cristais.insert(tk.END, "\nNota: médias calculadas usando chance por nível e pity garantido.\n")
+    resultado_cristais.config(state="disabled")
+    return plano
 
-    # Para cada nível alvo acima do atual até 16
-    for lvl in range(current + 1, 17):
-        p, guarantee = SUCCESS_TABLE[lvl]
-        avg = expected_crystals_for_level(slot, lvl)
-        max_cr = crystals_per_up[slot] * guarantee
 
-        # Formato X a Y — X: piso da média, Y: máximo garantido
-        low = int(math.floor(avg))
-        high = int(max_cr)
+def _linhas_cristais(todos, nivel, valores, precos):
+    """Linhas da tabela: os níveis do equipamento escolhido ou de todos os equipamentos."""
+    if not todos:
+        return [n for n in precos if n is not None]
+    try:
+        current = max(1, min(int(nivel), 16))
+    except Exception:
+        current = 1
+    linhas = []
+    for slot in crystals_per_up:
+        linhas.extend(dict(n, slot=slot) for n in plano_cristais(slot, current, valores)["niveis"])
+    return linhas
 
-        crystal_type = get_crystal_type_for_level(lvl)
-        # obtém valor específico para o tipo de cristal
+
+def _valores_cristais(*textos):
+    """{tipo: preço} a partir dos campos de valor (inválido conta como 0)."""
+    valores = {}
+    for tipo, texto in zip(TIPOS_CRISTAL, textos):
         try:
-            valor_level = int(valor_entries[crystal_type].get())
+            valores[tipo] = int(texto)
         except Exception:
-            valor_level = 0
+            valores[tipo] = 0
+    return valores
 
-        cost_low = low * valor_level
-        cost_high = high * valor_level
 
-        resultado_cristais.insert(tk.END, f"Média para o nível +{lvl}: {low} a {high} cristais (cristal equivalente ao nível: {crystal_type}) → {cost_low:,} a {cost_high:,} berry\n")
+def _totais_cristais(plano, *niveis):
+    if plano is None:
+        return None
+    niveis = [n for n in niveis if n is not None]
+    return {
+        "media": plano["total_media"],
+        "maximo": plano["total_maximo"],
+        "custo_minimo": sum(n["custo_minimo"] for n in niveis),
+        "custo_maximo": sum(n["custo_maximo"] for n in niveis)
+    }
 
-        total_avg += avg
-        total_max += max_cr
-        total_cost_low += cost_low
-        total_cost_high += cost_high
 
-    resultado_cristais.insert(tk.END, "\n")
-    resultado_cristais.insert(tk.END, f"Total (Média somada): {int(math.floor(total_avg)):,} a {int(total_max):,} cristais → {int(total_cost_low):,} a {int(total_cost_high):,} berry\n")
-    resultado_cristais.insert(tk.END, "\nNota: médias calculadas usando chance por nível e pity garantido.\n")
-    resultado_cristais.config(state="disabled")
+def desenhar_total_cristais(estrutura, t):
+    if t is not None:
+        _substituir_trecho(resultado_cristais, "total", f"Total (Média somada): {int(t['media']):,} a {int(t['maximo']):,} cristais → {int(t['custo_minimo']):,} a {int(t['custo_maximo']):,} berry")
+    return t
 
 
+def _alocacao_cristais(orcamento, nivel, valores):
+    """Upgrades sugeridos para o orçamento, com todos os equipamentos no nível atual."""
+    try:
+        orcamento = float(str(orcamento).replace(".", "").replace(",", "").strip())
+    except ValueError:
+        return None
+    try:
+        current = max(0, min(int(nivel), NIVEL_MAXIMO_CRISTAL))
+    except Exception:
+        current = 0
+    try:
+        return alocar_orcamento(orcamento, valores, {slot: current for slot in crystals_per_up})
+    except ValueError:
+        # orçamento "inf"/"nan" ou preços fora do alcance: mesmo aviso de orçamento vazio
+        return None
+
+
+def desenhar_orcamento_cristais(estrutura, alocacao):
+    if estrutura is None:
+        return None
+    if alocacao is None:
+        texto = "Orçamento: informe quanto berry quer gastar para ver quais upgrades comprar\n"
+    elif alocacao["niveis"] == 0:
+        texto = f"Orçamento de {int(alocacao['orcamento']):,} berry não cobre nenhum upgrade\n"
+    else:
+        compras = ", ".join(f"{s['slot']} +{s['de']}→+{s['ate']}" for s in alocacao["slots"] if s["niveis"])
+        texto = (f"Com {int(alocacao['orcamento']):,} berry: {alocacao['niveis']} níveis ({compras}) "
+                 f"→ {int(alocacao['gasto']):,} berry em média\n")
+    _substituir_trecho(resultado_cristais, "orcamento", texto)
+    return alocacao
+
+
+def calcular_cristais():
+    grafos["cristais"].recalcular()
+
+
+def construir_tela_cristais():
+    """Constrói os widgets da calculadora de cristais a partir de `settings`."""
+    global combo_equip, combo_level, valor_entries, entry_orcamento, resultado_cristais
+    tela_cristais = tk.Frame(container, bg=COR_FUNDO)
+
+    # Header
+    header_cristais = tk.Frame(tela_cristais, bg="#0b74a6", height=70)
+    header_cristais.pack(fill=tk.X)
+
+    tk.Label(
+        header_cristais,
+        text="💎 CALCULADORA DE CRISTAIS",
+        bg="#0b74a6",
+        fg=COR_TEXTO,
+        font=("Segoe UI", 14, "bold")
+    ).pack(pady=15)
+
+    # Conteúdo — scrollable (mantém botões fixos no rodapé em monitores pequenos)
+    content_cristais_container = tk.Frame(tela_cristais, bg=COR_FUNDO)
+    content_cristais_container.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+    content_cristais_canvas = tk.Canvas(content_cristais_container, bg=COR_FUNDO, highlightthickness=0)
+    content_cristais_scroll = tk.Scrollbar(content_cristais_container, orient=tk.VERTICAL, command=content_cristais_canvas.yview)
+    content_cristais_canvas.configure(yscrollcommand=content_cristais_scroll.set)
+    content_cristais_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=10)
+    content_cristais_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+    content_cristais = tk.Frame(content_cristais_canvas, bg=COR_FUNDO)
+    content_cristais_window = content_cristais_canvas.create_window((0,0), window=content_cristais, anchor='nw')
+    # Ajusta região de rolagem quando o frame interno muda
+    def _on_config_cristais(event):
+        content_cristais_canvas.configure(scrollregion=content_cristais_canvas.bbox("all"))
+    content_cristais.bind("<Configure>", _on_config_cristais)
+    # Faz o frame interno preencher toda a largura do canvas (corrige desalinhamento)
+    def _on_canvas_config_cristais(event):
+        try:
+            content_cristais_canvas.itemconfig(content_cristais_window, width=event.width)
+        except Exception:
+            pass
+    content_cristais_canvas.bind("<Configure>", _on_canvas_config_cristais)
+    # Suporte a roda do mouse quando o cursor estiver sobre o conteúdo
+    def _bind_mousewheel_cristais(event):
+        content_cristais_canvas.bind_all("<MouseWheel>", lambda e: content_cristais_canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+    def _unbind_mousewheel_cristais(event):
+        content_cristais_canvas.unbind_all("<MouseWheel>")
+    content_cristais.bind("<Enter>", _bind_mousewheel_cristais)
+    content_cristais.bind("<Leave>", _unbind_mousewheel_cristais)
+
+    # Top controls — escolha de equipamento e nível alvo
+    controls_frame = tk.Frame(content_cristais, bg=COR_FUNDO)
+    controls_frame.grid(row=0, column=0, sticky='ew')
+    content_cristais.grid_rowconfigure(1, weight=1)
+    content_cristais.grid_columnconfigure(0, weight=1)
+
+    # Equipamento (escolha única)
+    tk.Label(controls_frame, text="Equipamento", bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 9, "bold")).grid(row=0, column=0, sticky="w")
+    combo_equip = ttk.Combobox(controls_frame, values=slots, state="readonly", font=("Segoe UI", 10))
+    # restaura valor salvo
+    if settings.get('cristal_equip') in slots:
+        combo_equip.set(settings.get('cristal_equip'))
+    else:
+        combo_equip.current(0)
+    combo_equip.grid(row=1, column=0, sticky="we", pady=(5,8))
+    combo_equip.bind("<<ComboboxSelected>>", lambda e: (settings.update({'cristal_equip': combo_equip.get()}), schedule_save()))
+
+    # Nível atual (0..16)
+    tk.Label(controls_frame, text="Nível atual", bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 9, "bold")).grid(row=0, column=1, sticky="w", padx=(15,0))
+    combo_level = ttk.Combobox(controls_frame, values=[str(i) for i in range(0,17)], state="readonly", font=("Segoe UI", 10))
+    # restaura valor salvo
+    if settings.get('cristal_level') and settings.get('cristal_level') in [str(i) for i in range(0,17)]:
+        try:
+            combo_level.set(settings.get('cristal_level'))
+        except Exception:
+            combo_level.current(0)
+    else:
+        combo_level.current(0)
+    combo_level.grid(row=1, column=1, sticky="we", pady=(5,8), padx=(15,0))
+    combo_level.bind("<<ComboboxSelected>>", lambda e: (settings.update({'cristal_level': combo_level.get()}), schedule_save()))
+
+    # Valor por cristal por tipo (Céu, Sábio, Carmesim, Radiante)
+    tk.Label(controls_frame, text="Valor por Cristal (berry)", bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 9, "bold")).grid(row=0, column=2, sticky="w", padx=(15,0))
+    valor_frame = tk.Frame(controls_frame, bg=COR_FUNDO)
+    valor_frame.grid(row=1, column=2, sticky="we", pady=(5,8), padx=(15,0))
+
+    # labels e entries compactos
+    labels = ["Céu", "Sábio", "Carmesim", "Radiante"]
+    crystal_keys = ["Cristais do Céu", "Cristais do Sábio", "Cristais Carmesim", "Cristais Radiante"]
+    valor_entries = {}
+    for i, (lbl, key) in enumerate(zip(labels, crystal_keys)):
+        tk.Label(valor_frame, text=lbl, bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 8)).grid(row=0, column=i, padx=4)
+        e = tk.Entry(valor_frame, bg=COR_CARD, fg=COR_TEXTO, font=("Segoe UI", 9), bd=0, relief=tk.FLAT, width=8, justify='center')
+        # restaura valor salvo para cada tipo de cristal
+        saved_vals = settings.get('cristal_values', {})
+        e.insert(0, str(saved_vals.get(key, "0")))
+        e.grid(row=1, column=i, padx=4)
+        valor_entries[key] = e
+        # atualiza settings ao perder foco
+        e.bind("<FocusOut>", lambda ev, k=key: (settings.setdefault('cristal_values', {}).__setitem__(k, valor_entries[k].get()), schedule_save()))
+
+    # Ajuste de colunas
+    controls_frame.grid_columnconfigure(0, weight=1)
+    controls_frame.grid_columnconfigure(1, weight=0)
+    controls_frame.grid_columnconfigure(2, weight=0)
+
+    # Todos os equipamentos na tabela (relatório completo)
+    todos_var = tk.BooleanVar(value=bool(settings.get('cristal_todos')))
+    tk.Checkbutton(
+        controls_frame, text="Tabela com todos os equipamentos", variable=todos_var,
+        bg=COR_FUNDO, fg=COR_TEXTO, selectcolor=COR_CARD, activebackground=COR_FUNDO,
+        activeforeground=COR_TEXTO, font=("Segoe UI", 9), bd=0, highlightthickness=0
+    ).grid(row=2, column=0, columnspan=3, sticky="w")
+
+    # Orçamento: quais upgrades comprar (em todos os equipamentos) para ganhar mais níveis
+    orcamento_frame = tk.Frame(controls_frame, bg=COR_FUNDO)
+    orcamento_frame.grid(row=3, column=0, columnspan=3, sticky="w", pady=(4,0))
+    tk.Label(orcamento_frame, text="Orçamento (berry)", bg=COR_FUNDO, fg=COR_TEXTO, font=("Segoe UI", 9, "bold")).pack(side=tk.LEFT)
+    entry_orcamento = tk.Entry(orcamento_frame, bg=COR_CARD, fg=COR_TEXTO, font=("Segoe UI", 9), bd=0, relief=tk.FLAT, width=14, justify='center')
+    entry_orcamento.insert(0, str(settings.get('cristal_orcamento', "")))
+    entry_orcamento.pack(side=tk.LEFT, padx=(8,0))
+    entry_orcamento.bind("<FocusOut>", lambda e: (settings.update({'cristal_orcamento': entry_orcamento.get()}), schedule_save()))
+
+    # Resultado (com scrollbar)
+    resultado_cristais_frame = tk.Frame(content_cristais, bg=COR_FUNDO)
+    resultado_cristais_frame.grid(row=1, column=0, sticky='nsew', pady=(10,5))
+
+    resultado_cristais = tk.Text(resultado_cristais_frame, bg=COR_CARD, fg=COR_TEXTO, font=("Segoe UI", 10), bd=0, relief=tk.FLAT, state="disabled", wrap="word", height=7)
+    scroll_cristais = tk.Scrollbar(resultado_cristais_frame, orient=tk.VERTICAL, command=resultado_cristais.yview)
+    resultado_cristais['yscrollcommand'] = scroll_cristais.set
+    resultado_cristais.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scroll_cristais.pack(side=tk.RIGHT, fill=tk.Y)
+
+    # Tabela por nível (virtualizada; clique no cabeçalho ordena, na linha escolhe o equipamento)
+    def _escolher_equip(linha):
+        if linha.get("slot") in crystals_per_up and linha["slot"] != combo_equip.get():
+            combo_equip.set(linha["slot"])
+            combo_equip.event_generate("<<ComboboxSelected>>")
+    tabela_cristais = TabelaVirtual(content_cristais, ModeloTabela(COLUNAS_CRISTAIS), bg=COR_CARD,
+                                    bg_cabecalho=COR_FUNDO, fg=COR_TEXTO, fg_cabecalho=COR_ACENTO,
+                                    comando=_escolher_equip, height=320)
+    tabela_cristais.grid(row=2, column=0, sticky='nsew', pady=(5,5))
+
+    # Recalcula enquanto o usuário digita: equipamento/nível refazem o plano;
+    # o preço de um tipo só reprecifica os níveis desse tipo (ex.: Carmesim → +9..+12)
+    grafo = _novo_grafo("cristais")
+    _ligar_entrada(grafo, "slot", combo_equip, ("<<ComboboxSelected>>",))
+    _ligar_entrada(grafo, "nivel", combo_level, ("<<ComboboxSelected>>",))
+    for key, entry in valor_entries.items():
+        _ligar_entrada(grafo, key, entry)
+    _ligar_entrada(grafo, "orcamento", entry_orcamento)
+    grafo.entrada("todos", todos_var.get())
+    def _on_todos_change(*args):
+        settings['cristal_todos'] = todos_var.get()
+        schedule_save()
+        grafo.definir("todos", todos_var.get())
+    todos_var.trace_add("write", _on_todos_change)
+    grafo.no("plano", ("slot", "nivel"), _plano_base_cristais)
+    grafo.no("estrutura", ("plano",), desenhar_estrutura_cristais)
+    niveis = range(1, NIVEL_MAXIMO_CRISTAL + 1)
+    precos = tuple(f"preco{lvl}" for lvl in niveis)
+    for lvl in niveis:
+        grafo.no(f"preco{lvl}", ("plano", get_crystal_type_for_level(lvl)), _preco_nivel(lvl))
+    grafo.no("totais", ("plano",) + precos, _totais_cristais)
+    grafo.no("linha_total", ("estrutura", "totais"), desenhar_total_cristais)
+    grafo.no("valores", TIPOS_CRISTAL, _valores_cristais)
+    grafo.no("linhas", ("todos", "nivel", "valores") + precos,
+             lambda todos, nivel, valores, *p: _linhas_cristais(todos, nivel, valores, p))
+    grafo.no("tabela", ("linhas",), tabela_cristais.definir_linhas)
+    grafo.no("alocacao", ("orcamento", "nivel", "valores"), _alocacao_cristais)
+    grafo.no("linha_orcamento", ("estrutura", "alocacao"), desenhar_orcamento_cristais)
+    grafo.iniciar()
+
+    # Botões na parte inferior (calcular/voltar) — fixados no rodapé da tela
+    footer_cristais = tk.Frame(tela_cristais, bg=COR_FUNDO)
+    footer_cristais.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=12)
+
+    criar_botao_moderno(
+        footer_cristais,
+        "⚓ CALCULAR",
+        lambda: calcular_cristais(),
+        cor_fundo=COR_ACENTO,
+        cor_texto="#000"
+    ).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+
+    criar_botao_moderno(
+        footer_cristais,
+        "⬅ VOLTAR",
+        lambda: mostrar_tela("menu"),
+        cor_fundo=COR_SECUNDARIA
+    ).pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)
+
+    return tela_cristais
+
 
 # ================= INICIAL =================
+construtores.update({
+    "menu": construir_menu,
+    "exp": construir_tela_exp,
+    "receitas": construir_tela_receitas,
+    "cristais": construir_tela_cristais
+})
+janela.after(INTERVALO_EVICCAO_MS, descartar_telas_ociosas)
+
+# Dados do jogo (assets/dados_jogo.json): um patch de balanceamento salvo no arquivo
+# é aplicado sem reiniciar — as telas são reconstruídas com as tabelas novas
+def _ao_recarregar_dados(info):
+    if loja_precos is not None:
+        loja_precos.recarregar_catalogo()
+    atual = settings.get('last_screen', "menu")
+    for nome in list(frames):
+        _descartar_tela(nome)
+    mostrar_tela(atual)
+
+def vigiar_dados_jogo():
+    try:
+        recarregar_se_mudou()
+    except DadosInvalidos as e:
+        # mantém os dados atuais; o arquivo pode estar no meio de uma edição
+        if sys.stderr is not None:
+            print(e, file=sys.stderr)
+    janela.after(INTERVALO_DADOS_MS, vigiar_dados_jogo)
+
+ao_recarregar.append(_ao_recarregar_dados)
+janela.after(INTERVALO_DADOS_MS, vigiar_dados_jogo)
+
 # mostra a tela que estava aberta na última execução
-mostrar_tela(settings.get('last_screen', "menu"))
+with perfil_inicio.fase("primeiro mostrar_tela"):
+    mostrar_tela(settings.get('last_screen', "menu"))
+
+def _finalizar_perfil_inicio():
+    """Modo trace: marca o primeiro quadro, mede as telas ainda não abertas e grava o relatório."""
+    janela.update_idletasks()
+    perfil_inicio.marcar("primeiro quadro desenhado")
+    for nome in construtores:
+        if nome not in frames:
+            with perfil_inicio.fase(f"construir tela {nome} (pré-carga do perfil)"):
+                frames[nome] = construtores[nome]()
+            ocultas_desde[nome] = time.monotonic()
+    try:
+        perfil_inicio.gravar()
+    except OSError:
+        pass
+
+if perfil_inicio.ATIVO:
+    janela.after_idle(_finalizar_perfil_inicio)
 
 janela.mainloop()
@@ -0,0 +1,370 @@
+# Benchmarks do núcleo de cálculo (sem interface gráfica — roda em Linux sem display)
+#
+# Uso:
+#   python benchmarks.py                          mede e mostra a tabela
+#   python benchmarks.py --salvar base.json       mede e grava a linha de base
+#   python benchmarks.py --comparar base.json     mede e compara; sai com 1 se
+#                                                 houver lentidão significativa
+#   python benchmarks.py --filtro cristais        só benchmarks cujo nome contém o texto
+#
+# Cada amostra repete a operação o suficiente para durar ~TEMPO_AMOSTRA e guarda o
+# tempo por operação. Na comparação, uma regressão exige as duas coisas: mediana
+# mais lenta que o limiar (padrão 5%) e diferença significativa pelo teste de
+# Mann-Whitney (unilateral, padrão p < 0,01), para não acusar ruído.
+
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from calculos import (
+    receitas, crystals_per_up, XP_POCAO_POR_TIER, NIVEL_MAXIMO, NIVEL_MAXIMO_CRISTAL,
+    SUCCESS_TABLE, calcular_xp_necessaria, pocoes_para_xp, otimizar_pocoes, niveis_com_xp,
+    expected_attempts, expected_crystals_for_level, custo_receita, plano_cristais, alocar_orcamento,
+    verificar_max_cristais
+)
+from configuracoes import ler_configuracoes, gravar_configuracoes, Configuracoes
+import dados_jogo
+
+VERSAO_BASE = 1
+AMOSTRAS = 15
+TEMPO_AMOSTRA = 0.02
+LIMIAR = 0.05
+ALFA = 0.01
+
+
+# ================= BENCHMARKS =================
+# Cada função recebe nada e devolve a operação a ser medida (preparo fora do tempo).
+def _bench_xp_pares():
+    pares = [(i, j) for i in range(1, NIVEL_MAXIMO + 1) for j in range(1, NIVEL_MAXIMO + 1)]
+    def op():
+        for i, j in pares:
+            calcular_xp_necessaria(i, j)
+    return op
+
+
+def _bench_pocoes_por_tier():
+    xps = [calcular_xp_necessaria(1, j) for j in range(2, NIVEL_MAXIMO + 1)]
+    tiers = list(XP_POCAO_POR_TIER)
+    def op():
+        for tier in tiers:
+            for xp in xps:
+                pocoes_para_xp(xp, tier)
+    return op
+
+
+def _bench_otimizar_pocoes():
+    pares = [(1, j) for j in range(2, NIVEL_MAXIMO + 1, 7)]
+    estoque = {"grande": 20, "média": 15, "pequena": 30}
+    precos = {"grande": 900, "média": 95, "pequena": 10}
+    otimizar_pocoes(1, 2, "Diamante", precos=precos)  # monta a tabela fora do tempo
+    def op():
+        for i, j in pares:
+            otimizar_pocoes(i, j, "Diamante", precos=precos)
+            otimizar_pocoes(i, j, "Diamante", estoque, precos)
+    return op
+
+
+def _bench_niveis_com_xp():
+    iniciais = [1 + (i * 7) % NIVEL_MAXIMO for i in range(10000)]
+    xps = [(i * 7919) % 20000000 for i in range(10000)]
+    def op():
+        niveis_com_xp(iniciais, xps)
+    return op
+
+
+def _bench_expected_attempts():
+    tabela = [SUCCESS_TABLE[n] for n in range(1, NIVEL_MAXIMO_CRISTAL + 1)]
+    def op():
+        for p, g in tabela:
+            expected_attempts(p, g)
+    return op
+
+
+def _bench_expected_crystals():
+    combinacoes = [(s, n) for s in crystals_per_up for n in range(0, NIVEL_MAXIMO_CRISTAL + 1)]
+    def op():
+        for slot, nivel in combinacoes:
+            expected_crystals_for_level(slot, nivel)
+    return op
+
+
+def _bench_plano_cristais():
+    combinacoes = [(s, n) for s in crystals_per_up for n in range(0, NIVEL_MAXIMO_CRISTAL + 1)]
+    valores = {"Cristais do Céu": 10, "Cristais do Sábio": 20, "Cristais Carmesim": 30, "Cristais Radiante": 40}
+    def op():
+        for slot, nivel in combinacoes:
+            plano_cristais(slot, nivel, valores)
+    return op
+
+
+def _bench_alocar_orcamento():
+    valores = {"Cristais do Céu": 100, "Cristais do Sábio": 300, "Cristais Carmesim": 800, "Cristais Radiante": 2000}
+    pesos = {"Arma": 3, "Peito": 2}
+    orcamentos = [1e4, 1e5, 1e6]
+    def op():
+        for orcamento in orcamentos:
+            alocar_orcamento(orcamento, valores)
+            alocar_orcamento(orcamento, valores, pesos=pesos)
+    return op
+
+
+def _bench_receitas_quantidades():
+    quantidades = [1, 10, 100, 1000, 10000, 100000]
+    nomes = list(receitas)
+    def op():
+        for receita in nomes:
+            for qtd in quantidades:
+                custo_receita(receita, qtd, 3200)
+    return op
+
+
+def _dados_settings():
+    return {
+        "geometry": "777x791+570+113", "state": "normal", "last_screen": "cristais",
+        "tier": "Diamante", "receita": "Frango Teriyaki", "receita_qtd": "100",
+        "receita_valor": "3200", "cristal_equip": "Emblema", "cristal_level": "5",
+        "cristal_values": {"Cristais do Céu": "10", "Cristais do Sábio": "20",
+                           "Cristais Carmesim": "30", "Cristais Radiante": "40"},
+        "exp_nivel_ini": "1", "exp_nivel_fin": "70", "tela_ociosa_segundos": 300
+    }
+
+
+class _PastaTemporaria:
+    """Pasta descartável para os benchmarks de arquivo (removida ao sair)."""
+    pasta = None
+
+    @classmethod
+    def caminho(cls, nome):
+        if cls.pasta is None:
+            cls.pasta = tempfile.mkdtemp(prefix="gla-bench-")
+        return os.path.join(cls.pasta, nome)
+
+    @classmethod
+    def limpar(cls):
+        if cls.pasta:
+            shutil.rmtree(cls.pasta, ignore_errors=True)
+            cls.pasta = None
+
+
+def _bench_settings_gravar():
+    caminho = _PastaTemporaria.caminho("settings_gravar.json")
+    dados = _dados_settings()
+    def op():
+        gravar_configuracoes(caminho, dados)
+    return op
+
+
+def _bench_settings_ler():
+    caminho = _PastaTemporaria.caminho("settings_ler.json")
+    gravar_configuracoes(caminho, _dados_settings())
+    def op():
+        ler_configuracoes(caminho)
+    return op
+
+
+def _bench_settings_sem_mudanca():
+    # caminho comum do app: atribuições repetidas (ex.: <Configure>) sem mudar o conteúdo
+    settings = Configuracoes(_PastaTemporaria.caminho("settings_store.json"), _dados_settings())
+    settings.carregar()
+    def op():
+        settings["geometry"] = "777x791+570+113"
+        settings.setdefault("cristal_values", {})["Cristais do Céu"] = "10"
+        settings.gravar()
+    return op
+
+
+def _bench_dados_sem_cache():
+    def op():
+        dados_jogo.carregar(usar_cache=False)
+    return op
+
+
+def _bench_dados_com_cache():
+    # cache numa pasta descartável (o primeiro carregar compila e grava)
+    os.environ[dados_jogo.VARIAVEL_CACHE] = _PastaTemporaria.caminho("cache")
+    dados_jogo.carregar()
+    def op():
+        dados_jogo.carregar()
+    return op
+
+
+BENCHMARKS = {
+    "xp/calcular_xp_necessaria 140x140": _bench_xp_pares,
+    "xp/pocoes_para_xp todos os tiers": _bench_pocoes_por_tier,
+    "xp/otimizar_pocoes tabela e com estoque": _bench_otimizar_pocoes,
+    "xp/niveis_com_xp lote de 10 mil": _bench_niveis_com_xp,
+    "cristais/expected_attempts todos os níveis": _bench_expected_attempts,
+    "cristais/expected_crystals_for_level slots x níveis": _bench_expected_crystals,
+    "cristais/plano_cristais slots x níveis": _bench_plano_cristais,
+    "cristais/alocar_orcamento guloso e dp": _bench_alocar_orcamento,
+    "receitas/custo_receita varredura de quantidades": _bench_receitas_quantidades,
+    "settings/gravar": _bench_settings_gravar,
+    "settings/ler": _bench_settings_ler,
+    "settings/gravar sem mudança": _bench_settings_sem_mudanca,
+    "dados/carregar validando o JSON": _bench_dados_sem_cache,
+    "dados/carregar do cache compilado": _bench_dados_com_cache,
+}
+
+
+# ================= MEDIÇÃO =================
+def medir(op, amostras=AMOSTRAS, tempo_amostra=TEMPO_AMOSTRA):
+    """Lista de segundos por operação, uma por amostra (repetições calibradas)."""
+    op()  # aquece caches/imports
+    inicio = time.perf_counter()
+    op()
+    uma = max(time.perf_counter() - inicio, 1e-9)
+    repeticoes = max(1, int(tempo_amostra / uma))
+    resultado = []
+    for _ in range(amostras):
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            op()
+        resultado.append((time.perf_counter() - inicio) / repeticoes)
+    return resultado
+
+
+def executar(filtro=None, amostras=AMOSTRAS, tempo_amostra=TEMPO_AMOSTRA):
+    """Roda os benchmarks (opcionalmente filtrados por nome) e devolve o relatório."""
+    resultados = {}
+    try:
+        for nome, preparar in BENCHMARKS.items():
+            if filtro and filtro not in nome:
+                continue
+            t = medir(preparar(), amostras, tempo_amostra)
+            resultados[nome] = {
+                "amostras": t,
+                "mediana": statistics.median(t),
+                "media": statistics.fmean(t),
+                "desvio": statistics.stdev(t) if len(t) > 1 else 0.0,
+            }
+    finally:
+        _PastaTemporaria.limpar()
+    return {
+        "versao": VERSAO_BASE,
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "maquina": {"python": platform.python_version(), "sistema": platform.platform(),
+                    "processador": platform.machine()},
+        "resultados": resultados,
+    }
+
+
+# ================= COMPARAÇÃO =================
+def mann_whitney_maior(a, b):
+    """p-valor unilateral de 'a tende a ser maior que b' (aproximação normal, com empates)."""
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    valores = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    postos = [0.0] * len(valores)
+    empates = 0.0
+    i = 0
+    while i < len(valores):
+        j = i
+        while j + 1 < len(valores) and valores[j + 1][0] == valores[i][0]:
+            j += 1
+        posto = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            postos[k] = posto
+        t = j - i + 1
+        empates += t ** 3 - t
+        i = j + 1
+    r1 = sum(p for p, (_, grupo) in zip(postos, valores) if grupo == 0)
+    u1 = r1 - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variancia = n1 * n2 / 12 * ((n + 1) - empates / (n * (n - 1)))
+    if variancia <= 0:
+        return 1.0
+    z = (u1 - n1 * n2 / 2 - 0.5) / math.sqrt(variancia)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def comparar(atual, base, limiar=LIMIAR, alfa=ALFA):
+    """Compara dois relatórios; devolve [{nome, razao, p, status}] com status
+    'regressao', 'melhora', 'igual' ou 'novo'."""
+    linhas = []
+    for nome, r in atual["resultados"].items():
+        b = base.get("resultados", {}).get(nome)
+        if b is None:
+            linhas.append({"nome": nome, "razao": None, "p": None, "status": "novo"})
+            continue
+        razao = r["mediana"] / b["mediana"] if b["mediana"] else float("inf")
+        p_pior = mann_whitney_maior(r["amostras"], b["amostras"])
+        p_melhor = mann_whitney_maior(b["amostras"], r["amostras"])
+        if razao > 1 + limiar and p_pior < alfa:
+            status, p = "regressao", p_pior
+        elif razao < 1 - limiar and p_melhor < alfa:
+            status, p = "melhora", p_melhor
+        else:
+            status, p = "igual", min(p_pior, p_melhor)
+        linhas.append({"nome": nome, "razao": razao, "p": p, "status": status})
+    return linhas
+
+
+def _fmt_tempo(s):
+    for unidade, fator in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if s >= fator:
+            return f"{s / fator:8.2f} {unidade}"
+    return f"{s / 1e-9:8.1f} ns"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do núcleo de cálculo do GLA Tools")
+    parser.add_argument("--salvar", metavar="ARQUIVO", help="grava o resultado como linha de base JSON")
+    parser.add_argument("--comparar", metavar="ARQUIVO", help="compara com uma linha de base JSON")
+    parser.add_argument("--filtro", help="só benchmarks cujo nome contém este texto")
+    parser.add_argument("--amostras", type=int, default=AMOSTRAS)
+    parser.add_argument("--tempo-amostra", type=float, default=TEMPO_AMOSTRA,
+                        help="duração alvo de cada amostra em segundos")
+    parser.add_argument("--limiar", type=float, default=LIMIAR,
+                        help="lentidão mínima da mediana para acusar regressão (0.05 = 5%%)")
+    parser.add_argument("--alfa", type=float, default=ALFA, help="nível de significância")
+    args = parser.parse_args(argv)
+
+    base = None
+    if args.comparar:
+        with open(args.comparar, "r", encoding="utf-8") as f:
+            base = json.load(f)
+
+    # o planejador precisa concordar com a tabela MAX_CRISTAIS antes de medir
+    divergencias = verificar_max_cristais()
+    if divergencias:
+        for tipo, slot, calculado, tabela in divergencias:
+            sys.stderr.write(f"MAX_CRISTAIS[{tipo}][{slot}] = {tabela}, planejador: {calculado}\n")
+        return 2
+
+    relatorio = executar(args.filtro, max(2, args.amostras), args.tempo_amostra)
+    largura = max(len(n) for n in relatorio["resultados"]) if relatorio["resultados"] else 10
+
+    regressoes = 0
+    if base is None:
+        for nome, r in relatorio["resultados"].items():
+            print(f"{nome:<{largura}} {_fmt_tempo(r['mediana'])}  ±{100 * r['desvio'] / r['media']:4.1f}%")
+    else:
+        for c in comparar(relatorio, base, args.limiar, args.alfa):
+            r = relatorio["resultados"][c["nome"]]
+            if c["status"] == "novo":
+                extra = "novo"
+            else:
+                extra = f"{c['razao']:6.3f}x  p={c['p']:.4f}  {c['status'].upper() if c['status'] == 'regressao' else c['status']}"
+            print(f"{c['nome']:<{largura}} {_fmt_tempo(r['mediana'])}  {extra}")
+            regressoes += c["status"] == "regressao"
+
+    if args.salvar:
+        with open(args.salvar, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+        print(f"linha de base gravada em {args.salvar}")
+    if regressoes:
+        sys.stderr.write(f"{regressoes} benchmark(s) com lentidão significativa\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
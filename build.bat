@@ -11,6 +11,13 @@ if exist %ASSETS% (
     set ADDDATA=
 )
 
+REM Regenerate sprite atlases (assets\sprites.bin) if the PNGs changed
+python sprites.py
+if %ERRORLEVEL% neq 0 (
+    echo Sprite build failed with error %ERRORLEVEL%
+    exit /b %ERRORLEVEL%
+)
+
 pyinstaller --onefile --windowed --icon=%ICON% %ADDDATA% %APP%
 
 if %ERRORLEVEL% equ 0 (
@@ -19,6 +19,10 @@ if (Test-Path $Assets) {
     $dataArg = ""
 }
 
+# Regenerate sprite atlases (assets/sprites.bin, web sprites.png/.css) if the PNGs changed
+python sprites.py
+if ($LASTEXITCODE -ne 0) { Write-Error "Sprite build failed with exit code $LASTEXITCODE" }
+
 # Run PyInstaller
 $cmd = "pyinstaller --onefile --windowed --icon=$Icon $dataArg $MainScript"
 Write-Host "Running: $cmd"
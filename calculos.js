@@ -0,0 +1,98 @@
+/* GLA Tools — núcleo de cálculo da versão web (sem DOM)
+   Lê as tabelas de dados.js (gerado por web_dados.py a partir de
+   assets/dados_jogo.json); as médias de cristais já vêm calculadas, então
+   aqui só há consultas às tabelas e aritmética.
+   Carregado por worker.js, pela página (fallback sem Worker) e pelo teste
+   de paridade (node).
+*/
+
+const DADOS = (typeof GLA_DADOS !== 'undefined') ? GLA_DADOS : require('./dados.js');
+
+const NIVEL_MAXIMO = DADOS.xp_total.length - 1;
+const NIVEL_MAXIMO_CRISTAL = DADOS.tipo_cristal.length - 1;
+
+// ----------------- Experiência -----------------
+function xp_needed(n1, n2){
+  if(n1<1 || n1>=n2 || n2>NIVEL_MAXIMO) return null;
+  return DADOS.xp_total[n2] - DADOS.xp_total[n1];
+}
+
+// mesmo arredondamento de calculos.pocoes_para_xp: o resto vira mais uma pequena
+function potions_for_xp(xp, tier){
+  const vals = DADOS.xp_pocao[tier];
+  xp = Math.floor(xp);
+  const grandes = Math.floor(xp/vals.grande);
+  let rem = xp % vals.grande;
+  const medias = Math.floor(rem/vals.media);
+  rem = rem % vals.media;
+  const pequenas = Math.ceil(rem/vals.pequena);
+  return {grandes, medias, pequenas};
+}
+
+function plano_experiencia(n1, n2, tier){
+  const xp = xp_needed(n1, n2);
+  if(xp === null) return null;
+  return Object.assign({xp}, potions_for_xp(xp, tier));
+}
+
+// ----------------- Receitas -----------------
+function custo_receita(receita, qtd, valor){
+  const itens = [];
+  let custo = 0;
+  for(const item of Object.keys(DADOS.receitas[receita])){
+    const [quantiaPorUnidade, valorUnitario] = DADOS.receitas[receita][item];
+    const quantidade = quantiaPorUnidade * qtd;
+    const custoItem = Math.floor(quantidade * Number(valorUnitario));
+    custo += custoItem;
+    itens.push({item, quantidade, valor_unitario: valorUnitario, custo: custoItem});
+  }
+  const venda = qtd * valor;
+  const taxa = Math.floor(venda * DADOS.taxa_venda);
+  return {itens, custo, venda, taxa, lucro: venda - custo - taxa};
+}
+
+// ----------------- Cristais -----------------
+function get_transfer_cost(slot, level){
+  const linha = DADOS.cristais[slot];
+  if(!linha) return 0;
+  return linha.transferencia[Math.max(0, Math.min(NIVEL_MAXIMO_CRISTAL, level))];
+}
+
+// `valores`: {tipo de cristal: preço}; mesmo resultado de calculos.plano_cristais
+function plano_cristais(slot, atual, valores){
+  const linha = DADOS.cristais[slot];
+  valores = valores || {};
+  atual = Math.max(0, Math.min(NIVEL_MAXIMO_CRISTAL, atual));
+  const niveis = [];
+  let custoMin = 0, custoMax = 0;
+  for(let lvl = atual+1; lvl<=NIVEL_MAXIMO_CRISTAL; lvl++){
+    const n = linha.niveis[lvl-1];
+    const valor = valores[n.tipo] || 0;
+    const r = {nivel: lvl, tipo: n.tipo, media: n.media, minimo: n.minimo, maximo: n.maximo, valor,
+               custo_minimo: n.minimo * valor, custo_maximo: n.maximo * valor};
+    niveis.push(r);
+    custoMin += r.custo_minimo; custoMax += r.custo_maximo;
+  }
+  return {
+    slot, nivel_atual: atual,
+    gemas_transferencia: linha.transferencia[atual],
+    niveis,
+    total_media: linha.total_media[atual],
+    total_maximo: linha.total_maximo[atual],
+    total_custo_minimo: custoMin,
+    total_custo_maximo: custoMax
+  };
+}
+
+// ----------------- Tarefas (API de mensagens do worker) -----------------
+// Cada tarefa é um gerador: `yield fração` (0..1) devolve o controle ao worker,
+// que publica o progresso e atende cancelamentos antes de continuar; o valor
+// de `return` é o resultado. Cálculos longos devem dar yield a cada bloco.
+const TAREFAS = {
+  xp: function*(a){ return plano_experiencia(a.nivel_inicial, a.nivel_final, a.tier); },
+  receita: function*(a){ return custo_receita(a.receita, a.quantidade, a.valor); },
+  cristais: function*(a){ return plano_cristais(a.slot, a.nivel_atual, a.valores); }
+};
+
+const GLA_CALCULOS = {xp_needed, potions_for_xp, plano_experiencia, custo_receita, get_transfer_cost, plano_cristais, TAREFAS};
+if(typeof module !== 'undefined') module.exports = GLA_CALCULOS;
@@ -0,0 +1,869 @@
+# Núcleo de cálculo do GLA Tools (sem tkinter/PIL)
+# Pode ser importado por scripts, bots e servidores headless.
+
+import bisect
+import heapq
+import math
+from array import array
+from collections import OrderedDict
+
+from dados_jogo import (
+    NIVEL_MAXIMO, NIVEL_MAXIMO_CRISTAL, TAMANHOS_POCAO, DadosInvalidos, Observador,
+    carregar as carregar_dados
+)
+
+# ================= DADOS =================
+# As tabelas do jogo vêm de assets/dados_jogo.json (ver dados_jogo.py). Os objetos
+# abaixo são preenchidos no lugar, então `from calculos import receitas` continua
+# válido depois de um recarregamento a quente.
+receitas = {}
+XP_POCAO_POR_TIER = {}
+xpPerLevel = array("q")
+xpTotalByLevel = array("q")
+MAX_CRISTAIS = {}
+crystals_per_up = {}
+# Tabela de chance e tentativa garantida (pity): {nível: (chance, pity)}
+SUCCESS_TABLE = {}
+# Custo de transferência (gemas): as chaves são o nível teto da faixa (4, 8, 12, 16)
+TRANSFER_COSTS = {}
+
+# Taxa cobrada sobre a venda
+TAXA_VENDA = 0.03
+
+# Config XP
+XP_NECESSARIO = {
+    (1, 70): 5246500,
+    (1, 140): 43813000,
+    (70, 140): 38566500
+}
+
+TIERS = {
+    "Diamante": 0.5,
+    "Ouro": 1.0,
+    "Prata": 2.0,
+    "Bronze": 3.0
+}
+
+# Equipamentos e cristais (slots segue a ordem de cristais_por_up no arquivo de dados)
+slots = []
+cristais_tipos = ["Cristais do Céu", "Cristais do Sábio", "Cristais Carmesim", "Cristais Radiante"]
+
+# Mapeamento de níveis por cristal
+TIERS_LEVELS = {
+    "Cristais do Céu": range(1, 5),
+    "Cristais do Sábio": range(5, 9),
+    "Cristais Carmesim": range(9, 13),
+    "Cristais Radiante": range(13, 17)
+}
+
+# Tabelas do otimizador de poções sem preços, LRU por (tier, objetivo): cada uma
+# leva ~0,3 s e ~9 MB, então ficam no máximo MAX_TABELAS_POCAO (limpas ao recarregar)
+MAX_TABELAS_POCAO = 4
+_tabelas_pocoes = OrderedDict()
+
+# Versão carregada e quem quer saber de recarregamentos (ex.: telas do app, cache do servidor)
+dados_atuais = {"versao": None, "hash": None, "caminho": None, "do_cache": False}
+ao_recarregar = []
+_observador = None
+
+def _aplicar_dados(dados):
+    """Troca o conteúdo das tabelas no lugar (a validação já foi feita por dados_jogo)."""
+    if set(dados["max_cristais"]) != set(cristais_tipos):
+        raise DadosInvalidos([f"max_cristais deve ter os tipos {', '.join(cristais_tipos)}"])
+    divergencias = _divergencias_max_cristais(dados["tabela_sucesso"], dados["cristais_por_up"],
+                                              dados["max_cristais"])
+    if divergencias:
+        raise DadosInvalidos([f"max_cristais[{tipo}][{slot}] = {tabela}, mas o pity soma {calculado}"
+                              for tipo, slot, calculado, tabela in divergencias])
+    for destino, chave in ((receitas, "receitas"), (XP_POCAO_POR_TIER, "xp_pocao_por_tier"),
+                           (MAX_CRISTAIS, "max_cristais"), (crystals_per_up, "cristais_por_up"),
+                           (SUCCESS_TABLE, "tabela_sucesso"), (TRANSFER_COSTS, "custo_transferencia")):
+        destino.clear()
+        destino.update(dados[chave])
+    xpPerLevel[:] = dados["xp_por_nivel"]
+    xpTotalByLevel[:] = dados["xp_total_por_nivel"]
+    slots[:] = list(crystals_per_up)
+    # tabelas derivadas (a matriz de cristais se invalida sozinha pela versão das tabelas)
+    _tabelas_pocoes.clear()
+    for chave in dados_atuais:
+        dados_atuais[chave] = dados.get(chave)
+
+def recarregar_dados(caminho=None):
+    """Lê de novo o arquivo de dados e troca as tabelas; devolve True se o conteúdo mudou.
+
+    Lança DadosInvalidos (mantendo os dados atuais) se a nova versão não validar.
+    """
+    dados = carregar_dados(caminho or dados_atuais["caminho"])
+    if dados["hash"] == dados_atuais["hash"]:
+        return False
+    _aplicar_dados(dados)
+    for funcao in list(ao_recarregar):
+        funcao(dados_atuais)
+    return True
+
+def recarregar_se_mudou():
+    """Recarregamento a quente por polling: chame periodicamente (app: janela.after; servidor: asyncio).
+
+    Barato quando nada mudou (um os.stat). Devolve True se novos dados foram aplicados.
+    """
+    global _observador
+    if _observador is None or _observador.caminho != dados_atuais["caminho"]:
+        _observador = Observador(dados_atuais["caminho"])
+        return False
+    if not _observador.mudou():
+        return False
+    return recarregar_dados()
+
+
+# ================= EXPERIÊNCIA =================
+def calcular_xp_necessaria(nivel_inicial, nivel_final):
+    """Calcula XP necessária entre dois níveis usando as tabelas precisas.
+
+    Usa os arrays `xpTotalByLevel` para retornar a diferença de XP acumulada
+    entre níveis inteiros (1..140). Retorna None para entradas inválidas.
+    """
+    if nivel_inicial < 1 or nivel_inicial >= nivel_final or nivel_final > NIVEL_MAXIMO:
+        return None
+
+    # Ambos níveis são inteiros e estão dentro da tabela — diferença direta
+    return xpTotalByLevel[nivel_final] - xpTotalByLevel[nivel_inicial]
+
+def pocoes_para_xp(xp_necessaria, tier):
+    """Converte XP em poções (grandes, médias, pequenas) sem ficar abaixo do alvo.
+
+    O resto menor que uma pequena vira mais uma pequena; com os tamanhos em
+    múltiplos de 10 isso dá o menor desperdício com o menor número de poções.
+    """
+    xp_valores = XP_POCAO_POR_TIER[tier]
+    xp_necessaria = int(xp_necessaria)
+
+    grandes = xp_necessaria // xp_valores["grande"]
+    resto = xp_necessaria % xp_valores["grande"]
+
+    medias = resto // xp_valores["média"]
+    resto = resto % xp_valores["média"]
+
+    pequenas = -(-resto // xp_valores["pequena"])
+
+    return grandes, medias, pequenas
+
+def plano_experiencia(nivel_inicial, nivel_final, tier):
+    """Resultado estruturado da calculadora de experiência.
+
+    Retorna um dict com tier, níveis, XP total e poções por tamanho, ou None
+    quando os níveis são inválidos.
+    """
+    xp = calcular_xp_necessaria(nivel_inicial, nivel_final)
+    if xp is None:
+        return None
+    grandes, medias, pequenas = pocoes_para_xp(xp, tier)
+    return {
+        "tier": tier,
+        "nivel_inicial": nivel_inicial,
+        "nivel_final": nivel_final,
+        "xp": xp,
+        "pocoes": {"grande": grandes, "média": medias, "pequena": pequenas}
+    }
+
+# ================= CONSULTA INVERSA (XP → nível) =================
+# Busca binária em xpTotalByLevel (crescente a partir do nível 1): O(log 140) por consulta.
+def xp_das_pocoes(tier, pocoes):
+    """XP somada de `pocoes` ({tamanho: quantidade}) no tier."""
+    xp_valores = XP_POCAO_POR_TIER[tier]
+    return sum(int(n) * xp_valores[t] for t, n in pocoes.items())
+
+def _nivel_alcancado(nivel_inicial, xp, progresso=0):
+    """(nivel_final, xp_no_nivel, sobra) — `progresso` é a XP já feita no nível inicial."""
+    total = xpTotalByLevel[nivel_inicial] + progresso + xp
+    if total >= xpTotalByLevel[NIVEL_MAXIMO]:
+        return NIVEL_MAXIMO, 0, total - xpTotalByLevel[NIVEL_MAXIMO]
+    nivel = bisect.bisect_right(xpTotalByLevel, total, 1) - 1
+    return nivel, total - xpTotalByLevel[nivel], 0
+
+def nivel_com_xp(nivel_inicial, xp, progresso=0):
+    """Nível alcançado a partir de `nivel_inicial` ganhando `xp`.
+
+    Retorna um dict com o nível final, a XP já feita dentro dele, quanto falta
+    para o próximo (`xpPerLevel`), a fração do nível e a XP que sobra além do
+    nível máximo; None para entradas inválidas.
+    """
+    if not 1 <= nivel_inicial <= NIVEL_MAXIMO or xp < 0 or not 0 <= progresso < max(1, xpPerLevel[nivel_inicial]):
+        return None
+    nivel, no_nivel, sobra = _nivel_alcancado(nivel_inicial, xp, progresso)
+    proximo = xpPerLevel[nivel]
+    return {
+        "nivel_inicial": nivel_inicial,
+        "xp": xp,
+        "nivel_final": nivel,
+        "xp_no_nivel": no_nivel,
+        "xp_para_proximo": proximo - no_nivel if proximo else 0,
+        "fracao": no_nivel / proximo if proximo else 0.0,
+        "sobra": sobra
+    }
+
+def nivel_com_pocoes(nivel_inicial, tier, pocoes, progresso=0):
+    """Nível alcançado usando as poções `pocoes` ({tamanho: quantidade}) do tier."""
+    return nivel_com_xp(nivel_inicial, xp_das_pocoes(tier, pocoes), progresso)
+
+def niveis_com_xp(niveis_iniciais, xps, progressos=None):
+    """Versão em lote de `nivel_com_xp` para listas do mesmo tamanho.
+
+    Devolve colunas (listas) em vez de um dict por consulta: nivel_final,
+    xp_no_nivel, xp_para_proximo e sobra; entradas inválidas ficam None.
+    """
+    if progressos is None:
+        progressos = [0] * len(niveis_iniciais)
+    if not len(niveis_iniciais) == len(xps) == len(progressos):
+        raise ValueError("listas de tamanhos diferentes")
+    totais, maximo = xpTotalByLevel, xpTotalByLevel[NIVEL_MAXIMO]
+    busca = bisect.bisect_right
+    finais, no_nivel, faltam, sobras = [], [], [], []
+    for ini, xp, prog in zip(niveis_iniciais, xps, progressos):
+        if not 1 <= ini <= NIVEL_MAXIMO or xp < 0 or not 0 <= prog < max(1, xpPerLevel[ini]):
+            finais.append(None)
+            no_nivel.append(None)
+            faltam.append(None)
+            sobras.append(None)
+            continue
+        total = totais[ini] + prog + xp
+        if total >= maximo:
+            finais.append(NIVEL_MAXIMO)
+            no_nivel.append(0)
+            faltam.append(0)
+            sobras.append(total - maximo)
+            continue
+        nivel = busca(totais, total, 1) - 1
+        finais.append(nivel)
+        no_nivel.append(total - totais[nivel])
+        faltam.append(totais[nivel + 1] - total)
+        sobras.append(0)
+    return {"nivel_final": finais, "xp_no_nivel": no_nivel, "xp_para_proximo": faltam, "sobra": sobras}
+
+def niveis_com_pocoes(niveis_iniciais, tier, lista_pocoes, progressos=None):
+    """Versão em lote de `nivel_com_pocoes`: uma lista de estoques de poções do tier."""
+    return niveis_com_xp(niveis_iniciais, [xp_das_pocoes(tier, p) for p in lista_pocoes], progressos)
+
+# ================= OTIMIZADOR DE POÇÕES =================
+# XP em "unidades" de poção pequena: cobrir a XP equivale a cobrir ceil(xp / pequena)
+# unidades com poções de 1, 10 e 100 unidades (Diamante: 500, 5.000 e 50.000 XP).
+OBJETIVOS_POCAO = ("custo", "quantidade", "desperdicio")
+
+def _chave_pocoes(objetivo, custo, quantidade, unidades):
+    # ordem lexicográfica de cada objetivo (unidades a mais = XP desperdiçada)
+    if objetivo == "custo":
+        return (custo, quantidade, unidades)
+    if objetivo == "quantidade":
+        return (quantidade, custo, unidades)
+    return (unidades, quantidade, custo)
+
+def _precos_pocao(precos):
+    """Preço por tamanho: sem preços cada compra custa 1; tamanho sem preço não é comprado."""
+    if not precos:
+        return (1, 1, 1)
+    return tuple(precos.get(t, math.inf) for t in TAMANHOS_POCAO)
+
+def _compra(preco, n):
+    return preco * n if n > 0 else 0
+
+def _unidades_pocao(tier):
+    xp = XP_POCAO_POR_TIER[tier]
+    return tuple(xp[t] // xp["pequena"] for t in TAMANHOS_POCAO)
+
+def _tabela_pocoes(tier, objetivo):
+    """Melhor mix sem estoque e sem preços para cada quantidade de unidades até 1→140 (programação dinâmica).
+
+    Indexada por unidades: `tabela[k]` = (grandes, médias, pequenas). Cada
+    (tier, objetivo) é montado uma vez (LRU de MAX_TABELAS_POCAO); depois
+    toda consulta (início, fim, tier) sem estoque nem preços é uma leitura O(1).
+    Consultas com preços vão direto a _resolver_pocoes: preços arbitrários
+    vindos da CLI ou do servidor não podem encher o cache.
+    """
+    chave = (tier, objetivo)
+    tabela = _tabelas_pocoes.get(chave)
+    if tabela is not None:
+        _tabelas_pocoes.move_to_end(chave)
+        return tabela
+    tamanhos = _unidades_pocao(tier)
+    maximo = -(-calcular_xp_necessaria(1, NIVEL_MAXIMO) // XP_POCAO_POR_TIER[tier]["pequena"])
+    passos = [_chave_pocoes(objetivo, preco, 1, a) for preco, a in zip(_precos_pocao(None), tamanhos)]
+    melhor = [(0, 0, 0)]
+    origem = [None]
+    for k in range(1, maximo + 1):
+        escolha = None
+        for i, a in enumerate(tamanhos):
+            anterior, passo = melhor[max(0, k - a)], passos[i]
+            valor = (anterior[0] + passo[0], anterior[1] + passo[1], anterior[2] + passo[2])
+            if escolha is None or valor < escolha[0]:
+                escolha = (valor, i)
+        melhor.append(escolha[0])
+        origem.append(escolha[1])
+    tabela = [(0, 0, 0)]
+    for k in range(1, maximo + 1):
+        i = origem[k]
+        contagem = list(tabela[max(0, k - tamanhos[i])])
+        contagem[i] += 1
+        tabela.append(tuple(contagem))
+    _tabelas_pocoes[chave] = tabela
+    if len(_tabelas_pocoes) > MAX_TABELAS_POCAO:
+        _tabelas_pocoes.popitem(last=False)
+    return tabela
+
+def _resolver_pocoes(k, tier, estoque, precos, objetivo):
+    """Mix exato com estoque para cobrir `k` unidades.
+
+    Percorre a quantidade de grandes; para cada uma, o custo em função das
+    médias é convexo (linear por partes), então basta testar os vértices:
+    0, o estoque de médias, onde as pequenas zeram e onde elas passam do estoque.
+    """
+    ug, um, _up = _unidades_pocao(tier)
+    eg, em, ep = (max(0, int(estoque.get(t, 0))) for t in TAMANHOS_POCAO)
+    pg, pm, pp = _precos_pocao(precos)
+    melhor = None
+    for g in range(-(-k // ug) + 1):
+        r = max(0, k - g * ug)
+        topo = -(-r // um)
+        candidatos = {0, topo, min(em, topo), r // um, max(0, r - ep) // um, -(-max(0, r - ep) // um)}
+        custo_g = _compra(pg, g - eg)
+        for m in candidatos:
+            if m > topo:
+                continue
+            p = max(0, r - m * um)
+            custo = custo_g + _compra(pm, m - em) + _compra(pp, p - ep)
+            if custo == math.inf:
+                # compra de tamanho sem preço: fora em qualquer objetivo (o mix só
+                # com tamanhos com preço sempre existe, então algum candidato sobra)
+                continue
+            valor = _chave_pocoes(objetivo, custo, g + m + p, g * ug + m * um + p)
+            if melhor is None or valor < melhor[0]:
+                melhor = (valor, (g, m, p))
+    if melhor is None:
+        raise ValueError("preços grandes demais: o custo não cabe num float")
+    return melhor[1]
+
+def otimizar_pocoes(nivel_inicial, nivel_final, tier, estoque=None, precos=None, objetivo="custo"):
+    """Mix de poções que garante pelo menos a XP de `nivel_inicial` até `nivel_final`.
+
+    - `estoque`: {tamanho: poções já possuídas} ("grande", "média", "pequena");
+      as do estoque são usadas sem custo.
+    - `precos`: {tamanho: berry por poção}; sem preços, cada poção comprada
+      custa 1; com preços, tamanhos sem preço só saem do estoque.
+    - `objetivo`: "custo" (menos berry, depois menos poções), "quantidade"
+      (menos poções, depois menos berry) ou "desperdicio" (menos XP sobrando).
+      Os empates seguintes são desfeitos pelos outros critérios.
+
+    Sem estoque nem preços a resposta vem de uma tabela pré-calculada (O(1));
+    nos outros casos o mix exato é calculado na hora (poucos ms). Retorna None
+    para níveis inválidos; ValueError para preço não finito ou negativo.
+    """
+    if objetivo not in OBJETIVOS_POCAO:
+        raise ValueError(f"objetivo inválido: {objetivo}")
+    xp = calcular_xp_necessaria(nivel_inicial, nivel_final)
+    if xp is None:
+        return None
+    xp_pocao = XP_POCAO_POR_TIER[tier]
+    estoque = {t: n for t, n in (estoque or {}).items() if n}
+    precos = precos or {}
+    for tamanho, preco in precos.items():
+        if not math.isfinite(preco) or preco < 0:
+            raise ValueError(f"preço inválido para {tamanho}: {preco} (deve ser finito e ≥ 0)")
+    k = -(-xp // xp_pocao["pequena"])
+    if estoque or precos:
+        contagem = _resolver_pocoes(k, tier, estoque, precos, objetivo)
+    else:
+        contagem = _tabela_pocoes(tier, objetivo)[k]
+    pocoes = dict(zip(TAMANHOS_POCAO, contagem))
+    do_estoque = {t: min(n, max(0, int(estoque.get(t, 0)))) for t, n in pocoes.items()}
+    compradas = {t: pocoes[t] - do_estoque[t] for t in TAMANHOS_POCAO}
+    xp_total = sum(n * xp_pocao[t] for t, n in pocoes.items())
+    return {
+        "tier": tier,
+        "nivel_inicial": nivel_inicial,
+        "nivel_final": nivel_final,
+        "xp": xp,
+        "objetivo": objetivo,
+        "pocoes": pocoes,
+        "do_estoque": do_estoque,
+        "compradas": compradas,
+        "custo": sum(_compra(precos.get(t, math.inf), n) for t, n in compradas.items()) if precos else 0,
+        "xp_total": xp_total,
+        "desperdicio": xp_total - xp
+    }
+
+
+# ================= RECEITAS =================
+def custo_receita(receita, qtd, valor, precos=None):
+    """Calcula custo, venda, taxa e lucro de `qtd` unidades de uma receita.
+
+    `precos` ({ingrediente: valor_unitario}) substitui os preços do catálogo.
+    Retorna um dict com a lista de ingredientes (quantidade total e custo de
+    cada um) e os totais. Lança KeyError se a receita não existir.
+    """
+    itens = []
+    custo = 0
+    precos = precos or {}
+
+    for item, val in receitas[receita].items():
+        # Novo formato: val = (quantia_por_unidade, valor_unitario)
+        if isinstance(val, (tuple, list)) and len(val) >= 2:
+            quantia_por_unidade, valor_unitario = val
+            valor_unitario = precos.get(item, valor_unitario)
+            total_quantia = quantia_por_unidade * qtd
+            try:
+                custo_item = int(total_quantia * float(valor_unitario))
+            except Exception:
+                custo_item = 0
+        else:
+            # Compatibilidade com formato antigo (valor por unidade/porção)
+            valor_unitario = None
+            try:
+                total_quantia = int(val) * qtd
+            except Exception:
+                total_quantia = 0
+            custo_item = total_quantia
+        custo += custo_item
+        itens.append({
+            "item": item,
+            "quantidade": total_quantia,
+            "valor_unitario": valor_unitario,
+            "custo": custo_item
+        })
+
+    venda = qtd * valor
+    taxa = venda * TAXA_VENDA
+    lucro = venda - custo - taxa
+
+    return {
+        "receita": receita,
+        "quantidade": qtd,
+        "valor": valor,
+        "itens": itens,
+        "custo": custo,
+        "venda": venda,
+        "taxa": taxa,
+        "lucro": lucro
+    }
+
+
+# ================= CRISTAIS =================
+def get_transfer_cost(slot, level):
+    """Retorna o custo em gemas para transferir boost do equipamento dado seu nível atual."""
+    if level <= 0:
+        return 0
+    if level <= 4:
+        key = 4
+    elif level <= 8:
+        key = 8
+    elif level <= 12:
+        key = 12
+    else:
+        key = 16
+    return TRANSFER_COSTS.get(key, {}).get(slot, 0)
+
+def expected_attempts(p, guarantee):
+    """Calcula o número esperado de tentativas até o sucesso com pity garantido na tentativa 'guarantee'."""
+    q = 1 - p
+    E = 0.0
+    # tentativa 1..guarantee-1 com prob p a cada tentativa
+    for k in range(1, guarantee):
+        E += k * (q ** (k - 1)) * p
+    # se falhar até guarantee-1, a guarantee faz com que a tentativa guarantee resulte em sucesso
+    E += guarantee * (q ** (guarantee - 1))
+    return E
+
+def expected_crystals_for_level(slot, level):
+    if level < 1:
+        return 0
+    if level > NIVEL_MAXIMO_CRISTAL:
+        # limite na tabela
+        level = NIVEL_MAXIMO_CRISTAL
+    p, guarantee = SUCCESS_TABLE[level]
+    atts = expected_attempts(p, guarantee)
+    return atts * crystals_per_up[slot]
+
+def get_crystal_type_for_level(lvl):
+    if 1 <= lvl <= 4:
+        return "Cristais do Céu"
+    if 5 <= lvl <= 8:
+        return "Cristais do Sábio"
+    if 9 <= lvl <= 12:
+        return "Cristais Carmesim"
+    return "Cristais Radiante"
+
+# ================= MATRIZ DE CUSTO (pré-computada) =================
+# Somas de prefixo por slot: prefixo[L] = custo acumulado de +0 até +L.
+# Recalculada só quando SUCCESS_TABLE ou crystals_per_up mudam.
+_matriz_cache = {"versao": None, "matriz": None}
+
+def _versao_tabelas():
+    return (tuple(sorted(SUCCESS_TABLE.items())), tuple(sorted(crystals_per_up.items())))
+
+def _construir_matriz():
+    matriz = {}
+    for slot, por_up in crystals_per_up.items():
+        media = [0.0]
+        maximo = [0]
+        tipos = {t: ([0.0], [0]) for t in cristais_tipos}
+        for lvl in range(1, NIVEL_MAXIMO_CRISTAL + 1):
+            p, guarantee = SUCCESS_TABLE[lvl]
+            avg = expected_attempts(p, guarantee) * por_up
+            max_cr = guarantee * por_up
+            media.append(media[-1] + avg)
+            maximo.append(maximo[-1] + max_cr)
+            tipo_lvl = get_crystal_type_for_level(lvl)
+            for t, (m, mx) in tipos.items():
+                m.append(m[-1] + (avg if t == tipo_lvl else 0.0))
+                mx.append(mx[-1] + (max_cr if t == tipo_lvl else 0))
+        matriz[slot] = {"media": media, "maximo": maximo, "tipos": tipos}
+    return matriz
+
+def matriz_cristais():
+    """Matriz de somas de prefixo de cristais por slot (média, pity máximo e por tipo)."""
+    versao = _versao_tabelas()
+    if _matriz_cache["versao"] != versao:
+        _matriz_cache["matriz"] = _construir_matriz()
+        _matriz_cache["versao"] = versao
+    return _matriz_cache["matriz"]
+
+def custo_cristais(slot, de, ate=NIVEL_MAXIMO_CRISTAL):
+    """Cristais para levar `slot` de +`de` até +`ate` em O(1).
+
+    Retorna um dict com a média esperada, o máximo garantido pelo pity e a
+    divisão por tipo de cristal. Lança KeyError se o slot não existir.
+    """
+    linha = matriz_cristais()[slot]
+    de = max(0, min(int(de), NIVEL_MAXIMO_CRISTAL))
+    ate = max(de, min(int(ate), NIVEL_MAXIMO_CRISTAL))
+    por_tipo = {}
+    for t, (m, mx) in linha["tipos"].items():
+        por_tipo[t] = {"media": m[ate] - m[de], "maximo": mx[ate] - mx[de]}
+    return {
+        "slot": slot,
+        "de": de,
+        "ate": ate,
+        "media": linha["media"][ate] - linha["media"][de],
+        "maximo": linha["maximo"][ate] - linha["maximo"][de],
+        "por_tipo": por_tipo
+    }
+
+def plano_cristais(slot, atual, valores=None):
+    """Plano de cristais de `slot` do nível `atual` até +16.
+
+    `valores` mapeia o tipo de cristal para o preço em berry. Retorna um dict
+    com o custo de transferência, uma linha por nível (média, faixa piso/pity
+    e custo) e os totais. Lança KeyError se o slot não existir.
+    """
+    if slot not in crystals_per_up:
+        raise KeyError(slot)
+    valores = valores or {}
+    atual = max(0, min(int(atual), NIVEL_MAXIMO_CRISTAL))
+
+    niveis = []
+    total_avg = 0.0
+    total_max = 0
+    total_cost_low = 0
+    total_cost_high = 0
+
+    # Para cada nível alvo acima do atual até 16
+    linha = matriz_cristais()[slot]
+    for lvl in range(atual + 1, NIVEL_MAXIMO_CRISTAL + 1):
+        avg = linha["media"][lvl] - linha["media"][lvl - 1]
+        max_cr = linha["maximo"][lvl] - linha["maximo"][lvl - 1]
+
+        # Formato X a Y — X: piso da média, Y: máximo garantido
+        low = int(math.floor(avg))
+        high = int(max_cr)
+
+        crystal_type = get_crystal_type_for_level(lvl)
+        valor_level = valores.get(crystal_type, 0)
+
+        cost_low = low * valor_level
+        cost_high = high * valor_level
+
+        niveis.append({
+            "nivel": lvl,
+            "tipo": crystal_type,
+            "media": avg,
+            "minimo": low,
+            "maximo": high,
+            "valor": valor_level,
+            "custo_minimo": cost_low,
+            "custo_maximo": cost_high
+        })
+
+        total_avg += avg
+        total_max += max_cr
+        total_cost_low += cost_low
+        total_cost_high += cost_high
+
+    return {
+        "slot": slot,
+        "nivel_atual": atual,
+        "gemas_transferencia": get_transfer_cost(slot, atual),
+        "niveis": niveis,
+        "total_media": total_avg,
+        "total_maximo": total_max,
+        "total_custo_minimo": total_cost_low,
+        "total_custo_maximo": total_cost_high
+    }
+
+def _tipos_vazios():
+    return {t: {"media": 0.0, "maximo": 0, "custo_medio": 0.0, "custo_maximo": 0} for t in cristais_tipos}
+
+def plano_equipamento(niveis, valores=None, alvo=NIVEL_MAXIMO_CRISTAL):
+    """Plano do conjunto inteiro: `niveis` mapeia cada slot ao seu nível atual.
+
+    Uma passada pela matriz de prefixos (O(1) por slot) devolve, por slot e no
+    total, os cristais esperados, o máximo do pity, a divisão por tipo com o
+    custo em berry (esperado e máximo, pelos `valores` de cada tipo) e as gemas
+    de transferência. Slots ausentes de `niveis` ficam fora do plano; lança
+    KeyError para slots desconhecidos.
+    """
+    valores = valores or {}
+    matriz = matriz_cristais()
+    total_tipos = _tipos_vazios()
+    total = {"media": 0.0, "maximo": 0, "custo_medio": 0.0, "custo_maximo": 0, "gemas_transferencia": 0}
+    por_slot = []
+    for slot, atual in niveis.items():
+        linha = matriz[slot]
+        de = max(0, min(int(atual), NIVEL_MAXIMO_CRISTAL))
+        ate = max(de, min(int(alvo), NIVEL_MAXIMO_CRISTAL))
+        tipos = _tipos_vazios()
+        custo_medio = 0.0
+        custo_maximo = 0
+        for t, (m, mx) in linha["tipos"].items():
+            valor = valores.get(t, 0)
+            d = tipos[t]
+            d["media"] = m[ate] - m[de]
+            d["maximo"] = mx[ate] - mx[de]
+            d["custo_medio"] = d["media"] * valor
+            d["custo_maximo"] = d["maximo"] * valor
+            custo_medio += d["custo_medio"]
+            custo_maximo += d["custo_maximo"]
+            for k in d:
+                total_tipos[t][k] += d[k]
+        p = {
+            "slot": slot,
+            "nivel_atual": de,
+            "media": linha["media"][ate] - linha["media"][de],
+            "maximo": linha["maximo"][ate] - linha["maximo"][de],
+            "por_tipo": tipos,
+            "custo_medio": custo_medio,
+            "custo_maximo": custo_maximo,
+            "gemas_transferencia": get_transfer_cost(slot, de)
+        }
+        por_slot.append(p)
+        for k in total:
+            total[k] += p[k]
+    total["por_tipo"] = total_tipos
+    return {"alvo": alvo, "slots": por_slot, "total": total}
+
+def _divergencias_max_cristais(tabela_sucesso, por_up, max_cristais):
+    """Máximo do pity de +0 a +16 por tipo e slot comparado com `max_cristais`.
+
+    Trabalha sobre tabelas ainda não aplicadas: o carregamento dos dados recusa
+    um arquivo incoerente antes de trocar as tabelas em uso.
+    """
+    calculado = {t: dict.fromkeys(por_up, 0) for t in cristais_tipos}
+    for lvl in range(1, NIVEL_MAXIMO_CRISTAL + 1):
+        tipo = get_crystal_type_for_level(lvl)
+        for slot, n in por_up.items():
+            calculado[tipo][slot] += tabela_sucesso[lvl][1] * n
+    divergencias = []
+    for tipo, por_slot in calculado.items():
+        por_slot["Total"] = sum(por_slot.values())
+        for slot, valor in por_slot.items():
+            if max_cristais[tipo].get(slot) != valor:
+                divergencias.append((tipo, slot, valor, max_cristais[tipo].get(slot)))
+    return divergencias
+
+def verificar_max_cristais():
+    """Confere o máximo do pity (de +0 a +16) com a tabela MAX_CRISTAIS.
+
+    Devolve a lista de divergências `(tipo, slot ou "Total", calculado, tabela)`;
+    lista vazia quando SUCCESS_TABLE, crystals_per_up e MAX_CRISTAIS concordam.
+    Passa pelo planejador (plano_equipamento); o carregamento dos dados faz a
+    mesma conta direto nas tabelas e o benchmarks.py roda esta antes de medir.
+    """
+    plano = plano_equipamento({s: 0 for s in slots})
+    divergencias = []
+    for tipo, por_slot in MAX_CRISTAIS.items():
+        for p in plano["slots"]:
+            calculado = p["por_tipo"][tipo]["maximo"]
+            if por_slot.get(p["slot"]) != calculado:
+                divergencias.append((tipo, p["slot"], calculado, por_slot.get(p["slot"])))
+        calculado = plano["total"]["por_tipo"][tipo]["maximo"]
+        if por_slot.get("Total") != calculado:
+            divergencias.append((tipo, "Total", calculado, por_slot.get("Total")))
+    return divergencias
+
+# ================= ORÇAMENTO (quais upgrades comprar) =================
+# Cada slot é uma cadeia de upgrades (+1 só depois de +0). Objetivo: máximo de
+# níveis (ou de valor ponderado) sem passar do orçamento em berry.
+MAX_BALDES_ORCAMENTO = 2000
+
+def _custos_upgrade(slot, de, ate, valores, criterio):
+    """Custo em berry de cada upgrade de +de+1 até +ate (média ou pity máximo)."""
+    indice = 0 if criterio == "media" else 1
+    tipos = matriz_cristais()[slot]["tipos"]
+    custos = []
+    for lvl in range(de + 1, ate + 1):
+        t = get_crystal_type_for_level(lvl)
+        prefixo = tipos[t][indice]
+        custos.append((prefixo[lvl] - prefixo[lvl - 1]) * valores.get(t, 0))
+    return custos
+
+def _pesos_upgrade(slot, peso, de, ate):
+    if peso is None:
+        return [1.0] * (ate - de)
+    try:
+        if isinstance(peso, (int, float)):
+            pesos = [float(peso)] * (ate - de)
+        else:
+            # sequência com o peso de cada nível +1..+16
+            pesos = [float(peso[lvl - 1]) for lvl in range(de + 1, ate + 1)]
+    except (TypeError, ValueError, LookupError):
+        pesos = None
+    if pesos is None or not all(math.isfinite(p) for p in pesos):
+        raise ValueError(f"pesos de {slot}: deve ser um número finito ou uma lista de {NIVEL_MAXIMO_CRISTAL} números finitos")
+    return pesos
+
+def _alocar_guloso(cadeias, orcamento):
+    """Compra sempre o próximo upgrade mais barato (heap com um candidato por slot)."""
+    fila = [(c["custos"][0], i) for i, c in enumerate(cadeias) if c["custos"]]
+    heapq.heapify(fila)
+    compras = [0] * len(cadeias)
+    while fila and fila[0][0] <= orcamento:
+        custo, i = heapq.heappop(fila)
+        orcamento -= custo
+        compras[i] += 1
+        custos = cadeias[i]["custos"]
+        if compras[i] < len(custos):
+            heapq.heappush(fila, (custos[compras[i]], i))
+    return compras
+
+def _alocar_dp(cadeias, orcamento, unidade):
+    """Mochila por grupos (cada slot escolhe quantos upgrades) sobre baldes de orçamento.
+
+    Custos arredondados para cima em `unidade`, então a escolha nunca passa do
+    orçamento real; é ótima na resolução dos baldes.
+    """
+    baldes = int(orcamento // unidade)
+    melhor = [0.0] * (baldes + 1)
+    escolhas = []
+    for c in cadeias:
+        opcoes = []
+        custo = valor = 0.0
+        for k, (ck, vk) in enumerate(zip(c["custos"], c["pesos"]), 1):
+            custo += ck
+            valor += vk
+            u = math.ceil(custo / unidade - 1e-9)
+            if u > baldes:
+                break
+            opcoes.append((k, u, valor))
+        novo = melhor[:]
+        escolha = [0] * (baldes + 1)
+        for k, u, v in opcoes:
+            for b in range(u, baldes + 1):
+                x = melhor[b - u] + v
+                if x > novo[b]:
+                    novo[b] = x
+                    escolha[b] = k
+        escolhas.append((escolha, {k: u for k, u, _ in opcoes}))
+        melhor = novo
+    # menor orçamento que já alcança o melhor valor (desempate pelo mais barato)
+    b = next(b for b in range(baldes + 1) if melhor[b] >= melhor[baldes] - 1e-9)
+    compras = [0] * len(cadeias)
+    for i in range(len(cadeias) - 1, -1, -1):
+        escolha, unidades = escolhas[i]
+        k = escolha[b]
+        compras[i] = k
+        b -= unidades.get(k, 0)
+    return compras
+
+def alocar_orcamento(orcamento, valores, niveis=None, pesos=None, criterio="media", alvo=NIVEL_MAXIMO_CRISTAL):
+    """Escolhe quais upgrades de cristal comprar com `orcamento` berry.
+
+    `valores` mapeia o tipo de cristal ao preço; `niveis` o nível atual de cada
+    slot (padrão: todos em +0); `pesos` o valor de cada nível por slot (número
+    ou sequência para +1..+16; padrão: 1, isto é, maximizar níveis). `criterio`
+    "media" usa o custo esperado e "maximo" o pior caso do pity.
+
+    Sem pesos e com custos por slot não decrescentes, o guloso por heap (sempre
+    o upgrade mais barato) é exato; nos demais casos usa mochila por grupos
+    sobre no máximo MAX_BALDES_ORCAMENTO baldes e completa a sobra com o guloso.
+
+    ValueError para orçamento não finito, preço não finito ou negativo e pesos
+    inválidos, com a mensagem dizendo qual.
+    """
+    if criterio not in ("media", "maximo"):
+        raise ValueError(f"criterio inválido: {criterio}")
+    if not math.isfinite(orcamento):
+        raise ValueError(f"orçamento inválido: {orcamento}")
+    valores = valores or {}
+    for tipo, preco in valores.items():
+        if not math.isfinite(preco) or preco < 0:
+            raise ValueError(f"preço inválido para {tipo}: {preco} (deve ser finito e ≥ 0)")
+    if niveis is None:
+        niveis = {s: 0 for s in crystals_per_up}
+    pesos = pesos or {}
+    orcamento = max(0, orcamento)
+    cadeias = []
+    for slot, atual in niveis.items():
+        if slot not in crystals_per_up:
+            raise KeyError(slot)
+        de = max(0, min(int(atual), NIVEL_MAXIMO_CRISTAL))
+        ate = max(de, min(int(alvo), NIVEL_MAXIMO_CRISTAL))
+        cadeias.append({
+            "slot": slot, "de": de,
+            "custos": _custos_upgrade(slot, de, ate, valores, criterio),
+            "pesos": _pesos_upgrade(slot, pesos.get(slot), de, ate)
+        })
+
+    custo_total = sum(sum(c["custos"]) for c in cadeias)
+    if not math.isfinite(custo_total):
+        raise ValueError("preços grandes demais: o custo total não cabe num float")
+    monotono = all(a <= b for c in cadeias for a, b in zip(c["custos"], c["custos"][1:]))
+    unidade = None
+    if custo_total <= orcamento:
+        compras = [len(c["custos"]) for c in cadeias]
+        metodo, exato = "tudo", True
+    elif not pesos and monotono:
+        compras = _alocar_guloso(cadeias, orcamento)
+        metodo, exato = "guloso", True
+    else:
+        unidade = max(1.0, orcamento / MAX_BALDES_ORCAMENTO)
+        compras = _alocar_dp(cadeias, orcamento, unidade)
+        # completa a sobra do arredondamento dos baldes com o guloso
+        restantes = [dict(c, custos=c["custos"][k:]) for c, k in zip(cadeias, compras)]
+        gasto = sum(sum(c["custos"][:k]) for c, k in zip(cadeias, compras))
+        extras = _alocar_guloso(restantes, orcamento - gasto)
+        compras = [k + e for k, e in zip(compras, extras)]
+        metodo, exato = "dp", unidade == 1.0 and all(float(x).is_integer() for c in cadeias for x in c["custos"])
+
+    por_slot = []
+    gasto = valor = 0.0
+    niveis_ganhos = 0
+    for c, k in zip(cadeias, compras):
+        custo = sum(c["custos"][:k])
+        v = sum(c["pesos"][:k])
+        por_slot.append({"slot": c["slot"], "de": c["de"], "ate": c["de"] + k,
+                         "niveis": k, "custo": custo, "valor": v})
+        gasto += custo
+        valor += v
+        niveis_ganhos += k
+    return {
+        "orcamento": orcamento,
+        "criterio": criterio,
+        "gasto": gasto,
+        "sobra": orcamento - gasto,
+        "niveis": niveis_ganhos,
+        "valor": valor,
+        "slots": por_slot,
+        "metodo": metodo,
+        "exato": exato,
+        "unidade": unidade
+    }
+
+
+# Tabelas do jogo (arquivo de dados ou o cache compilado dele)
+_aplicar_dados(carregar_dados())
@@ -0,0 +1,74 @@
+# CLI em lote do GLA Tools (sem interface gráfica)
+# Lê consultas JSON Lines (uma por linha) e escreve uma resposta JSON por linha.
+#
+# Uso:
+#   python cli.py consultas.jsonl > respostas.jsonl
+#   echo '{"tipo": "xp", "nivel_inicial": 1, "nivel_final": 70, "tier": "Ouro"}' | python cli.py
+#
+# Tipos: "xp" (nivel_inicial, nivel_final, tier), "pocoes" (nivel_inicial,
+# nivel_final, tier, estoque, precos, objetivo "custo"|"quantidade"|"desperdicio"),
+# "nivel" (nivel_inicial, xp ou pocoes {tamanho: n}, tier, progresso), "niveis"
+# (lote: listas niveis_iniciais, xps ou pocoes, progressos), "receita" (receita,
+# quantidade, valor), "cristais" (slot, nivel_atual, nivel_alvo, valores, percentis),
+# "equipamento" (niveis {slot: nível atual}, valores, nivel_alvo), "orcamento"
+# (orcamento, valores, niveis, pesos {slot: peso}, criterio "media"|"maximo").
+# O campo opcional "id" é repetido na resposta.
+
+import argparse
+import json
+import sys
+
+from consultas import responder, ConsultaInvalida
+
+
+def processar(entrada, saida, imediato=False):
+    """Processa linha a linha (memória constante); devolve (total, erros)."""
+    total = erros = 0
+    for linha in entrada:
+        linha = linha.strip()
+        if not linha:
+            continue
+        total += 1
+        ident = None
+        try:
+            consulta = json.loads(linha)
+            if isinstance(consulta, dict):
+                ident = consulta.get("id")
+            resposta = {"ok": True, "resultado": responder(consulta)}
+        except (ValueError, TypeError, OverflowError, ConsultaInvalida) as e:
+            # json.JSONDecodeError e ConsultaInvalida são ValueError; TypeError
+            # e OverflowError cobrem algum tipo ou número (1e400) inesperado que
+            # escape da validação — a linha vira erro e o lote continua
+            erros += 1
+            resposta = {"ok": False, "erro": str(e)}
+        if ident is not None:
+            resposta["id"] = ident
+        saida.write(json.dumps(resposta, ensure_ascii=False))
+        saida.write("\n")
+        if imediato:
+            saida.flush()
+    saida.flush()
+    return total, erros
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Consultas em lote (JSON Lines) do GLA Tools")
+    parser.add_argument("arquivo", nargs="?", default="-", help="arquivo .jsonl (padrão: stdin)")
+    parser.add_argument("--imediato", action="store_true",
+                        help="envia cada resposta assim que calculada (flush por linha)")
+    args = parser.parse_args(argv)
+
+    if args.arquivo == "-":
+        # stdin interativo: responde linha a linha
+        imediato = args.imediato or sys.stdin.isatty()
+        total, erros = processar(sys.stdin, sys.stdout, imediato)
+    else:
+        with open(args.arquivo, "r", encoding="utf-8") as f:
+            total, erros = processar(f, sys.stdout, args.imediato)
+    if erros:
+        sys.stderr.write(f"{erros} de {total} consultas com erro\n")
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# Persistência das configurações do app (settings.json) — sem tkinter
+# Usado pelo app e pelos benchmarks.
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+
+_AUSENTE = object()
+
+
+def ler_configuracoes(caminho):
+    """Lê o JSON de configurações; devolve {} se o arquivo não existir ou for inválido."""
+    try:
+        with open(caminho, "r", encoding="utf-8") as f:
+            dados = json.load(f)
+    except Exception:
+        return {}
+    return dados if isinstance(dados, dict) else {}
+
+
+def serializar_configuracoes(settings):
+    return json.dumps(settings, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def gravar_atomico(caminho, dados, prefixo=".settings-"):
+    """Grava `dados` (bytes) num temporário da mesma pasta e renomeia por cima do destino.
+
+    Uma queda no meio da gravação deixa o arquivo antigo intacto em vez de truncado.
+    """
+    pasta = os.path.dirname(os.path.abspath(caminho))
+    fd, tmp = tempfile.mkstemp(prefix=prefixo, suffix=".tmp", dir=pasta)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dados)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, caminho)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def gravar_configuracoes(caminho, settings):
+    """Grava as configurações em JSON legível; devolve False se não foi possível gravar."""
+    try:
+        gravar_atomico(caminho, serializar_configuracoes(settings))
+    except Exception:
+        return False
+    return True
+
+
+class Configuracoes(dict):
+    """dict de configurações que sabe o que mudou desde a última gravação.
+
+    Atribuir o mesmo valor não suja a chave; `gravar()` não faz nada sem chaves
+    sujas e, havendo, só escreve se o hash do conteúdo serializado for diferente
+    do último gravado/lido. A escrita é atômica (temporário + rename).
+    """
+    def __init__(self, caminho, padrao=None):
+        super().__init__(copy.deepcopy(padrao or {}))
+        self.caminho = caminho
+        self.sujas = set()
+        self._hash = None
+        self.gravacoes = 0
+
+    def __setitem__(self, chave, valor):
+        if self.get(chave, _AUSENTE) == valor:
+            return
+        super().__setitem__(chave, valor)
+        self.sujas.add(chave)
+
+    def __delitem__(self, chave):
+        super().__delitem__(chave)
+        self.sujas.add(chave)
+
+    def update(self, *args, **kwargs):
+        for chave, valor in dict(*args, **kwargs).items():
+            self[chave] = valor
+
+    def setdefault(self, chave, padrao=None):
+        # o valor devolvido costuma ser mutado pelo chamador (ex.: cristal_values)
+        if chave not in self:
+            super().__setitem__(chave, padrao)
+        self.sujas.add(chave)
+        return super().__getitem__(chave)
+
+    def marcar(self, chave):
+        """Marca `chave` como alterada (após mutar um valor aninhado in-place)."""
+        self.sujas.add(chave)
+
+    def carregar(self):
+        """Aplica o arquivo sobre os padrões; o estado carregado conta como gravado."""
+        self.update(ler_configuracoes(self.caminho))
+        self.sujas.clear()
+        self._hash = hashlib.sha1(serializar_configuracoes(self)).digest()
+
+    def gravar(self, forcar=False):
+        """Grava se houver mudança real; devolve True se o arquivo foi escrito."""
+        if not self.sujas and not forcar:
+            return False
+        dados = serializar_configuracoes(self)
+        h = hashlib.sha1(dados).digest()
+        if h == self._hash and not forcar:
+            self.sujas.clear()
+            return False
+        try:
+            gravar_atomico(self.caminho, dados)
+        except Exception:
+            # mantém as chaves sujas para tentar de novo na próxima gravação
+            return False
+        self.sujas.clear()
+        self._hash = h
+        self.gravacoes += 1
+        return True
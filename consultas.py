@@ -0,0 +1,234 @@
+# Consultas estruturadas (dict → dict) sobre o núcleo de cálculo
+# Usado pela CLI em lote e pelo servidor HTTP — não importa tkinter/PIL.
+
+import math
+
+from calculos import (
+    receitas, XP_POCAO_POR_TIER, crystals_per_up, NIVEL_MAXIMO_CRISTAL,
+    plano_experiencia, custo_receita, plano_cristais, custo_cristais, plano_equipamento,
+    alocar_orcamento, otimizar_pocoes, OBJETIVOS_POCAO, xp_das_pocoes, nivel_com_xp, niveis_com_xp
+)
+from distribuicao import distribuicao_cristais
+
+
+class ConsultaInvalida(ValueError):
+    """Consulta com tipo desconhecido ou parâmetros inválidos."""
+
+
+def _inteiro(consulta, chave, padrao=None):
+    valor = consulta.get(chave, padrao)
+    if valor is None:
+        raise ConsultaInvalida(f"campo obrigatório: {chave}")
+    # json aceita 1e400 e Infinity (viram inf): int(inf) seria OverflowError
+    try:
+        return int(valor)
+    except (TypeError, ValueError, OverflowError):
+        raise ConsultaInvalida(f"{chave} deve ser inteiro")
+
+
+def _texto(consulta, chave, padrao=None):
+    valor = consulta.get(chave, padrao)
+    if valor is None:
+        raise ConsultaInvalida(f"campo obrigatório: {chave}")
+    if not isinstance(valor, str):
+        raise ConsultaInvalida(f"{chave} deve ser texto")
+    return valor
+
+
+def _numero(valor):
+    """Número de verdade e finito (bool, inf e nan não contam)."""
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool) and math.isfinite(valor)
+
+
+def _valores(consulta, chave="valores"):
+    """Objeto {tipo de cristal: preço} com preços numéricos finitos e ≥ 0."""
+    valores = _objeto(consulta, chave, "{tipo: preço}")
+    for tipo, preco in valores.items():
+        if not _numero(preco) or preco < 0:
+            raise ConsultaInvalida(f"{chave}: preço de {tipo} deve ser um número ≥ 0")
+    return valores
+
+
+def _objeto(consulta, chave, descricao):
+    valor = consulta.get(chave) or {}
+    if not isinstance(valor, dict):
+        raise ConsultaInvalida(f"{chave} deve ser um objeto {descricao}")
+    return valor
+
+
+def _tier(consulta):
+    tier = _texto(consulta, "tier", "Diamante")
+    if tier not in XP_POCAO_POR_TIER:
+        raise ConsultaInvalida(f"tier desconhecido: {tier}")
+    return tier
+
+
+def consulta_xp(consulta):
+    tier = _tier(consulta)
+    ini = _inteiro(consulta, "nivel_inicial")
+    fin = _inteiro(consulta, "nivel_final")
+    plano = plano_experiencia(ini, fin, tier)
+    if plano is None:
+        raise ConsultaInvalida("nível inválido: 1 ≤ inicial < final ≤ 140")
+    return plano
+
+
+def consulta_pocoes(consulta):
+    tier = _tier(consulta)
+    objetivo = _texto(consulta, "objetivo", "custo")
+    if objetivo not in OBJETIVOS_POCAO:
+        raise ConsultaInvalida(f"objetivo deve ser um de: {', '.join(OBJETIVOS_POCAO)}")
+    estoque = _objeto(consulta, "estoque", "{tamanho: quantidade}")
+    precos = _objeto(consulta, "precos", "{tamanho: preço}")
+    for tamanho in list(estoque) + list(precos):
+        if tamanho not in XP_POCAO_POR_TIER[tier]:
+            raise ConsultaInvalida(f"tamanho de poção desconhecido: {tamanho}")
+    estoque = {t: _inteiro(estoque, t) for t in estoque}
+    if not all(_numero(v) and v >= 0 for v in precos.values()):
+        raise ConsultaInvalida("precos deve ter um número ≥ 0 por tamanho")
+    precos = {t: float(v) for t, v in precos.items()}
+    plano = otimizar_pocoes(_inteiro(consulta, "nivel_inicial"), _inteiro(consulta, "nivel_final"),
+                            tier, estoque, precos, objetivo)
+    if plano is None:
+        raise ConsultaInvalida("nível inválido: 1 ≤ inicial < final ≤ 140")
+    return plano
+
+
+def _xp_da_consulta(consulta, chave_xp, chave_pocoes, tier):
+    """XP informada diretamente ou somada de um estoque de poções do tier."""
+    if consulta.get(chave_pocoes) is not None:
+        pocoes = consulta[chave_pocoes]
+        if not isinstance(pocoes, dict):
+            raise ConsultaInvalida(f"{chave_pocoes} deve ser um objeto {{tamanho: quantidade}}")
+        for tamanho in pocoes:
+            if tamanho not in XP_POCAO_POR_TIER[tier]:
+                raise ConsultaInvalida(f"tamanho de poção desconhecido: {tamanho}")
+        return xp_das_pocoes(tier, {t: _inteiro(pocoes, t) for t in pocoes})
+    return _inteiro(consulta, chave_xp)
+
+
+def consulta_nivel(consulta):
+    xp = _xp_da_consulta(consulta, "xp", "pocoes", _tier(consulta))
+    resultado = nivel_com_xp(_inteiro(consulta, "nivel_inicial"), xp, _inteiro(consulta, "progresso", 0))
+    if resultado is None:
+        raise ConsultaInvalida("entrada inválida: 1 ≤ nível ≤ 140, xp ≥ 0 e progresso menor que o nível")
+    return resultado
+
+
+def consulta_niveis(consulta):
+    """Lote: listas `niveis_iniciais` e `xps` (ou `pocoes`, uma por entrada) do mesmo tamanho."""
+    tier = _tier(consulta)
+    iniciais = consulta.get("niveis_iniciais")
+    if not isinstance(iniciais, list):
+        raise ConsultaInvalida("niveis_iniciais deve ser uma lista")
+    if consulta.get("pocoes") is not None:
+        lista = consulta["pocoes"]
+        if not isinstance(lista, list):
+            raise ConsultaInvalida("pocoes deve ser uma lista de objetos {tamanho: quantidade}")
+        xps = [_xp_da_consulta({"pocoes": p}, "xp", "pocoes", tier) for p in lista]
+    else:
+        xps = consulta.get("xps")
+        if not isinstance(xps, list):
+            raise ConsultaInvalida("xps deve ser uma lista")
+    progressos = consulta.get("progressos")
+    if progressos is not None and not isinstance(progressos, list):
+        raise ConsultaInvalida("progressos deve ser uma lista")
+    try:
+        iniciais = [int(n) for n in iniciais]
+        xps = [int(x) for x in xps]
+        if progressos is not None:
+            progressos = [int(p) for p in progressos]
+        return niveis_com_xp(iniciais, xps, progressos)
+    except (TypeError, ValueError, OverflowError):
+        raise ConsultaInvalida("listas de inteiros com o mesmo tamanho")
+
+
+def consulta_receita(consulta):
+    receita = _texto(consulta, "receita")
+    if receita not in receitas:
+        raise ConsultaInvalida(f"receita desconhecida: {receita}")
+    qtd = _inteiro(consulta, "quantidade", 1)
+    valor = _inteiro(consulta, "valor", 0)
+    return custo_receita(receita, qtd, valor)
+
+
+def consulta_cristais(consulta):
+    slot = _texto(consulta, "slot")
+    if slot not in crystals_per_up:
+        raise ConsultaInvalida(f"slot desconhecido: {slot}")
+    atual = _inteiro(consulta, "nivel_atual", 0)
+    alvo = _inteiro(consulta, "nivel_alvo", NIVEL_MAXIMO_CRISTAL)
+    valores = _valores(consulta)
+    plano = plano_cristais(slot, atual, valores)
+    # limita o plano ao nível alvo, quando pedido
+    if alvo < NIVEL_MAXIMO_CRISTAL:
+        niveis = [n for n in plano["niveis"] if n["nivel"] <= alvo]
+        plano["niveis"] = niveis
+        plano["total_media"] = custo_cristais(slot, plano["nivel_atual"], alvo)["media"]
+        plano["total_maximo"] = sum(n["maximo"] for n in niveis)
+        plano["total_custo_minimo"] = sum(n["custo_minimo"] for n in niveis)
+        plano["total_custo_maximo"] = sum(n["custo_maximo"] for n in niveis)
+    if consulta.get("percentis"):
+        plano["distribuicao"] = distribuicao_cristais(slot, plano["nivel_atual"], alvo).resumo()
+    return plano
+
+
+def consulta_equipamento(consulta):
+    niveis = consulta.get("niveis")
+    if not isinstance(niveis, dict) or not niveis:
+        raise ConsultaInvalida("niveis deve ser um objeto {slot: nível atual}")
+    for slot in niveis:
+        if slot not in crystals_per_up:
+            raise ConsultaInvalida(f"slot desconhecido: {slot}")
+    niveis = {slot: _inteiro(niveis, slot) for slot in niveis}
+    return plano_equipamento(niveis, _valores(consulta), _inteiro(consulta, "nivel_alvo", NIVEL_MAXIMO_CRISTAL))
+
+
+def consulta_orcamento(consulta):
+    try:
+        orcamento = float(consulta.get("orcamento"))
+    except (TypeError, ValueError):
+        raise ConsultaInvalida("orcamento deve ser um número (berry)")
+    if not math.isfinite(orcamento):
+        raise ConsultaInvalida("orcamento deve ser um número finito (berry)")
+    niveis = _objeto(consulta, "niveis", "{slot: nível atual}")
+    pesos = _objeto(consulta, "pesos", "{slot: peso por nível}")
+    for slot in list(niveis) + list(pesos):
+        if slot not in crystals_per_up:
+            raise ConsultaInvalida(f"slot desconhecido: {slot}")
+    niveis = {slot: _inteiro(niveis, slot) for slot in niveis} or None
+    criterio = consulta.get("criterio", "media")
+    if criterio not in ("media", "maximo"):
+        raise ConsultaInvalida("criterio deve ser \"media\" ou \"maximo\"")
+    valores = _valores(consulta)
+    alvo = _inteiro(consulta, "nivel_alvo", NIVEL_MAXIMO_CRISTAL)
+    try:
+        return alocar_orcamento(orcamento, valores, niveis, pesos, criterio, alvo)
+    except ValueError as e:
+        # alocar_orcamento diz o que está errado (preço, orçamento ou pesos de um slot)
+        raise ConsultaInvalida(str(e))
+
+
+TIPOS_CONSULTA = {
+    "xp": consulta_xp,
+    "pocoes": consulta_pocoes,
+    "nivel": consulta_nivel,
+    "niveis": consulta_niveis,
+    "receita": consulta_receita,
+    "cristais": consulta_cristais,
+    "equipamento": consulta_equipamento,
+    "orcamento": consulta_orcamento
+}
+
+
+def responder(consulta):
+    """Responde uma consulta `{"tipo": "xp"|"pocoes"|"nivel"|"niveis"|"receita"|"cristais"|"equipamento"|"orcamento", ...}`.
+
+    Lança ConsultaInvalida para tipos ou parâmetros inválidos.
+    """
+    if not isinstance(consulta, dict):
+        raise ConsultaInvalida("consulta deve ser um objeto JSON")
+    func = TIPOS_CONSULTA.get(consulta.get("tipo"))
+    if func is None:
+        raise ConsultaInvalida(f"tipo desconhecido: {consulta.get('tipo')}")
+    return func(consulta)
@@ -0,0 +1,3 @@
+/* Gerado por web_dados.py a partir de assets/dados_jogo.json — não editar */
+const GLA_DADOS = {"versao":1,"hash":"dd984762783e612f21e1854e8c167de0b63c7c7769db9425353cff6f294377a8","xp_total":[0,0,98,199,388,790,1498,2565,4176,6397,9230,12956,17596,23083,29830,37795,46824,57498,69694,83153,98660,115993,134770,156016,179392,204375,232266,262591,294668,330110,368290,408349,452248,499189,548118,601744,658352,717039,780570,847751,917084,991790,1070450,1151317,1238104,1329149,1422438,1522212,1626548,1733147,1846814,1965347,2086144,2214610,2348246,2484129,2628300,2777945,2929802,3090584,3257144,3425863,3604162,3788543,3975012,4171734,4374842,4579949,4796000,5018741,5243374,5479660,5722940,5967987,6225414,6490139,6756488,7035962,7323038,7611577,7914004,8224337,8535954,8862240,9196736,9532319,9883370,10242935,10603372,10980094,11365634,11751813,12155112,12567533,12980342,13411124,13851332,14291659,14750830,15219731,15688464,16176930,16675430,17173457,17692124,18221129,18749338,19299112,19859528,20418807,21000594,21593327,22184564,22799270,23425226,24049309,24697840,25357925,26015742,26699004,27394124,28086563,28805462,29536523,30264472,31019914,31787822,32552169,33345060,34150721,34952354,35783600,36627920,37467727,38338234,39222119,40100988,41011662,41936018,42854837,43806584],"xp_pocao":{"Diamante":{"grande":50000,"media":5000,"pequena":500},"Ouro":{"grande":100000,"media":10000,"pequena":1000},"Prata":{"grande":200000,"media":20000,"pequena":2000},"Bronze":{"grande":300000,"media":30000,"pequena":3000}},"taxa_venda":0.03,"receitas":{"Paella de Camarão":{"Camarão Cru":[8,300],"Folhas Verdes":[1,15],"Tomates":[1,10],"Água":[3,5],"Trufa Branca":[3,250],"Sal":[1,10],"Pimenta":[1,15],"Arroz":[2,10],"Azeite":[1,15]},"Frango Teriyaki":{"Galinha":[5,300],"Pimenta":[1,15],"Tomates":[3,10],"Sal":[2,10],"Azeite":[6,15],"Folhas Verdes":[3,15],"Alho":[3,10],"Trufa Branca":[3,250],"Creme de Leite":[3,20]}},"slots":["Emblema","Capacete","Calça","Peito","Arma","Colar"],"cristais_por_up":{"Emblema":2,"Capacete":2,"Calça":2,"Peito":4,"Arma":4,"Colar":4},"tipos_cristal":["Cristais do Céu","Cristais do Sábio","Cristais Carmesim","Cristais Radiante"],"tipo_cristal":[null,"Cristais do Céu","Cristais do Céu","Cristais do Céu","Cristais do Céu","Cristais do Sábio","Cristais do Sábio","Cristais do Sábio","Cristais do Sábio","Cristais Carmesim","Cristais Carmesim","Cristais Carmesim","Cristais Carmesim","Cristais Radiante","Cristais Radiante","Cristais Radiante","Cristais Radiante"],"cristais":{"Emblema":{"niveis":[{"tipo":"Cristais do Céu","media":4.145,"minimo":4,"maximo":6},{"tipo":"Cristais do Céu","media":5.065999999999999,"minimo":5,"maximo":8},{"tipo":"Cristais do Céu","media":6.1015625,"minimo":6,"maximo":10},{"tipo":"Cristais do Céu","media":7.37856,"minimo":7,"maximo":12},{"tipo":"Cristais do Sábio","media":6.4662051200000015,"minimo":6,"maximo":10},{"tipo":"Cristais do Sábio","media":7.733259206400003,"minimo":7,"maximo":12},{"tipo":"Cristais do Sábio","media":10.011172469905922,"minimo":10,"maximo":16},{"tipo":"Cristais do Sábio","media":13.723788078200002,"minimo":13,"maximo":22},{"tipo":"Cristais Carmesim","media":13.723788078200002,"minimo":13,"maximo":22},{"tipo":"Cristais Carmesim","media":15.056100279697674,"minimo":15,"maximo":24},{"tipo":"Cristais Carmesim","media":16.54367308393772,"minimo":16,"maximo":26},{"tipo":"Cristais Carmesim","media":18.951403941382438,"minimo":18,"maximo":30},{"tipo":"Cristais Radiante","media":21.690672220531496,"minimo":21,"maximo":34},{"tipo":"Cristais Radiante","media":26.377534948475358,"minimo":26,"maximo":42},{"tipo":"Cristais Radiante","media":32.70095759081511,"minimo":32,"maximo":52},{"tipo":"Cristais Radiante","media":42.999421697304314,"minimo":42,"maximo":68}],"total_media":[248.66909921485004,244.52409921485003,239.45809921485005,233.35653671485005,225.97797671485003,219.51177159485005,211.77851238845003,201.7673399185441,188.04355184034412,174.3197637621441,159.26366348244642,142.7199903985087,123.76858645712628,102.07791423659478,75.70037928811942,42.999421697304314,0.0],"total_maximo":[394,388,380,370,358,348,336,320,298,276,252,226,196,162,120,68,0],"transferencia":[0,1,1,1,1,3,3,3,3,6,6,6,6,10,10,10,10]},"Capacete":{"niveis":[{"tipo":"Cristais do Céu","media":4.145,"minimo":4,"maximo":6},{"tipo":"Cristais do Céu","media":5.065999999999999,"minimo":5,"maximo":8},{"tipo":"Cristais do Céu","media":6.1015625,"minimo":6,"maximo":10},{"tipo":"Cristais do Céu","media":7.37856,"minimo":7,"maximo":12},{"tipo":"Cristais do Sábio","media":6.4662051200000015,"minimo":6,"maximo":10},{"tipo":"Cristais do Sábio","media":7.733259206400003,"minimo":7,"maximo":12},{"tipo":"Cristais do Sábio","media":10.011172469905922,"minimo":10,"maximo":16},{"tipo":"Cristais do Sábio","media":13.723788078200002,"minimo":13,"maximo":22},{"tipo":"Cristais Carmesim","media":13.723788078200002,"minimo":13,"maximo":22},{"tipo":"Cristais Carmesim","media":15.056100279697674,"minimo":15,"maximo":24},{"tipo":"Cristais Carmesim","media":16.54367308393772,"minimo":16,"maximo":26},{"tipo":"Cristais Carmesim","media":18.951403941382438,"minimo":18,"maximo":30},{"tipo":"Cristais Radiante","media":21.690672220531496,"minimo":21,"maximo":34},{"tipo":"Cristais Radiante","media":26.377534948475358,"minimo":26,"maximo":42},{"tipo":"Cristais Radiante","media":32.70095759081511,"minimo":32,"maximo":52},{"tipo":"Cristais Radiante","media":42.999421697304314,"minimo":42,"maximo":68}],"total_media":[248.66909921485004,244.52409921485003,239.45809921485005,233.35653671485005,225.97797671485003,219.51177159485005,211.77851238845003,201.7673399185441,188.04355184034412,174.3197637621441,159.26366348244642,142.7199903985087,123.76858645712628,102.07791423659478,75.70037928811942,42.999421697304314,0.0],"total_maximo":[394,388,380,370,358,348,336,320,298,276,252,226,196,162,120,68,0],"transferencia":[0,1,1,1,1,3,3,3,3,6,6,6,6,10,10,10,10]},"Calça":{"niveis":[{"tipo":"Cristais do Céu","media":4.145,"minimo":4,"maximo":6},{"tipo":"Cristais do Céu","media":5.065999999999999,"minimo":5,"maximo":8},{"tipo":"Cristais do Céu","media":6.1015625,"minimo":6,"maximo":10},{"tipo":"Cristais do Céu","media":7.37856,"minimo":7,"maximo":12},{"tipo":"Cristais do Sábio","media":6.4662051200000015,"minimo":6,"maximo":10},{"tipo":"Cristais do Sábio","media":7.733259206400003,"minimo":7,"maximo":12},{"tipo":"Cristais do Sábio","media":10.011172469905922,"minimo":10,"maximo":16},{"tipo":"Cristais do Sábio","media":13.723788078200002,"minimo":13,"maximo":22},{"tipo":"Cristais Carmesim","media":13.723788078200002,"minimo":13,"maximo":22},{"tipo":"Cristais Carmesim","media":15.056100279697674,"minimo":15,"maximo":24},{"tipo":"Cristais Carmesim","media":16.54367308393772,"minimo":16,"maximo":26},{"tipo":"Cristais Carmesim","media":18.951403941382438,"minimo":18,"maximo":30},{"tipo":"Cristais Radiante","media":21.690672220531496,"minimo":21,"maximo":34},{"tipo":"Cristais Radiante","media":26.377534948475358,"minimo":26,"maximo":42},{"tipo":"Cristais Radiante","media":32.70095759081511,"minimo":32,"maximo":52},{"tipo":"Cristais Radiante","media":42.999421697304314,"minimo":42,"maximo":68}],"total_media":[248.66909921485004,244.52409921485003,239.45809921485005,233.35653671485005,225.97797671485003,219.51177159485005,211.77851238845003,201.7673399185441,188.04355184034412,174.3197637621441,159.26366348244642,142.7199903985087,123.76858645712628,102.07791423659478,75.70037928811942,42.999421697304314,0.0],"total_maximo":[394,388,380,370,358,348,336,320,298,276,252,226,196,162,120,68,0],"transferencia":[0,1,1,1,1,3,3,3,3,6,6,6,6,10,10,10,10]},"Peito":{"niveis":[{"tipo":"Cristais do Céu","media":8.29,"minimo":8,"maximo":12},{"tipo":"Cristais do Céu","media":10.131999999999998,"minimo":10,"maximo":16},{"tipo":"Cristais do Céu","media":12.203125,"minimo":12,"maximo":20},{"tipo":"Cristais do Céu","media":14.75712,"minimo":14,"maximo":24},{"tipo":"Cristais do Sábio","media":12.932410240000003,"minimo":12,"maximo":20},{"tipo":"Cristais do Sábio","media":15.466518412800006,"minimo":15,"maximo":24},{"tipo":"Cristais do Sábio","media":20.022344939811845,"minimo":20,"maximo":32},{"tipo":"Cristais do Sábio","media":27.447576156400004,"minimo":27,"maximo":44},{"tipo":"Cristais Carmesim","media":27.447576156400004,"minimo":27,"maximo":44},{"tipo":"Cristais Carmesim","media":30.112200559395347,"minimo":30,"maximo":48},{"tipo":"Cristais Carmesim","media":33.08734616787544,"minimo":33,"maximo":52},{"tipo":"Cristais Carmesim","media":37.902807882764876,"minimo":37,"maximo":60},{"tipo":"Cristais Radiante","media":43.38134444106299,"minimo":43,"maximo":68},{"tipo":"Cristais Radiante","media":52.755069896950715,"minimo":52,"maximo":84},{"tipo":"Cristais Radiante","media":65.40191518163022,"minimo":65,"maximo":104},{"tipo":"Cristais Radiante","media":85.99884339460863,"minimo":85,"maximo":136}],"total_media":[497.33819842970007,489.04819842970005,478.9161984297001,466.7130734297001,451.95595342970006,439.0235431897001,423.55702477690005,403.5346798370882,376.08710368068824,348.6395275242882,318.52732696489284,285.4399807970174,247.53717291425255,204.15582847318956,151.40075857623884,85.99884339460863,0.0],"total_maximo":[788,776,760,740,716,696,672,640,596,552,504,452,392,324,240,136,0],"transferencia":[0,2,2,2,2,5,5,5,5,10,10,10,10,15,15,15,15]},"Arma":{"niveis":[{"tipo":"Cristais do Céu","media":8.29,"minimo":8,"maximo":12},{"tipo":"Cristais do Céu","media":10.131999999999998,"minimo":10,"maximo":16},{"tipo":"Cristais do Céu","media":12.203125,"minimo":12,"maximo":20},{"tipo":"Cristais do Céu","media":14.75712,"minimo":14,"maximo":24},{"tipo":"Cristais do Sábio","media":12.932410240000003,"minimo":12,"maximo":20},{"tipo":"Cristais do Sábio","media":15.466518412800006,"minimo":15,"maximo":24},{"tipo":"Cristais do Sábio","media":20.022344939811845,"minimo":20,"maximo":32},{"tipo":"Cristais do Sábio","media":27.447576156400004,"minimo":27,"maximo":44},{"tipo":"Cristais Carmesim","media":27.447576156400004,"minimo":27,"maximo":44},{"tipo":"Cristais Carmesim","media":30.112200559395347,"minimo":30,"maximo":48},{"tipo":"Cristais Carmesim","media":33.08734616787544,"minimo":33,"maximo":52},{"tipo":"Cristais Carmesim","media":37.902807882764876,"minimo":37,"maximo":60},{"tipo":"Cristais Radiante","media":43.38134444106299,"minimo":43,"maximo":68},{"tipo":"Cristais Radiante","media":52.755069896950715,"minimo":52,"maximo":84},{"tipo":"Cristais Radiante","media":65.40191518163022,"minimo":65,"maximo":104},{"tipo":"Cristais Radiante","media":85.99884339460863,"minimo":85,"maximo":136}],"total_media":[497.33819842970007,489.04819842970005,478.9161984297001,466.7130734297001,451.95595342970006,439.0235431897001,423.55702477690005,403.5346798370882,376.08710368068824,348.6395275242882,318.52732696489284,285.4399807970174,247.53717291425255,204.15582847318956,151.40075857623884,85.99884339460863,0.0],"total_maximo":[788,776,760,740,716,696,672,640,596,552,504,452,392,324,240,136,0],"transferencia":[0,2,2,2,2,5,5,5,5,10,10,10,10,15,15,15,15]},"Colar":{"niveis":[{"tipo":"Cristais do Céu","media":8.29,"minimo":8,"maximo":12},{"tipo":"Cristais do Céu","media":10.131999999999998,"minimo":10,"maximo":16},{"tipo":"Cristais do Céu","media":12.203125,"minimo":12,"maximo":20},{"tipo":"Cristais do Céu","media":14.75712,"minimo":14,"maximo":24},{"tipo":"Cristais do Sábio","media":12.932410240000003,"minimo":12,"maximo":20},{"tipo":"Cristais do Sábio","media":15.466518412800006,"minimo":15,"maximo":24},{"tipo":"Cristais do Sábio","media":20.022344939811845,"minimo":20,"maximo":32},{"tipo":"Cristais do Sábio","media":27.447576156400004,"minimo":27,"maximo":44},{"tipo":"Cristais Carmesim","media":27.447576156400004,"minimo":27,"maximo":44},{"tipo":"Cristais Carmesim","media":30.112200559395347,"minimo":30,"maximo":48},{"tipo":"Cristais Carmesim","media":33.08734616787544,"minimo":33,"maximo":52},{"tipo":"Cristais Carmesim","media":37.902807882764876,"minimo":37,"maximo":60},{"tipo":"Cristais Radiante","media":43.38134444106299,"minimo":43,"maximo":68},{"tipo":"Cristais Radiante","media":52.755069896950715,"minimo":52,"maximo":84},{"tipo":"Cristais Radiante","media":65.40191518163022,"minimo":65,"maximo":104},{"tipo":"Cristais Radiante","media":85.99884339460863,"minimo":85,"maximo":136}],"total_media":[497.33819842970007,489.04819842970005,478.9161984297001,466.7130734297001,451.95595342970006,439.0235431897001,423.55702477690005,403.5346798370882,376.08710368068824,348.6395275242882,318.52732696489284,285.4399807970174,247.53717291425255,204.15582847318956,151.40075857623884,85.99884339460863,0.0],"total_maximo":[788,776,760,740,716,696,672,640,596,552,504,452,392,324,240,136,0],"transferencia":[0,2,2,2,2,5,5,5,5,10,10,10,10,15,15,15,15]}},"sprites_equip":{"Emblema":"equip-emblema","Capacete":"equip-capacete","Calça":"equip-calca","Peito":"equip-peito","Arma":"equip-arma","Colar":"equip-colar"}};
+if(typeof module !== 'undefined') module.exports = GLA_DADOS;
@@ -0,0 +1,294 @@
+# Dados do jogo (XP, poções, cristais, receitas) em arquivo versionado
+# assets/dados_jogo.json — um patch de balanceamento é só trocar esse arquivo.
+#
+# O JSON é validado uma vez e compilado para a forma usada pelo núcleo (tabelas
+# de XP em array('q'), chaves numéricas já convertidas). A forma compilada fica
+# em cache no disco, chaveada pelo hash do conteúdo: inicializações seguintes
+# leem o cache (marshal) e pulam o parse e a validação.
+#
+# GLA_DADOS_JOGO aponta para outro arquivo de dados; GLA_CACHE para outra pasta
+# de cache. O recarregamento a quente fica em calculos.recarregar_se_mudou().
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+from array import array
+
+from configuracoes import gravar_atomico
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_DADOS = os.path.join(BASE_DIR, "assets", "dados_jogo.json")
+VARIAVEL_DADOS = "GLA_DADOS_JOGO"
+VARIAVEL_CACHE = "GLA_CACHE"
+
+FORMATO = 1
+FORMATO_CACHE = 1
+MAGICO_CACHE = b"GLADAD1"
+# compilações guardadas (app e servidor podem usar arquivos de dados diferentes)
+MAX_ARQUIVOS_CACHE = 4
+
+NIVEL_MAXIMO = 140
+NIVEL_MAXIMO_CRISTAL = 16
+# níveis-teto das faixas de custo de transferência
+FAIXAS_TRANSFERENCIA = (4, 8, 12, 16)
+TAMANHOS_POCAO = ("grande", "média", "pequena")
+
+
+class DadosInvalidos(ValueError):
+    """Arquivo de dados ilegível ou que não passou na validação (`erros` lista os problemas)."""
+    def __init__(self, erros):
+        self.erros = list(erros)
+        super().__init__("dados do jogo inválidos: " + "; ".join(self.erros[:5])
+                         + (f" (+{len(self.erros) - 5})" if len(self.erros) > 5 else ""))
+
+
+def caminho_padrao():
+    return os.environ.get(VARIAVEL_DADOS) or ARQUIVO_DADOS
+
+
+def pasta_cache():
+    pasta = os.environ.get(VARIAVEL_CACHE)
+    if pasta:
+        return pasta
+    if sys.platform == "win32":
+        raiz = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        raiz = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(raiz, "gla-tools")
+
+
+# ================= VALIDAÇÃO =================
+def _inteiro(valor):
+    return isinstance(valor, int) and not isinstance(valor, bool)
+
+
+def _numero(valor):
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+
+def _validar_xp(bruto, erros):
+    por_nivel = bruto.get("xp_por_nivel")
+    total = bruto.get("xp_total_por_nivel")
+    for nome, tabela in (("xp_por_nivel", por_nivel), ("xp_total_por_nivel", total)):
+        if not isinstance(tabela, list) or len(tabela) != NIVEL_MAXIMO + 1:
+            erros.append(f"{nome} deve ter {NIVEL_MAXIMO + 1} valores (índice 0..{NIVEL_MAXIMO})")
+            return
+        if not all(_inteiro(v) and v >= 0 for v in tabela):
+            erros.append(f"{nome} deve ter só inteiros ≥ 0")
+            return
+    if total[0] != 0 or total[1] != 0:
+        erros.append("xp_total_por_nivel[0] e [1] devem ser 0")
+    for nivel in range(1, NIVEL_MAXIMO):
+        if total[nivel + 1] <= total[nivel]:
+            erros.append(f"xp_total_por_nivel não é crescente no nível {nivel + 1}")
+            break
+    for nivel in range(1, NIVEL_MAXIMO):
+        if por_nivel[nivel] != total[nivel + 1] - total[nivel]:
+            erros.append(f"xp_por_nivel[{nivel}] difere de xp_total_por_nivel[{nivel + 1}] - [{nivel}]")
+            break
+    if por_nivel[NIVEL_MAXIMO] != 0:
+        erros.append(f"xp_por_nivel[{NIVEL_MAXIMO}] deve ser 0 (nível máximo)")
+
+
+def _validar_pocoes(bruto, erros):
+    tiers = bruto.get("xp_pocao_por_tier")
+    if not isinstance(tiers, dict) or not tiers:
+        erros.append("xp_pocao_por_tier deve ser um objeto {tier: {tamanho: xp}}")
+        return
+    for tier, pocoes in tiers.items():
+        if not isinstance(pocoes, dict) or set(pocoes) != set(TAMANHOS_POCAO):
+            erros.append(f"xp_pocao_por_tier[{tier}] deve ter exatamente {', '.join(TAMANHOS_POCAO)}")
+            continue
+        if not all(_inteiro(v) and v > 0 for v in pocoes.values()):
+            erros.append(f"xp_pocao_por_tier[{tier}]: XP das poções deve ser inteira > 0")
+            continue
+        # o otimizador trabalha em unidades de poção pequena
+        if pocoes["grande"] % pocoes["pequena"] or pocoes["média"] % pocoes["pequena"]:
+            erros.append(f"xp_pocao_por_tier[{tier}]: grande e média devem ser múltiplos da pequena")
+
+
+def _validar_cristais(bruto, erros):
+    por_up = bruto.get("cristais_por_up")
+    if not isinstance(por_up, dict) or not por_up or not all(_inteiro(v) and v > 0 for v in por_up.values()):
+        erros.append("cristais_por_up deve ser um objeto {slot: inteiro > 0}")
+        return
+    slots = set(por_up)
+
+    sucesso = bruto.get("tabela_sucesso")
+    esperadas = {str(n) for n in range(1, NIVEL_MAXIMO_CRISTAL + 1)}
+    if not isinstance(sucesso, dict) or set(sucesso) != esperadas:
+        erros.append(f"tabela_sucesso deve ter os níveis 1..{NIVEL_MAXIMO_CRISTAL}")
+    else:
+        for nivel, linha in sucesso.items():
+            if not isinstance(linha, list) or len(linha) != 2:
+                erros.append(f"tabela_sucesso[{nivel}] deve ser [chance, pity]")
+                continue
+            chance, pity = linha
+            if not _numero(chance) or not 0 < chance <= 1:
+                erros.append(f"tabela_sucesso[{nivel}]: chance {chance!r} fora de (0, 1]")
+            if not _inteiro(pity) or pity < 1:
+                erros.append(f"tabela_sucesso[{nivel}]: pity {pity!r} deve ser inteiro ≥ 1")
+
+    transferencia = bruto.get("custo_transferencia")
+    if not isinstance(transferencia, dict) or set(transferencia) != {str(f) for f in FAIXAS_TRANSFERENCIA}:
+        erros.append(f"custo_transferencia deve ter as faixas {', '.join(map(str, FAIXAS_TRANSFERENCIA))}")
+    else:
+        for faixa, custos in transferencia.items():
+            if not isinstance(custos, dict) or set(custos) != slots \
+                    or not all(_inteiro(v) and v >= 0 for v in custos.values()):
+                erros.append(f"custo_transferencia[{faixa}] deve ter um inteiro ≥ 0 por slot")
+
+    maximos = bruto.get("max_cristais")
+    if not isinstance(maximos, dict) or not maximos:
+        erros.append("max_cristais deve ser um objeto {tipo: {slot: máximo, Total: soma}}")
+        return
+    for tipo, por_slot in maximos.items():
+        if not isinstance(por_slot, dict) or set(por_slot) != slots | {"Total"} \
+                or not all(_inteiro(v) and v >= 0 for v in por_slot.values()):
+            erros.append(f"max_cristais[{tipo}] deve ter um inteiro ≥ 0 por slot e o Total")
+        elif por_slot["Total"] != sum(v for s, v in por_slot.items() if s != "Total"):
+            erros.append(f"max_cristais[{tipo}]: Total difere da soma dos slots")
+
+
+def _validar_receitas(bruto, erros):
+    receitas = bruto.get("receitas")
+    if not isinstance(receitas, dict) or not receitas:
+        erros.append("receitas deve ser um objeto {receita: {ingrediente: [quantia, valor]}}")
+        return
+    for receita, ingredientes in receitas.items():
+        if not isinstance(ingredientes, dict) or not ingredientes:
+            erros.append(f"receitas[{receita}] não tem ingredientes")
+            continue
+        for item, linha in ingredientes.items():
+            if not isinstance(linha, list) or len(linha) != 2 or not _inteiro(linha[0]) or linha[0] <= 0 \
+                    or not _numero(linha[1]) or linha[1] < 0:
+                erros.append(f"receitas[{receita}][{item}] deve ser [quantia inteira > 0, valor ≥ 0]")
+
+
+def validar(bruto):
+    """Confere a estrutura e as regras do jogo; lança DadosInvalidos com todos os problemas."""
+    if not isinstance(bruto, dict):
+        raise DadosInvalidos(["o arquivo deve conter um objeto JSON"])
+    erros = []
+    if bruto.get("formato") != FORMATO:
+        erros.append(f"formato {bruto.get('formato')!r} não suportado (esperado {FORMATO})")
+    if not isinstance(bruto.get("versao"), (int, str)) or isinstance(bruto.get("versao"), bool):
+        erros.append("versao deve ser número ou texto")
+    _validar_xp(bruto, erros)
+    _validar_pocoes(bruto, erros)
+    _validar_cristais(bruto, erros)
+    _validar_receitas(bruto, erros)
+    if erros:
+        raise DadosInvalidos(erros)
+
+
+# ================= FORMA COMPILADA =================
+def compilar(bruto, hash_conteudo):
+    """Forma usada pelo núcleo: chaves numéricas convertidas, tuplas e arrays compactos."""
+    return {
+        "versao": bruto["versao"],
+        "hash": hash_conteudo,
+        "xp_por_nivel": array("q", bruto["xp_por_nivel"]),
+        "xp_total_por_nivel": array("q", bruto["xp_total_por_nivel"]),
+        "xp_pocao_por_tier": {t: {k: p[k] for k in TAMANHOS_POCAO} for t, p in bruto["xp_pocao_por_tier"].items()},
+        "cristais_por_up": dict(bruto["cristais_por_up"]),
+        "tabela_sucesso": {int(n): (float(c), p) for n, (c, p) in
+                           sorted(bruto["tabela_sucesso"].items(), key=lambda kv: int(kv[0]))},
+        "custo_transferencia": {int(f): dict(c) for f, c in
+                                sorted(bruto["custo_transferencia"].items(), key=lambda kv: int(kv[0]))},
+        "max_cristais": {t: dict(m) for t, m in bruto["max_cristais"].items()},
+        "receitas": {r: {i: (q, v) for i, (q, v) in ing.items()} for r, ing in bruto["receitas"].items()}
+    }
+
+
+def _arquivo_cache(hash_conteudo):
+    return os.path.join(pasta_cache(), f"dados_jogo-{hash_conteudo[:32]}.bin")
+
+
+def _ler_cache(hash_conteudo):
+    try:
+        with open(_arquivo_cache(hash_conteudo), "rb") as f:
+            cabecalho, dados = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if cabecalho != (MAGICO_CACHE, FORMATO_CACHE, marshal.version, hash_conteudo):
+        return None
+    for chave in ("xp_por_nivel", "xp_total_por_nivel"):
+        tabela = array("q")
+        tabela.frombytes(dados[chave])
+        dados[chave] = tabela
+    return dados
+
+
+def _gravar_cache(dados):
+    serial = dict(dados)
+    for chave in ("xp_por_nivel", "xp_total_por_nivel"):
+        serial[chave] = dados[chave].tobytes()
+    destino = _arquivo_cache(dados["hash"])
+    try:
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        cabecalho = (MAGICO_CACHE, FORMATO_CACHE, marshal.version, dados["hash"])
+        gravar_atomico(destino, marshal.dumps((cabecalho, serial)), prefixo=".dados_jogo-")
+        # descarta as compilações mais antigas
+        pasta = os.path.dirname(destino)
+        antigos = sorted((os.path.join(pasta, n) for n in os.listdir(pasta)
+                          if n.startswith("dados_jogo-") and n.endswith(".bin")),
+                         key=os.path.getmtime, reverse=True)
+        for caminho in antigos[MAX_ARQUIVOS_CACHE:]:
+            os.remove(caminho)
+    except OSError:
+        # cache é opcional (pasta sem permissão, disco cheio...)
+        pass
+
+
+def carregar(caminho=None, usar_cache=True):
+    """Lê, valida e compila o arquivo de dados (ou pega a forma compilada do cache).
+
+    Devolve o dict compilado com `versao`, `hash`, `caminho` e `do_cache`. Lança
+    DadosInvalidos se o arquivo não existir, não for JSON ou não validar.
+    """
+    caminho = caminho or caminho_padrao()
+    try:
+        with open(caminho, "rb") as f:
+            conteudo = f.read()
+    except OSError as e:
+        raise DadosInvalidos([f"não foi possível ler {caminho}: {e}"])
+    hash_conteudo = hashlib.sha256(conteudo).hexdigest()
+    dados = _ler_cache(hash_conteudo) if usar_cache else None
+    do_cache = dados is not None
+    if dados is None:
+        try:
+            bruto = json.loads(conteudo.decode("utf-8"))
+        except ValueError as e:
+            raise DadosInvalidos([f"JSON inválido em {caminho}: {e}"])
+        validar(bruto)
+        dados = compilar(bruto, hash_conteudo)
+        if usar_cache:
+            _gravar_cache(dados)
+    dados["caminho"] = caminho
+    dados["do_cache"] = do_cache
+    return dados
+
+
+class Observador:
+    """Detecta mudança no arquivo de dados por mtime/tamanho (sem threads: quem usa faz o polling)."""
+    def __init__(self, caminho=None):
+        self.caminho = caminho or caminho_padrao()
+        self._assinatura = self._ler_assinatura()
+
+    def _ler_assinatura(self):
+        try:
+            st = os.stat(self.caminho)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def mudou(self):
+        """True uma vez após cada alteração do arquivo (arquivo removido não conta)."""
+        atual = self._ler_assinatura()
+        if atual is None or atual == self._assinatura:
+            return False
+        self._assinatura = atual
+        return True
@@ -0,0 +1,151 @@
+# Distribuição exata de cristais gastos em upgrades (com pity)
+# Sem dependências além da biblioteca padrão — pode ser usado no app, em scripts e no bot.
+
+from functools import lru_cache
+
+from calculos import SUCCESS_TABLE, crystals_per_up, NIVEL_MAXIMO_CRISTAL
+
+# tolerância para comparações de probabilidade acumulada (erros de ponto flutuante)
+_EPS = 1e-12
+
+
+def distribuicao_tentativas(p, guarantee):
+    """PMF do número de tentativas para subir um nível.
+
+    Índice k = número de tentativas. Cada tentativa 1..guarantee-1 tem chance
+    `p`; a tentativa `guarantee` é sucesso garantido (pity).
+    """
+    q = 1 - p
+    pmf = [0.0] * (guarantee + 1)
+    for k in range(1, guarantee):
+        pmf[k] = (q ** (k - 1)) * p
+    pmf[guarantee] = q ** (guarantee - 1)
+    return pmf
+
+
+def _convolver(a, b):
+    """Convolução de duas PMFs (listas indexadas pelo valor)."""
+    out = [0.0] * (len(a) + len(b) - 1)
+    # percorre apenas os termos não nulos de b (PMFs por nível são curtas)
+    termos_b = [(j, pb) for j, pb in enumerate(b) if pb]
+    for i, pa in enumerate(a):
+        if not pa:
+            continue
+        for j, pb in termos_b:
+            out[i + j] += pa * pb
+    return out
+
+
+@lru_cache(maxsize=512)
+def _pmf_tentativas_cadeia(tabela):
+    """PMF do total de tentativas para uma sequência de (p, guarantee).
+
+    `tabela` é uma tupla, de modo que o cache é invalidado automaticamente
+    se `SUCCESS_TABLE` mudar.
+    """
+    pmf = [1.0]
+    for p, guarantee in tabela:
+        pmf = _convolver(pmf, distribuicao_tentativas(p, guarantee))
+    return tuple(pmf)
+
+
+class DistribuicaoCristais:
+    """Distribuição de cristais consumidos de `atual` até `alvo` em um slot.
+
+    Internamente guarda a PMF do total de tentativas; cada tentativa consome
+    `passo` cristais (`crystals_per_up[slot]`).
+    """
+    def __init__(self, slot, atual, alvo, pmf_tentativas, passo):
+        self.slot = slot
+        self.atual = atual
+        self.alvo = alvo
+        self.passo = passo
+        self._pmf = pmf_tentativas
+        acumulada = []
+        total = 0.0
+        for prob in pmf_tentativas:
+            total += prob
+            acumulada.append(total)
+        self._cdf = acumulada
+
+    @property
+    def minimo(self):
+        for k, prob in enumerate(self._pmf):
+            if prob > 0:
+                return k * self.passo
+        return 0
+
+    @property
+    def maximo(self):
+        return (len(self._pmf) - 1) * self.passo
+
+    def pmf(self):
+        """Retorna {cristais: probabilidade} apenas com valores possíveis."""
+        return {k * self.passo: prob for k, prob in enumerate(self._pmf) if prob > 0}
+
+    def media(self):
+        return sum(k * prob for k, prob in enumerate(self._pmf)) * self.passo
+
+    def variancia(self):
+        m = sum(k * prob for k, prob in enumerate(self._pmf))
+        m2 = sum(k * k * prob for k, prob in enumerate(self._pmf))
+        return (m2 - m * m) * self.passo * self.passo
+
+    def desvio_padrao(self):
+        return max(self.variancia(), 0.0) ** 0.5
+
+    def cdf(self, cristais):
+        """Probabilidade de precisar de no máximo `cristais` cristais."""
+        if cristais < 0:
+            return 0.0
+        k = int(cristais) // self.passo
+        if k >= len(self._cdf):
+            return 1.0
+        return min(self._cdf[k], 1.0)
+
+    def percentil(self, q):
+        """Menor quantidade N de cristais tal que P(cristais ≤ N) ≥ q (0 < q ≤ 1)."""
+        if not 0 < q <= 1:
+            raise ValueError("percentil deve estar em (0, 1]")
+        alvo = q - _EPS
+        # busca binária na CDF (monótona)
+        lo, hi = 0, len(self._cdf) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._cdf[mid] >= alvo:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo * self.passo
+
+    def percentis(self, qs=(0.5, 0.9, 0.99)):
+        """Percentis usuais (P50/P90/P99 por padrão) como {q: cristais}."""
+        return {q: self.percentil(q) for q in qs}
+
+    def resumo(self):
+        """Resumo estruturado (dict) da distribuição."""
+        return {
+            "slot": self.slot,
+            "nivel_atual": self.atual,
+            "nivel_alvo": self.alvo,
+            "media": self.media(),
+            "variancia": self.variancia(),
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+            "p50": self.percentil(0.5),
+            "p90": self.percentil(0.9),
+            "p99": self.percentil(0.99)
+        }
+
+
+def distribuicao_cristais(slot, atual, alvo=NIVEL_MAXIMO_CRISTAL):
+    """Distribuição exata de cristais para levar `slot` de +`atual` a +`alvo`.
+
+    Usa as regras de pity de `SUCCESS_TABLE` e `crystals_per_up`. Lança
+    KeyError para slot inválido; os níveis são limitados a 0..16.
+    """
+    passo = crystals_per_up[slot]
+    atual = max(0, min(int(atual), NIVEL_MAXIMO_CRISTAL))
+    alvo = max(atual, min(int(alvo), NIVEL_MAXIMO_CRISTAL))
+    tabela = tuple(SUCCESS_TABLE[lvl] for lvl in range(atual + 1, alvo + 1))
+    return DistribuicaoCristais(slot, atual, alvo, _pmf_tentativas_cadeia(tabela), passo)
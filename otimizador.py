@@ -0,0 +1,321 @@
+# Otimizador de produção de receitas (mix inteiro de maior lucro)
+# Requer numpy (pip install numpy). Não é usado pela interface Tk.
+#
+# Modelo (programação linear inteira):
+#   x_r   = unidades produzidas da receita r (inteiro, 0 ≤ x_r ≤ máximo opcional)
+#   buy_i = unidades compradas do ingrediente i (≥ 0)
+#   max   Σ_r preço_r·(1 - taxa)·x_r  -  Σ_i preço_i·buy_i
+#   s.a.  Σ_r quantia_ri·x_r - buy_i ≤ estoque_i    (para cada ingrediente)
+#         Σ_i preço_i·buy_i ≤ orçamento
+# O estoque já está pago: só entra no lucro o que for comprado.
+# Resolvido por branch-and-bound com relaxação linear (simplex denso).
+
+import time
+
+import numpy as np
+
+from calculos import receitas, TAXA_VENDA
+
+_EPS = 1e-9
+
+
+def _simplex(c, A, b, u=None, max_iter=10000):
+    """Maximiza c·x com A·x ≤ b e 0 ≤ x ≤ u (simplex com limites superiores).
+
+    `b` pode ter negativos (duas fases); `u` pode conter inf. Retorna
+    (status, x, valor) com status "otimo", "inviavel", "ilimitado" ou
+    "limite" (excedeu `max_iter`).
+    """
+    m, n = A.shape
+    negativos = b < -_EPS
+    k = int(negativos.sum())
+    # colunas: x (n) | folgas (m) | artificiais (k) | rhs
+    T = np.zeros((m + 1, n + m + k + 1))
+    T[:m, :n] = A
+    T[:m, n:n + m] = np.eye(m)
+    T[:m, -1] = b
+    limites = np.full(n + m + k, np.inf)
+    if u is not None:
+        limites[:n] = u
+    # variáveis complementadas (x = u - x̄) — as não básicas ficam sempre em 0
+    trocadas = np.zeros(n + m + k, dtype=bool)
+    base = list(range(n, n + m))
+    if k:
+        linhas = np.nonzero(negativos)[0]
+        T[linhas, :] *= -1
+        for j, i in enumerate(linhas):
+            T[i, n + m + j] = 1.0
+            base[i] = n + m + j
+        # fase 1: minimiza a soma das artificiais (objetivo na última linha)
+        T[m, :] = -T[linhas, :].sum(axis=0)
+        T[m, n + m:n + m + k] = 0.0
+        status = _pivotar(T, base, n + m + k, limites, trocadas, max_iter)
+        if status != "otimo":
+            return status, None, None
+        if T[m, -1] < -1e-7:
+            return "inviavel", None, None
+        # tira artificiais que restaram na base (com valor zero)
+        for i, v in enumerate(base):
+            if v >= n + m:
+                cols = np.nonzero(np.abs(T[i, :n + m]) > _EPS)[0]
+                if len(cols):
+                    _pivo(T, base, i, cols[0])
+        T = np.delete(T, np.s_[n + m:n + m + k], axis=1)
+    # fase 2 (coeficientes das variáveis complementadas trocam de sinal)
+    custos = np.concatenate([c, np.zeros(m)])
+    custos[trocadas[:n + m]] *= -1
+    T[m, :] = 0.0
+    T[m, :n + m] = -custos
+    T[m, -1] = float(c[trocadas[:n]] @ limites[:n][trocadas[:n]])
+    for i, v in enumerate(base):
+        if v < n + m and T[m, v] != 0:
+            T[m, :] -= T[m, v] * T[i, :]
+    status = _pivotar(T, base, n + m, limites, trocadas, max_iter)
+    if status != "otimo":
+        return status, None, None
+    x = np.zeros(n + m)
+    for i, v in enumerate(base):
+        if v < n + m:
+            x[v] = T[i, -1]
+    x = np.where(trocadas[:n + m], limites[:n + m] - x, x)
+    return "otimo", x[:n], T[m, -1]
+
+
+def _pivo(T, base, linha, col):
+    T[linha, :] /= T[linha, col]
+    fator = T[:, col].copy()
+    fator[linha] = 0.0
+    T -= np.outer(fator, T[linha, :])
+    base[linha] = col
+
+
+def _complementar(T, col, limites, trocadas):
+    """Troca x_col por u - x_col (variável não básica vai para o outro limite)."""
+    T[:, -1] -= T[:, col] * limites[col]
+    T[:, col] *= -1
+    trocadas[col] = not trocadas[col]
+
+
+def _pivotar(T, base, ncols, limites, trocadas, max_iter):
+    """Iterações do simplex com limites superiores. Devolve "otimo", "ilimitado" ou "limite".
+
+    Usa a regra de Dantzig e passa para a regra de Bland (anticiclagem)
+    depois de uma sequência de pivôs degenerados.
+    """
+    m = T.shape[0] - 1
+    degenerados = 0
+    limites_base = np.empty(m)
+    for _ in range(max_iter):
+        custos = T[m, :ncols]
+        if degenerados > 50:
+            candidatos = np.nonzero(custos < -_EPS)[0]
+            if not len(candidatos):
+                return "otimo"
+            col = int(candidatos[0])
+        else:
+            col = int(np.argmin(custos))
+            if custos[col] >= -_EPS:
+                return "otimo"
+        coluna = T[:m, col]
+        rhs = T[:m, -1]
+        limites_base[:] = limites[base]
+        # básicas que caem até 0 e básicas que sobem até o limite superior
+        razoes = np.full(m, np.inf)
+        desce = coluna > _EPS
+        razoes[desce] = rhs[desce] / coluna[desce]
+        sobe = (coluna < -_EPS) & np.isfinite(limites_base)
+        razoes[sobe] = (limites_base[sobe] - rhs[sobe]) / -coluna[sobe]
+        linha = int(np.argmin(razoes))
+        passo = razoes[linha]
+        if limites[col] <= passo:
+            # a própria variável que entra atinge o limite: só complementa
+            if not np.isfinite(limites[col]):
+                return "ilimitado"
+            _complementar(T, col, limites, trocadas)
+            degenerados = 0
+            continue
+        if not np.isfinite(passo):
+            return "ilimitado"
+        degenerados = degenerados + 1 if passo <= _EPS else 0
+        sai = base[linha]
+        _pivo(T, base, linha, col)
+        if sobe[linha] and not desce[linha]:
+            # a variável que saiu parou no limite superior
+            _complementar(T, sai, limites, trocadas)
+    return "limite"
+
+
+class Problema:
+    """Matriz compacta receita × ingrediente pronta para o otimizador."""
+    def __init__(self, catalogo, precos_venda, estoque, orcamento, taxa, maximos, precos):
+        # pré-processamento: descarta receitas sem preço, com máximo 0 ou que dão
+        # prejuízo mesmo usando de graça todo ingrediente que há no estoque
+        self.receitas = []
+        for r in catalogo:
+            venda = precos_venda.get(r, 0) * (1 - taxa)
+            if venda <= 0 or maximos.get(r, 1) <= 0:
+                continue
+            custo_minimo = sum(quantia * float(precos.get(item, valor))
+                               for item, (quantia, valor) in catalogo[r].items()
+                               if estoque.get(item, 0) <= 0)
+            if venda > custo_minimo:
+                self.receitas.append(r)
+        ingredientes = []
+        preco_ing = {}
+        for r in self.receitas:
+            for item, (quantia, valor) in catalogo[r].items():
+                if item not in preco_ing:
+                    ingredientes.append(item)
+                    preco_ing[item] = float(precos.get(item, valor))
+        self.ingredientes = ingredientes
+        idx = {item: i for i, item in enumerate(ingredientes)}
+        R, I = len(self.receitas), len(ingredientes)
+        self.quantias = np.zeros((I, R))
+        for j, r in enumerate(self.receitas):
+            for item, (quantia, _valor) in catalogo[r].items():
+                self.quantias[idx[item], j] += quantia
+        self.precos = np.array([preco_ing[i] for i in ingredientes])
+        self.estoque = np.array([float(estoque.get(i, 0)) for i in ingredientes])
+        self.ganho = np.array([precos_venda[r] * (1 - taxa) for r in self.receitas])
+        self.orcamento = float(orcamento)
+        self.maximos = np.array([maximos.get(r, np.inf) for r in self.receitas], dtype=float)
+        # na relaxação, ingredientes sem estoque viram custo fixo por unidade da
+        # receita; só os que têm estoque precisam de linha/variável de compra
+        sem_estoque = self.estoque <= 0
+        self.custo_fixo = self.precos[sem_estoque] @ self.quantias[sem_estoque]
+        self._com_estoque = np.nonzero(~sem_estoque)[0]
+
+    def avaliar(self, x):
+        """(lucro, custo_compra) de um mix inteiro, comprando só o que falta no estoque."""
+        compra = np.maximum(self.quantias @ x - self.estoque, 0.0)
+        custo = float(self.precos @ compra)
+        return float(self.ganho @ x) - custo, custo
+
+    def relaxacao(self, lo, hi):
+        """Resolve a relaxação linear com limites lo ≤ x ≤ hi nas receitas."""
+        R = len(self.receitas)
+        S = self._com_estoque
+        K = len(S)
+        precos_s = self.precos[S]
+        lucro_unit = self.ganho - self.custo_fixo
+        c = np.concatenate([lucro_unit, -precos_s])
+        A = np.zeros((K + 1, R + K))
+        A[:K, :R] = self.quantias[S]
+        A[:K, R:] = -np.eye(K)
+        A[K, :R] = self.custo_fixo
+        A[K, R:] = precos_s
+        # desloca x = lo + x'
+        b = np.concatenate([self.estoque[S], [self.orcamento]]) - A[:, :R] @ lo
+        u = np.concatenate([hi - lo, np.full(K, np.inf)])
+        status, sol, valor = _simplex(c, A, b, u)
+        if status != "otimo":
+            return status, None, None
+        return status, sol[:R] + lo, valor + float(lucro_unit @ lo)
+
+
+def _completar(prob, x):
+    """Heurística: a partir de um mix viável, adiciona a unidade de maior lucro
+    marginal enquanto houver lucro e orçamento (avaliação vetorizada)."""
+    necessidade = prob.quantias @ x
+    falta = np.maximum(necessidade - prob.estoque, 0.0)
+    custo = float(prob.precos @ falta)
+    for _ in range(10000):
+        # custo marginal de +1 unidade de cada receita
+        nova_falta = np.maximum(necessidade[:, None] + prob.quantias - prob.estoque[:, None], 0.0)
+        delta_custo = prob.precos @ (nova_falta - falta[:, None])
+        delta_lucro = prob.ganho - delta_custo
+        viavel = (custo + delta_custo <= prob.orcamento + _EPS) & (x + 1 <= prob.maximos) & (delta_lucro > _EPS)
+        if not viavel.any():
+            break
+        j = int(np.argmax(np.where(viavel, delta_lucro, -np.inf)))
+        x[j] += 1
+        necessidade += prob.quantias[:, j]
+        falta = nova_falta[:, j]
+        custo += float(delta_custo[j])
+    return x, prob.avaliar(x)[0]
+
+
+def otimizar_producao(orcamento, precos_venda, estoque=None, catalogo=None, taxa=TAXA_VENDA,
+                      maximos=None, precos=None, gap=1e-3, max_nos=5000,
+                      tempo_max=0.1):
+    """Mix inteiro de receitas que maximiza o lucro total.
+
+    - `orcamento`: berry disponível para comprar ingredientes.
+    - `precos_venda`: {receita: preço de venda unitário}; receitas sem preço são ignoradas.
+    - `estoque`: {ingrediente: quantidade já possuída} (ingredientes compartilhados contam uma vez).
+    - `maximos`: {receita: quantidade máxima} opcional (ex.: demanda do mercado).
+    - `precos`: {ingrediente: preço} que substitui o preço do catálogo.
+    - `gap`: tolerância relativa de otimalidade (como nos solvers MIP usuais);
+      use 0 para exigir prova exata.
+    - `tempo_max`: segundos de busca (None = sem limite); ao estourar, devolve
+      o melhor mix encontrado com `otimo` False.
+
+    Retorna um dict com quantidades por receita, compras por ingrediente,
+    custo, venda, taxa, lucro, o limite superior provado e se a otimalidade
+    (dentro de `gap`) foi provada dentro dos limites de nós/tempo (`otimo`).
+    Lança ValueError se o lucro for ilimitado (receita lucrativa sem custo e sem máximo).
+    """
+    prob = Problema(catalogo or receitas, precos_venda, estoque or {}, orcamento, taxa,
+                    maximos or {}, precos or {})
+    R = len(prob.receitas)
+    melhor_x = np.zeros(R)
+    melhor = 0.0
+    nos = 0
+    otimo = True
+    limite_raiz = None
+
+    def _podar(limite):
+        return limite <= melhor + max(1e-6, gap * abs(melhor))
+
+    pilha = [(np.zeros(R), prob.maximos.copy())] if R else []
+    prazo = time.perf_counter() + tempo_max if tempo_max is not None else None
+    while pilha:
+        if nos >= max_nos or (prazo is not None and nos and time.perf_counter() > prazo):
+            otimo = False
+            break
+        lo, hi = pilha.pop()
+        nos += 1
+        status, x, limite = prob.relaxacao(lo, hi)
+        if status == "ilimitado":
+            raise ValueError("lucro ilimitado: defina máximos para receitas sem custo")
+        if status == "limite":
+            otimo = False
+        if status != "otimo":
+            continue
+        if limite_raiz is None:
+            limite_raiz = limite
+        if _podar(limite):
+            continue
+        # solução inteira candidata: arredonda para baixo (sempre viável) e completa
+        candidato, lucro = _completar(prob, np.floor(x + 1e-7))
+        if lucro > melhor + _EPS:
+            melhor, melhor_x = lucro, candidato.copy()
+        frac = np.abs(x - np.round(x))
+        j = int(np.argmax(frac))
+        if frac[j] <= 1e-7 or _podar(limite):
+            continue
+        piso = np.floor(x[j])
+        # ramo "≤ piso" e ramo "≥ piso + 1"; explora primeiro o mais próximo do valor da relaxação
+        hi_baixo = hi.copy()
+        hi_baixo[j] = piso
+        lo_cima = lo.copy()
+        lo_cima[j] = piso + 1
+        ramos = [(lo, hi_baixo), (lo_cima, hi)]
+        if x[j] - piso >= 0.5:
+            ramos.reverse()
+        pilha.extend(reversed(ramos))
+
+    lucro, custo = prob.avaliar(melhor_x)
+    compra = np.maximum(prob.quantias @ melhor_x - prob.estoque, 0.0)
+    venda = sum(precos_venda[r] * int(q) for r, q in zip(prob.receitas, melhor_x))
+    return {
+        "quantidades": {r: int(q) for r, q in zip(prob.receitas, melhor_x) if q > 0},
+        "compras": {i: int(round(q)) for i, q in zip(prob.ingredientes, compra) if q > 0},
+        "custo": custo,
+        "venda": venda,
+        "taxa": venda * taxa,
+        "lucro": lucro,
+        "limite_superior": float(limite_raiz) if limite_raiz is not None else lucro,
+        "otimo": otimo,
+        "nos": nos
+    }
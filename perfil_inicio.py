@@ -0,0 +1,118 @@
+# Perfil de inicialização do app (modo trace)
+# Ativado por `--perfil-inicio[=arquivo.json]` na linha de comando ou pela variável
+# de ambiente GLA_PERFIL_INICIO (1 ou o caminho do relatório). Desativado, cada
+# fase custa só uma chamada que devolve um contexto vazio.
+#
+# Gera um relatório JSON (fases com início/duração em ms e aninhamento) e um
+# resumo legível (.txt ao lado e, se houver console, em stderr).
+
+import contextlib
+import json
+import os
+import sys
+import time
+
+_T0 = time.perf_counter()
+# CPU já gasto pelo processo antes deste módulo (inicialização do interpretador/bootloader)
+_CPU_ANTES = time.process_time()
+
+ARQUIVO_PADRAO = "perfil_inicio.json"
+VARIAVEL_AMBIENTE = "GLA_PERFIL_INICIO"
+
+
+def _destino():
+    """Caminho do relatório se o modo trace estiver ligado, senão None."""
+    for arg in sys.argv[1:]:
+        if arg == "--perfil-inicio":
+            return ARQUIVO_PADRAO
+        if arg.startswith("--perfil-inicio="):
+            return arg.split("=", 1)[1] or ARQUIVO_PADRAO
+    valor = os.environ.get(VARIAVEL_AMBIENTE, "").strip()
+    if not valor or valor.lower() in ("0", "false", "nao", "não"):
+        return None
+    return ARQUIVO_PADRAO if valor.lower() in ("1", "true", "sim") else valor
+
+
+DESTINO = _destino()
+ATIVO = DESTINO is not None
+
+fases = []
+_pilha = []
+_nulo = contextlib.nullcontext()
+
+
+def _agora_ms():
+    return (time.perf_counter() - _T0) * 1000
+
+
+@contextlib.contextmanager
+def _medir(nome):
+    registro = {"fase": nome, "inicio_ms": _agora_ms(), "duracao_ms": None, "nivel": len(_pilha)}
+    fases.append(registro)
+    _pilha.append(registro)
+    try:
+        yield registro
+    finally:
+        _pilha.pop()
+        registro["duracao_ms"] = _agora_ms() - registro["inicio_ms"]
+
+
+def fase(nome):
+    """Contexto que cronometra uma fase (aninhável); sem efeito fora do modo trace."""
+    return _medir(nome) if ATIVO else _nulo
+
+
+def marcar(nome):
+    """Registra um instante (duração zero), ex.: 'primeiro quadro desenhado'."""
+    if ATIVO:
+        fases.append({"fase": nome, "inicio_ms": _agora_ms(), "duracao_ms": 0.0, "nivel": len(_pilha)})
+
+
+def relatorio():
+    total = _agora_ms()
+    topo = sum(f["duracao_ms"] or 0 for f in fases if f["nivel"] == 0)
+    return {
+        "total_ms": total,
+        "cpu_antes_do_app_ms": _CPU_ANTES * 1000,
+        "fora_das_fases_ms": max(0.0, total - topo),
+        "congelado": bool(getattr(sys, "frozen", False)),
+        "python": sys.version.split()[0],
+        "argv": sys.argv[1:],
+        "fases": fases,
+    }
+
+
+def resumo(rel=None):
+    """Tabela legível das fases: duração, % do total e barra proporcional."""
+    rel = rel or relatorio()
+    total = rel["total_ms"] or 1
+    linhas = [f"Inicialização: {rel['total_ms']:.1f} ms "
+              f"(+{rel['cpu_antes_do_app_ms']:.1f} ms de CPU antes do app)"]
+    largura = max([len(f["fase"]) + 2 * f["nivel"] for f in rel["fases"]] + [len("(fora das fases)")])
+    for f in rel["fases"]:
+        dur = f["duracao_ms"] or 0.0
+        nome = "  " * f["nivel"] + f["fase"]
+        barra = "█" * int(round(30 * dur / total))
+        linhas.append(f"{nome:<{largura}} {dur:9.1f} ms {100 * dur / total:5.1f}%  {barra}")
+    linhas.append(f"{'(fora das fases)':<{largura}} {rel['fora_das_fases_ms']:9.1f} ms")
+    return "\n".join(linhas)
+
+
+def gravar(caminho=None):
+    """Grava o relatório JSON e o resumo .txt; devolve o caminho do JSON (ou None)."""
+    caminho = caminho or DESTINO
+    if not caminho:
+        return None
+    rel = relatorio()
+    texto = resumo(rel)
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(rel, f, ensure_ascii=False, indent=2)
+    with open(os.path.splitext(caminho)[0] + ".txt", "w", encoding="utf-8") as f:
+        f.write(texto + "\n")
+    if sys.stderr is not None:
+        # executável --windowed não tem console
+        try:
+            sys.stderr.write(texto + "\n")
+        except Exception:
+            pass
+    return caminho
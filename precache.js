@@ -0,0 +1,15 @@
+/* Gerado por web_precache.py — não editar */
+const PRECACHE = {
+  "versao": "9c2fddb9b11c",
+  "arquivos": {
+    "index.html": "98b6270cea1afd85",
+    "styles.css": "eb864e4f4caf9d73",
+    "assets/sprites.css": "09beee81c1abd3f1",
+    "assets/sprites.png": "e21008bd05d1fe9e",
+    "dados.js": "9b0829c3afdc3d1b",
+    "calculos.js": "0e916ef845dc7d79",
+    "script.js": "25a4bb1596f0f308",
+    "worker.js": "7d78ce577c5d3086",
+    "icon.ico": "35ee8496f8f1dbad"
+  }
+};
@@ -0,0 +1,279 @@
+# Loja persistente de preços de ingredientes (SQLite, biblioteca padrão)
+# Importa planilhas de preços (CSV/JSON), guarda histórico por ingrediente e
+# recalcula apenas as receitas afetadas quando um preço muda.
+
+import csv
+import json
+import math
+import os
+import re
+import sqlite3
+import time
+
+from calculos import receitas, TAXA_VENDA, custo_receita
+
+ARQUIVO_PRECOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "precos.db")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS precos (
+    ingrediente TEXT PRIMARY KEY,
+    valor REAL NOT NULL,
+    atualizado_em REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS historico (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ingrediente TEXT NOT NULL,
+    valor REAL NOT NULL,
+    registrado_em REAL NOT NULL,
+    origem TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_historico_ingrediente ON historico (ingrediente, registrado_em);
+"""
+
+
+def indice_ingredientes(catalogo):
+    """Índice reverso {ingrediente: {receitas que o usam}}."""
+    indice = {}
+    for receita, itens in catalogo.items():
+        for item in itens:
+            indice.setdefault(item, set()).add(receita)
+    return indice
+
+
+class PlanilhaInvalida(ValueError):
+    """Planilha com linhas que não puderam ser lidas; `erros` lista todas elas."""
+    def __init__(self, erros):
+        super().__init__("; ".join(erros))
+        self.erros = erros
+
+
+def ler_numero(texto, decimal=None):
+    """Converte um número de planilha em pt-BR ou en-US ("1.234,56", "1,234.56", "1234,5").
+
+    Com `decimal` ("," ou ".") o separador decimal é o informado e o outro é de
+    milhar. Sem ele: com os dois separadores, o último é o decimal e o outro é
+    de milhar; com só vírgulas ou só pontos repetidos, eles são de milhar; uma
+    vírgula sozinha é decimal (pt-BR) e um ponto sozinho também — menos quando
+    seguido de exatamente três dígitos ("1.500", "2,500"), que tanto pode ser
+    mil e quinhentos quanto um e meio e é rejeitado. Preço negativo, nan e inf
+    também. Lança ValueError com o motivo.
+    """
+    t = texto.strip().replace("\u00a0", "").replace(" ", "")
+    if decimal is not None:
+        if decimal not in (",", "."):
+            raise ValueError(f"separador decimal inválido: {decimal!r}")
+        milhar = "." if decimal == "," else ","
+        t = t.replace(milhar, "").replace(decimal, ".")
+    elif "," in t and "." in t:
+        milhar, decimal = (".", ",") if t.rfind(",") > t.rfind(".") else (",", ".")
+        t = t.replace(milhar, "").replace(decimal, ".")
+    elif t.count(",") > 1 or t.count(".") > 1:
+        t = t.replace(",", "").replace(".", "")
+    elif _AMBIGUO.fullmatch(t):
+        raise ValueError("ambíguo (milhar ou decimal?): informe o separador decimal")
+    else:
+        t = t.replace(",", ".")
+    try:
+        valor = float(t)
+    except ValueError:
+        raise ValueError("não é um número")
+    return _preco_valido(valor)
+
+
+def _preco_valido(valor):
+    if not math.isfinite(valor):
+        raise ValueError("não é um número finito")
+    if valor < 0:
+        raise ValueError("preço negativo")
+    return valor
+
+
+# um separador sozinho seguido de três dígitos: "1.500" é 1500 (pt-BR) ou 1,5 (en-US)
+_AMBIGUO = re.compile(r"[1-9]\d{0,2}[.,]\d{3}")
+
+
+def ler_csv(caminho, decimal=None):
+    """Lê uma planilha CSV `ingrediente,valor` (cabeçalho opcional na primeira linha).
+
+    `decimal` é repassado a `ler_numero`. Lança PlanilhaInvalida com todas as
+    linhas rejeitadas (nada é importado pela metade).
+    """
+    precos = {}
+    erros = []
+    primeira = True
+    with open(caminho, "r", encoding="utf-8-sig", newline="") as f:
+        for n, linha in enumerate(csv.reader(f), 1):
+            if not any(c.strip() for c in linha):
+                continue
+            cabecalho_possivel, primeira = primeira, False
+            if len(linha) < 2 or not linha[0].strip():
+                erros.append(f"linha {n}: esperado ingrediente,valor")
+                continue
+            try:
+                precos[linha[0].strip()] = ler_numero(linha[1], decimal)
+            except ValueError as e:
+                # cabeçalho é texto; um número rejeitado na primeira linha ainda é erro
+                if not cabecalho_possivel or any(c.isdigit() for c in linha[1]):
+                    erros.append(f"linha {n}: valor inválido {linha[1]!r} para {linha[0].strip()}: {e}")
+    if erros:
+        raise PlanilhaInvalida(erros)
+    return precos
+
+
+def _valor_json(valor, decimal):
+    if isinstance(valor, str):
+        return ler_numero(valor, decimal)
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+        raise ValueError("não é um número")
+    try:
+        return _preco_valido(float(valor))
+    except OverflowError:
+        raise ValueError("não é um número finito")
+
+
+def ler_json(caminho, decimal=None):
+    """Lê preços em JSON: {ingrediente: valor} ou [{"ingrediente": ..., "valor": ...}].
+
+    Valores em texto passam por `ler_numero`. Lança PlanilhaInvalida com todas
+    as entradas rejeitadas, como `ler_csv`.
+    """
+    with open(caminho, "r", encoding="utf-8") as f:
+        dados = json.load(f)
+    if isinstance(dados, dict):
+        entradas = [(repr(k), k, v) for k, v in dados.items()]
+    elif isinstance(dados, list):
+        entradas = []
+        for n, d in enumerate(dados, 1):
+            if not isinstance(d, dict) or not isinstance(d.get("ingrediente"), str) or "valor" not in d:
+                entradas.append((f"item {n}", None, None))
+            else:
+                entradas.append((f"item {n}", d["ingrediente"], d["valor"]))
+    else:
+        raise PlanilhaInvalida(["esperado um objeto {ingrediente: valor} ou uma lista"])
+    precos = {}
+    erros = []
+    for onde, ingrediente, valor in entradas:
+        if not ingrediente or not ingrediente.strip():
+            erros.append(f"{onde}: esperado ingrediente e valor")
+            continue
+        try:
+            precos[ingrediente.strip()] = _valor_json(valor, decimal)
+        except ValueError as e:
+            erros.append(f"{onde}: valor inválido {valor!r} para {ingrediente.strip()}: {e}")
+    if erros:
+        raise PlanilhaInvalida(erros)
+    return precos
+
+
+class LojaPrecos:
+    """Preços de ingredientes persistidos em SQLite com custos de receita incrementais.
+
+    Mantém em memória o preço atual de cada ingrediente e o custo por unidade
+    de cada receita; uma mudança de preço só recalcula as receitas que usam o
+    ingrediente (via `indice_ingredientes`). Ingredientes sem preço na loja
+    usam o valor do catálogo.
+    """
+    def __init__(self, caminho=ARQUIVO_PRECOS, catalogo=None):
+        self.catalogo = receitas if catalogo is None else catalogo
+        self.indice = indice_ingredientes(self.catalogo)
+        self.conn = sqlite3.connect(caminho)
+        self.conn.executescript(_ESQUEMA)
+        self._precos = dict(self.conn.execute("SELECT ingrediente, valor FROM precos"))
+        self._versao = self._versao_banco()
+        self.custos_unitarios = {}
+        self._recalcular(self.catalogo)
+
+    def _versao_banco(self):
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _recalcular(self, afetadas):
+        for receita in afetadas:
+            self.custos_unitarios[receita] = sum(
+                quantia * self.preco(item, valor)
+                for item, (quantia, valor) in self.catalogo[receita].items()
+            )
+
+    def recarregar_catalogo(self):
+        """Refaz o índice e os custos após o catálogo mudar (ex.: novos dados do jogo)."""
+        self.indice = indice_ingredientes(self.catalogo)
+        self.custos_unitarios.clear()
+        self._recalcular(self.catalogo)
+
+    def preco(self, ingrediente, padrao=None):
+        return self._precos.get(ingrediente, padrao)
+
+    def precos(self):
+        return dict(self._precos)
+
+    def atualizar(self, novos, origem=None):
+        """Grava preços {ingrediente: valor} numa transação e devolve as receitas afetadas.
+
+        Só registra histórico e recalcula quando o valor realmente muda.
+        """
+        agora = time.time()
+        mudaram = {i: float(v) for i, v in novos.items() if self._precos.get(i) != float(v)}
+        if not mudaram:
+            return set()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO precos (ingrediente, valor, atualizado_em) VALUES (?, ?, ?) "
+                "ON CONFLICT(ingrediente) DO UPDATE SET valor = excluded.valor, atualizado_em = excluded.atualizado_em",
+                [(i, v, agora) for i, v in mudaram.items()]
+            )
+            self.conn.executemany(
+                "INSERT INTO historico (ingrediente, valor, registrado_em, origem) VALUES (?, ?, ?, ?)",
+                [(i, v, agora, origem) for i, v in mudaram.items()]
+            )
+        self._versao = self._versao_banco()
+        return self._aplicar(mudaram)
+
+    def _aplicar(self, mudaram):
+        self._precos.update(mudaram)
+        afetadas = set()
+        for item in mudaram:
+            afetadas |= self.indice.get(item, set())
+        self._recalcular(afetadas)
+        return afetadas
+
+    def definir_preco(self, ingrediente, valor, origem=None):
+        return self.atualizar({ingrediente: valor}, origem)
+
+    def importar_csv(self, caminho, decimal=None):
+        return self.atualizar(ler_csv(caminho, decimal), origem=os.path.basename(caminho))
+
+    def importar_json(self, caminho, decimal=None):
+        return self.atualizar(ler_json(caminho, decimal), origem=os.path.basename(caminho))
+
+    def recarregar(self):
+        """Aplica mudanças gravadas por outro processo (ex.: importação do bot).
+
+        Consulta barata (`PRAGMA data_version`); devolve as receitas afetadas.
+        """
+        versao = self._versao_banco()
+        if versao == self._versao:
+            return set()
+        self._versao = versao
+        atuais = dict(self.conn.execute("SELECT ingrediente, valor FROM precos"))
+        mudaram = {i: v for i, v in atuais.items() if self._precos.get(i) != v}
+        return self._aplicar(mudaram)
+
+    def historico(self, ingrediente, limite=None):
+        """Lista [(registrado_em, valor, origem)] do mais recente para o mais antigo."""
+        sql = "SELECT registrado_em, valor, origem FROM historico WHERE ingrediente = ? ORDER BY registrado_em DESC, id DESC"
+        if limite:
+            sql += f" LIMIT {int(limite)}"
+        return self.conn.execute(sql, (ingrediente,)).fetchall()
+
+    def custo_unitario(self, receita):
+        return self.custos_unitarios[receita]
+
+    def lucro_unitario(self, receita, valor, taxa=TAXA_VENDA):
+        """Lucro por unidade vendida a `valor` (com a taxa de venda)."""
+        return valor * (1 - taxa) - self.custos_unitarios[receita]
+
+    def custo_receita(self, receita, qtd, valor):
+        """Como `calculos.custo_receita`, mas com os preços atuais da loja."""
+        return custo_receita(receita, qtd, valor, precos=self._precos)
+
+    def fechar(self):
+        self.conn.close()
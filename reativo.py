@@ -0,0 +1,128 @@
+# Grafo de dependências reativo (recalcula enquanto o usuário digita)
+# Não importa tkinter: o agendamento é injetado (ex.: janela.after / janela.after_cancel),
+# o que permite usar o grafo sem interface.
+
+import heapq
+import time
+
+DEBOUNCE_MS = 120
+ORCAMENTO_MS = 8
+INTERVALO_QUADRO_MS = 16
+
+
+class Grafo:
+    """Entradas, nós derivados e saídas; só recalcula o que depende do que mudou.
+
+    - `entrada(nome, valor)` declara um valor vindo de um campo da tela;
+    - `no(nome, deps, func)` declara `func(*valores_das_deps)`; saídas são nós
+      que desenham na tela (o valor devolvido vai para os dependentes).
+
+    As dependências precisam ser declaradas antes, então a ordem de declaração
+    já é topológica. `definir` marca os dependentes diretos e agenda um
+    processamento com debounce; ao processar, um nó só propaga para os seus
+    dependentes quando o valor muda (corte antecipado). Cada quadro roda no
+    máximo `orcamento_ms` de nós; o restante fica para o quadro seguinte.
+    """
+    def __init__(self, agendar=None, cancelar=None, debounce_ms=DEBOUNCE_MS, orcamento_ms=ORCAMENTO_MS):
+        self._agendar = agendar
+        self._cancelar = cancelar
+        self.debounce_ms = debounce_ms
+        self.orcamento_ms = orcamento_ms
+        self.valores = {}
+        self.funcs = {}
+        self.deps = {}
+        self.dependentes = {}
+        self.ordem = {}
+        self._sujos = []
+        self._na_fila = set()
+        self._job = None
+        self.execucoes = 0
+
+    def _declarar(self, nome, deps, func):
+        if nome in self.ordem:
+            raise ValueError(f"nó já declarado: {nome}")
+        for d in deps:
+            if d not in self.ordem:
+                raise ValueError(f"dependência desconhecida: {d}")
+            self.dependentes[d].append(nome)
+        self.ordem[nome] = len(self.ordem)
+        self.deps[nome] = tuple(deps)
+        self.funcs[nome] = func
+        self.dependentes[nome] = []
+
+    def entrada(self, nome, valor=None):
+        self._declarar(nome, (), None)
+        self.valores[nome] = valor
+
+    def no(self, nome, deps, func):
+        self._declarar(nome, deps, func)
+        self.valores[nome] = None
+        self._marcar(nome)
+
+    def _marcar(self, nome):
+        if nome not in self._na_fila:
+            self._na_fila.add(nome)
+            heapq.heappush(self._sujos, (self.ordem[nome], nome))
+
+    def definir(self, nome, valor):
+        """Atualiza uma entrada; se mudou, agenda o recálculo dos dependentes."""
+        if self.valores.get(nome) == valor:
+            return False
+        self.valores[nome] = valor
+        for d in self.dependentes[nome]:
+            self._marcar(d)
+        self._agendar_quadro(self.debounce_ms)
+        return True
+
+    def pendente(self):
+        return bool(self._sujos)
+
+    def processar(self, orcamento_ms=None):
+        """Roda nós sujos em ordem topológica; devolve True se sobrou trabalho."""
+        limite = None if orcamento_ms is None else time.perf_counter() + orcamento_ms / 1000
+        while self._sujos:
+            _, nome = heapq.heappop(self._sujos)
+            self._na_fila.discard(nome)
+            anterior = self.valores.get(nome)
+            novo = self.funcs[nome](*(self.valores[d] for d in self.deps[nome]))
+            self.execucoes += 1
+            self.valores[nome] = novo
+            if novo is not anterior and novo != anterior:
+                for d in self.dependentes[nome]:
+                    self._marcar(d)
+            if limite is not None and time.perf_counter() >= limite:
+                break
+        return bool(self._sujos)
+
+    def recalcular(self, *nomes):
+        """Força o recálculo imediato dos nós indicados (ou de todos), sem debounce."""
+        self.parar()
+        for nome in (nomes or self.funcs):
+            if self.funcs[nome] is not None:
+                self._marcar(nome)
+        self.processar()
+
+    def parar(self):
+        """Cancela o processamento agendado (ex.: a tela foi destruída)."""
+        if self._job is not None and self._cancelar:
+            try:
+                self._cancelar(self._job)
+            except Exception:
+                pass
+        self._job = None
+
+    def _agendar_quadro(self, atraso_ms):
+        if self._agendar is None:
+            return
+        self.parar()
+        self._job = self._agendar(atraso_ms, self._quadro)
+
+    def _quadro(self):
+        self._job = None
+        if self.processar(self.orcamento_ms):
+            self._agendar_quadro(INTERVALO_QUADRO_MS)
+
+    def iniciar(self):
+        """Agenda o primeiro processamento (nós recém-declarados começam sujos)."""
+        if self._sujos:
+            self._agendar_quadro(0)
@@ -3,142 +3,148 @@
    Pronto para ser publicado no GitHub Pages (index.html no root).
 */
 
-// ----------------- Dados (portados do app.py) -----------------
-const XP_TOTAL_BY_LEVEL = [
-  0,0,98,199,388,790,1498,2565,4176,6397,9230,12956,17596,23083,29830,37795,46824,57498,69694,83153,98660,115993,134770,156016,179392,204375,232266,262591,294668,330110,368290,408349,452248,499189,548118,601744,658352,717039,780570,847751,917084,991790,1070450,1151317,1238104,1329149,1422438,1522212,1626548,1733147,1846814,1965347,2086144,2214610,2348246,2484129,2628300,2777945,2929802,3090584,3257144,3425863,3604162,3788543,3975012,4171734,4374842,4579949,4796000,5018741,5243374,5479660,5722940,5967987,6225414,6490139,6756488,7035962,7323038,7611577,7914004,8224337,8535954,8862240,9196736,9532319,9883370,10242935,10603372,10980094,11365634,11751813,12155112,12567533,12980342,13411124,13851332,14291659,14750830,15219731,15688464,16176930,16675430,17173457,17692124,18221129,18749338,19299112,19859528,20418807,21000594,21593327,22184564,22799270,23425226,24049309,24697840,25357925,26015742,26699004,27394124,28086563,28805462,29536523,30264472,31019914,31787822,32552169,33345060,34150721,34952354,35783600,36627920,37467727,38338234,39222119,40100988,41011662,41936018,42854837,43806584
-];
+// Dados e cálculos em dados.js (gerado por web_dados.py) e calculos.js;
+// os cálculos rodam em worker.js e aqui fica só a interface.
 
-const XP_POTION_BY_TIER = {
-  "Diamante": {grande: 50000, media: 5000, pequena: 500},
-  "Ouro": {grande: 100000, media: 10000, pequena: 1000},
-  "Prata": {grande: 200000, media: 20000, pequena: 2000},
-  "Bronze": {grande: 300000, media: 30000, pequena: 3000}
-};
+// ----------------- Utilitários -----------------
+const $ = id => document.getElementById(id);
+function fmt(n){return (typeof n === 'number')? n.toLocaleString('pt-BR') : n}
 
-const RECEITAS = {
-  "Paella de Camarão": {
-    "Camarão Cru": [8, 300],
-    "Folhas Verdes": [1, 15],
-    "Tomates": [1, 10],
-    "Água": [3, 5],
-    "Trufa Branca": [3, 250],
-    "Sal": [1, 10],
-    "Pimenta": [1, 15],
-    "Arroz": [2, 10],
-    "Azeite": [1, 15]
-  },
-  "Frango Teriyaki": {
-    "Galinha": [5, 300],
-    "Pimenta": [1, 15],
-    "Tomates": [3, 10],
-    "Sal": [2, 10],
-    "Azeite": [6, 15],
-    "Folhas Verdes": [3, 15],
-    "Alho": [3, 10],
-    "Trufa Branca": [3, 250],
-    "Creme de Leite": [3, 20]
+// ----------------- Worker de cálculo -----------------
+// Uma requisição por canal (um canal por calculadora): pedir de novo ou mudar
+// uma entrada cancela a anterior, e só a resposta mais recente é desenhada.
+// Sem Worker (ex.: página aberta via file://) as tarefas rodam aqui mesmo.
+const CANCELADO = {cancelado: true};
+const calculadora = (() => {
+  let worker = null;
+  try{ worker = new Worker('worker.js'); }catch(e){ worker = null; }
+  let proximoId = 1;
+  const pendentes = new Map();   // id → {tipo, args, resolve, reject, aoProgresso}
+  const porCanal = {};           // canal → id em andamento
+
+  function local(tipo, args){
+    const it = TAREFAS[tipo](args);
+    let passo = it.next();
+    while(!passo.done) passo = it.next();
+    return passo.value;
+  }
+  function concluir(id){
+    const p = pendentes.get(id);
+    pendentes.delete(id);
+    for(const c in porCanal) if(porCanal[c] === id) delete porCanal[c];
+    return p;
   }
-};
 
-const CRYSTALS_PER_UP = {Emblema:2, Capacete:2, "Calça":2, Peito:4, Arma:4, Colar:4};
-const SUCCESS_TABLE = {
-  1:[0.35,3],2:[0.30,4],3:[0.25,5],4:[0.20,6],5:[0.22,5],6:[0.18,6],7:[0.14,8],8:[0.10,11],9:[0.10,11],10:[0.09,12],11:[0.08,13],12:[0.07,15],13:[0.06,17],14:[0.05,21],15:[0.04,26],16:[0.03,34]
-};
-const TRANSFER_COSTS = {
-  4: {Capacete:1, Peito:2, "Calça":1, Emblema:1, Arma:2, Colar:2},
-  8: {Capacete:3, Peito:5, "Calça":3, Emblema:3, Arma:5, Colar:5},
-  12:{Capacete:6, Peito:10, "Calça":6, Emblema:6, Arma:10, Colar:10},
-  16:{Capacete:10, Peito:15, "Calça":10, Emblema:10, Arma:15, Colar:15}
-};
+  if(worker){
+    worker.onmessage = e => {
+      const m = e.data;
+      const p = pendentes.get(m.id);
+      if(!p) return;
+      if(m.progresso !== undefined){ if(p.aoProgresso) p.aoProgresso(m.progresso); return; }
+      concluir(m.id);
+      if(m.cancelado) p.reject(CANCELADO);
+      else if(m.ok) p.resolve(m.resultado);
+      else p.reject(new Error(m.erro));
+    };
+    // worker.js não carregou: termina o que estava pendente na própria página
+    worker.onerror = e => {
+      e.preventDefault();
+      worker = null;
+      for(const id of Array.from(pendentes.keys())){
+        const p = concluir(id);
+        try{ p.resolve(local(p.tipo, p.args)); }catch(err){ p.reject(err); }
+      }
+    };
+  }
 
-function get_transfer_cost(slot, level){
-  if(level<=0) return 0;
-  let key = level<=4?4: level<=8?8: level<=12?12:16;
-  return (TRANSFER_COSTS[key] && TRANSFER_COSTS[key][slot]) ? TRANSFER_COSTS[key][slot] : 0;
-}
+  function cancelar(canal){
+    const id = porCanal[canal];
+    if(id === undefined) return;
+    const p = concluir(id);
+    if(worker) worker.postMessage({cancelar: id});
+    p.reject(CANCELADO);
+  }
 
-function expected_attempts(p, guarantee){
-  const q = 1 - p;
-  let E = 0.0;
-  for(let k=1;k<guarantee;k++){
-    E += k * Math.pow(q, k-1) * p;
+  function calcular(canal, tipo, args, aoProgresso){
+    cancelar(canal);
+    if(!worker){
+      try{ return Promise.resolve(local(tipo, args)); }catch(err){ return Promise.reject(err); }
+    }
+    const id = proximoId++;
+    porCanal[canal] = id;
+    return new Promise((resolve, reject) => {
+      pendentes.set(id, {tipo, args, resolve, reject, aoProgresso});
+      worker.postMessage({id, tipo, args});
+    });
   }
-  E += guarantee * Math.pow(q, guarantee-1);
-  return E;
-}
 
-function expected_crystals_for_level(slot, level){
-  if(level<1) return 0;
-  if(level>16) level = 16;
-  const [p, guarantee] = SUCCESS_TABLE[level];
-  const attempts = expected_attempts(p, guarantee);
-  return attempts * (CRYSTALS_PER_UP[slot] || 0);
-}
+  return {calcular, cancelar};
+})();
 
-function get_crystal_type_for_level(lvl){
-  if(lvl>=1 && lvl<=4) return "Cristais do Céu";
-  if(lvl>=5 && lvl<=8) return "Cristais do Sábio";
-  if(lvl>=9 && lvl<=12) return "Cristais Carmesim";
-  return "Cristais Radiante";
+// Resultado no `container`; indicador de progresso só se a tarefa demorar
+function calcularEm(container, canal, tipo, args, desenhar){
+  let aviso = setTimeout(() => { aviso = null; container.setAttribute('aria-busy', 'true'); container.textContent = '⏳ Calculando…'; }, 150);
+  const limpar = () => { if(aviso) clearTimeout(aviso); container.removeAttribute('aria-busy'); };
+  return calculadora.calcular(canal, tipo, args, fracao => {
+    if(!aviso) container.textContent = `⏳ Calculando… ${Math.round(fracao * 100)}%`;
+  }).then(r => { limpar(); desenhar(r); }, err => {
+    const mostrou = !aviso;
+    limpar();
+    if(err !== CANCELADO) container.textContent = `❌ ${err.message || err}`;
+    else if(mostrou) container.textContent = '';
+  });
 }
 
-// ----------------- Utilitários -----------------
-const $ = id => document.getElementById(id);
-function fmt(n){return (typeof n === 'number')? n.toLocaleString('pt-BR') : n}
-
-// ----------------- Experiência -----------------
-function xp_needed(n1,n2){
-  if(n1<1 || n1>=n2 || n2>140) return null;
-  return XP_TOTAL_BY_LEVEL[n2] - XP_TOTAL_BY_LEVEL[n1];
-}
-function potions_for_xp(xp, tier){
-  const vals = XP_POTION_BY_TIER[tier];
-  xp = Math.floor(xp);
-  const grandes = Math.floor(xp/vals.grande);
-  let rem = xp % vals.grande;
-  const medias = Math.floor(rem/vals.media);
-  rem = rem % vals.media;
-  const pequenas = Math.floor(rem/vals.pequena);
-  return {grandes, medias, pequenas};
+// mudar qualquer entrada do painel descarta o cálculo em andamento dele
+function cancelarAoEditar(painel, canal){
+  $(painel).querySelectorAll('.inputs input, .inputs select').forEach(el => el.addEventListener('input', () => calculadora.cancelar(canal)));
 }
 
+// ----------------- Experiência -----------------
 function renderExp(){
   const n1 = parseInt($('exp-nivel-inicio').value,10);
   const n2 = parseInt($('exp-nivel-fim').value,10);
   const tier = $('exp-tier').value;
   const container = $('exp-result');
-  container.innerHTML = '';
-  if(Number.isNaN(n1) || Number.isNaN(n2) || n1<1 || n2>140 || n1>=n2){
-    container.textContent = '❌ Nível inválido — 1 ≤ Inicial < Final ≤ 140';
+  const invalido = () => { container.textContent = `❌ Nível inválido — 1 ≤ Inicial < Final ≤ ${NIVEL_MAXIMO}`; };
+  if(Number.isNaN(n1) || Number.isNaN(n2)){
+    calculadora.cancelar('exp');
+    invalido();
     return;
   }
-  const xp = xp_needed(n1,n2);
-  const p = potions_for_xp(xp,tier);
-  const html = `
+  calcularEm(container, 'exp', 'xp', {nivel_inicial: n1, nivel_final: n2, tier}, p => {
+    if(p === null) invalido();
+    else container.innerHTML = htmlExp(n1, n2, tier, p);
+  });
+}
+
+function htmlExp(n1, n2, tier, p){
+  const xp = p.xp;
+  return `
     <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:10px;">
       <div><strong>⭐ ${tier}</strong> • Nível ${n1} → ${n2}</div>
       <div><small>XP Total: <strong>${fmt(xp)}</strong></small></div>
     </div>
     <div class="result-body">
       <div class="potions" style="gap:28px;align-items:center;">
-        <div style="text-align:center"><img src="assets/Bigexppot.png" alt="grande"><div style="margin-top:8px;font-weight:700;color:var(--accent)">× ${fmt(p.grandes)}</div><div style="font-size:12px;color:var(--muted)">Grande</div></div>
-        <div style="text-align:center"><img src="assets/Medexppot.png" alt="média"><div style="margin-top:8px;font-weight:700;color:var(--accent)">× ${fmt(p.medias)}</div><div style="font-size:12px;color:var(--muted)">Média</div></div>
-        <div style="text-align:center"><img src="assets/Smallexppot.png" alt="pequena"><div style="margin-top:8px;font-weight:700;color:var(--accent)">× ${fmt(p.pequenas)}</div><div style="font-size:12px;color:var(--muted)">Pequena</div></div>
+        <div style="text-align:center"><span class="sprite sprite-pocao-grande" role="img" aria-label="grande"></span><div style="margin-top:8px;font-weight:700;color:var(--accent)">× ${fmt(p.grandes)}</div><div style="font-size:12px;color:var(--muted)">Grande</div></div>
+        <div style="text-align:center"><span class="sprite sprite-pocao-media" role="img" aria-label="média"></span><div style="margin-top:8px;font-weight:700;color:var(--accent)">× ${fmt(p.medias)}</div><div style="font-size:12px;color:var(--muted)">Média</div></div>
+        <div style="text-align:center"><span class="sprite sprite-pocao-pequena" role="img" aria-label="pequena"></span><div style="margin-top:8px;font-weight:700;color:var(--accent)">× ${fmt(p.pequenas)}</div><div style="font-size:12px;color:var(--muted)">Pequena</div></div>
       </div>
     </div>
   `;
-  container.innerHTML = html;
 }
 
 $('exp-calc').addEventListener('click', ()=>{
   renderExp();
   saveState();
 });
+cancelarAoEditar('exp', 'exp');
 
 // ----------------- Receitas -----------------
 function initReceitas(){
   const sel = $('rcp-select');
-  sel.innerHTML = Object.keys(RECEITAS).map(k => `<option>${k}</option>`).join('');
+  sel.innerHTML = Object.keys(DADOS.receitas).map(k => `<option>${k}</option>`).join('');
   // restore
   const saved = localStorage.getItem('gla_receita');
   if(saved) sel.value = saved;
@@ -147,27 +153,26 @@ function calcularReceita(){
   const receita = $('rcp-select').value;
   const qtd = parseInt($('rcp-qtd').value,10) || 0;
   const valor = parseInt($('rcp-valor').value,10) || 0;
-  const data = RECEITAS[receita];
-  let custo = 0;
-  let texto = `📋 ${receita}\n${'─'.repeat(32)}\n\n`;
-  for(const item of Object.keys(data)){
-    const [quantiaPorUnidade, valorUnitario] = data[item];
-    const totalQuantia = quantiaPorUnidade * qtd;
-    const custoItem = Math.floor(totalQuantia * Number(valorUnitario));
-    custo += custoItem;
-    texto += `• ${item}: ${totalQuantia} unidades — Custo: ${fmt(custoItem)} berry (preço unitário: ${valorUnitario})\n`;
-  }
-  const venda = qtd * valor;
-  const taxa = Math.floor(venda * 0.03);
-  const lucro = venda - custo - taxa;
-  texto += `\n${'─'.repeat(32)}\nCusto: ${fmt(custo)}\nVenda: ${fmt(venda)}\nTaxa (3%): ${fmt(taxa)}\n💰 Lucro: ${fmt(lucro)}`;
-  $('rcp-result').textContent = texto;
+  calcularEm($('rcp-result'), 'receitas', 'receita', {receita, quantidade: qtd, valor}, r => {
+    $('rcp-result').textContent = textoReceita(receita, r);
+  });
   // persistir seleção e campos
   localStorage.setItem('gla_receita', receita);
   localStorage.setItem('gla_receita_qtd', String(qtd));
   localStorage.setItem('gla_receita_valor', String(valor));
 }
+
+function textoReceita(receita, r){
+  let texto = `📋 ${receita}\n${'─'.repeat(32)}\n\n`;
+  for(const i of r.itens){
+    texto += `• ${i.item}: ${i.quantidade} unidades — Custo: ${fmt(i.custo)} berry (preço unitário: ${i.valor_unitario})\n`;
+  }
+  const pctTaxa = Math.round(DADOS.taxa_venda * 100);
+  texto += `\n${'─'.repeat(32)}\nCusto: ${fmt(r.custo)}\nVenda: ${fmt(r.venda)}\nTaxa (${pctTaxa}%): ${fmt(r.taxa)}\n💰 Lucro: ${fmt(r.lucro)}`;
+  return texto;
+}
 $('rcp-calc').addEventListener('click', calcularReceita);
+cancelarAoEditar('receitas', 'receitas');
 
 // restore receita inputs
 window.addEventListener('load', ()=>{
@@ -179,56 +184,45 @@ window.addEventListener('load', ()=>{
 // ----------------- Cristais -----------------
 function calcularCristais(){
   const slot = $('cr-slot').value;
-  let current = parseInt($('cr-level').value,10) || 0; current = Math.max(0, Math.min(16, current));
+  let current = parseInt($('cr-level').value,10) || 0; current = Math.max(0, Math.min(NIVEL_MAXIMO_CRISTAL, current));
   const valCeu = parseInt($('val-ceu').value,10) || 0;
   const valSabio = parseInt($('val-sabio').value,10) || 0;
   const valCarmesim = parseInt($('val-carmesim').value,10) || 0;
   const valRad = parseInt($('val-radiante').value,10) || 0;
   const mapping = {"Cristais do Céu":valCeu, "Cristais do Sábio":valSabio, "Cristais Carmesim":valCarmesim, "Cristais Radiante":valRad};
-  const resultado = [];
-  let totalAvg = 0; let totalMax = 0; let totalCostLow = 0; let totalCostHigh = 0;
-  for(let lvl = current+1; lvl<=16; lvl++){
-    const [p, guarantee] = SUCCESS_TABLE[lvl];
-    const avg = expected_crystals_for_level(slot, lvl);
-    const max_cr = CRYSTALS_PER_UP[slot] * guarantee;
-    const low = Math.floor(avg);
-    const high = Math.floor(max_cr);
-    const crystalType = get_crystal_type_for_level(lvl);
-    const valor = mapping[crystalType] || 0;
-    const costLow = low * valor;
-    const costHigh = high * valor;
-    resultado.push({lvl,low,high,crystalType,valor,costLow,costHigh});
-    totalAvg += avg; totalMax += max_cr; totalCostLow += costLow; totalCostHigh += costHigh;
-  }
+  // médias e totais vêm pré-calculados em dados.js
+  calcularEm($('cr-result'), 'cristais', 'cristais', {slot, nivel_atual: current, valores: mapping}, plano => {
+    $('cr-result').innerHTML = htmlCristais(slot, current, plano);
+  });
+
+  // persistir
+  localStorage.setItem('gla_cr_slot', slot);
+  localStorage.setItem('gla_cr_level', String(current));
+  localStorage.setItem('gla_cr_vals', JSON.stringify({valCeu,valSabio,valCarmesim,valRad}));
+}
 
-  const equipImageMap = { Emblema: 'emblema.png', Capacete: 'capacete.png', 'Calça': 'calça.png', Peito: 'peito.png', Arma: 'Arma.png', Colar: 'colar.png' };
-  const equipImg = equipImageMap[slot] ? encodeURI('assets/' + equipImageMap[slot]) : '';
-  const gemImg = encodeURI('assets/gema.png');
+function htmlCristais(slot, current, plano){
+  // sprites do atlas assets/sprites.png (gerado por sprites.py)
+  const equipSprite = DADOS.sprites_equip[slot] || '';
 
   // monta saída em HTML com ícones
   let html = `<div style="display:flex;align-items:center;gap:10px;margin-bottom:8px;">`;
-  if(equipImg) html += `<img src="${equipImg}" alt="${slot}" class="equip-icon">`;
+  if(equipSprite) html += `<span class="sprite sprite-${equipSprite} equip-icon" role="img" aria-label="${slot}"></span>`;
   html += `<div><strong>${slot}</strong> — Nível atual +${current}</div></div>`;
 
-  const transfer = get_transfer_cost(slot, current);
-  html += `<div style="margin-bottom:8px;">Custo para transferir o boost: <img src="${gemImg}" alt="gema" class="small-icon"> <strong>${transfer}</strong> gemas</div>`;
+  html += `<div style="margin-bottom:8px;">Custo para transferir o boost: <span class="sprite sprite-gema small-icon" role="img" aria-label="gema"></span> <strong>${plano.gemas_transferencia}</strong> gemas</div>`;
 
-  if(resultado.length===0) html += '<div>Nenhum nível acima do atual.</div>';
-  resultado.forEach(r => {
-    html += `<div>Média para o nível +${r.lvl}: <strong>${fmt(r.low)}</strong> a <strong>${fmt(r.high)}</strong> cristais (tipo: ${r.crystalType}) → ${fmt(r.costLow)} a ${fmt(r.costHigh)} berry</div>`;
+  if(plano.niveis.length===0) html += '<div>Nenhum nível acima do atual.</div>';
+  plano.niveis.forEach(r => {
+    html += `<div>Média para o nível +${r.nivel}: <strong>${fmt(r.minimo)}</strong> a <strong>${fmt(r.maximo)}</strong> cristais (tipo: ${r.tipo}) → ${fmt(r.custo_minimo)} a ${fmt(r.custo_maximo)} berry</div>`;
   });
 
-  html += `<div style="margin-top:10px;"><strong>Total (média somada): ${fmt(Math.floor(totalAvg))} a ${fmt(Math.floor(totalMax))} cristais</strong> → ${fmt(Math.floor(totalCostLow))} a ${fmt(Math.floor(totalCostHigh))} berry</div>`;
+  html += `<div style="margin-top:10px;"><strong>Total (média somada): ${fmt(Math.floor(plano.total_media))} a ${fmt(Math.floor(plano.total_maximo))} cristais</strong> → ${fmt(Math.floor(plano.total_custo_minimo))} a ${fmt(Math.floor(plano.total_custo_maximo))} berry</div>`;
   html += `<div style="margin-top:8px;color:var(--muted)">Nota: médias calculadas usando chance por nível e pity garantido.</div>`;
-
-  $('cr-result').innerHTML = html;
-
-  // persistir
-  localStorage.setItem('gla_cr_slot', slot);
-  localStorage.setItem('gla_cr_level', String(current));
-  localStorage.setItem('gla_cr_vals', JSON.stringify({valCeu,valSabio,valCarmesim,valRad}));
+  return html;
 }
 $('cr-calc').addEventListener('click', calcularCristais);
+cancelarAoEditar('cristais', 'cristais');
 
 // restore cristais inputs on load
 window.addEventListener('load', ()=>{
@@ -269,6 +263,21 @@ window.addEventListener('load', ()=>{
   const n2 = localStorage.getItem('gla_exp_n2'); if(n2) $('exp-nivel-fim').value = n2;
 });
 
+// ----------------- Offline (service worker) -----------------
+// sw.js guarda os arquivos da página (manifesto em precache.js). Uma versão
+// nova é baixada em segundo plano e assume quando a aba fica oculta; ao
+// voltar para a aba o site confere se há versão nova.
+if('serviceWorker' in navigator && location.protocol !== 'file:'){
+  window.addEventListener('load', ()=>{
+    navigator.serviceWorker.register('sw.js', {updateViaCache: 'none'}).then(reg => {
+      document.addEventListener('visibilitychange', ()=>{
+        if(document.visibilityState === 'hidden'){ if(reg.waiting) reg.waiting.postMessage('ativar'); }
+        else reg.update().catch(()=>{});
+      });
+    }).catch(()=>{});
+  });
+}
+
 // Expose some functions for debugging (optional)
-window._GLA = {xp_needed, potions_for_xp, expected_attempts};
+window._GLA = GLA_CALCULOS;
 
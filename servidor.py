@@ -0,0 +1,270 @@
+# Servidor HTTP local (asyncio, só biblioteca padrão) com as calculadoras do GLA Tools
+# Pensado para o bot da guilda: escuta em 127.0.0.1 por padrão.
+#
+# Uso: python servidor.py --porta 8765
+#
+# Endpoints (GET com query string ou POST com corpo JSON):
+#   /xp        nivel_inicial, nivel_final, tier
+#   /pocoes    nivel_inicial, nivel_final, tier, estoque e precos ({tamanho: n} em JSON), objetivo
+#   /nivel     nivel_inicial, xp ou pocoes ({tamanho: n} em JSON), tier, progresso
+#   /niveis    lote: niveis_iniciais, xps ou pocoes, progressos (listas JSON), tier
+#   /receita   receita, quantidade, valor
+#   /cristais  slot, nivel_atual, nivel_alvo, valores (objeto JSON), percentis
+#   /equipamento  niveis ({slot: nível} em JSON), valores, nivel_alvo
+#   /orcamento orcamento, valores, niveis, pesos ({slot: peso} em JSON), criterio, nivel_alvo
+#   /metricas  contadores de requisições, cache, latência e versão dos dados do jogo
+#
+# O arquivo de dados do jogo é vigiado: uma versão nova é aplicada sem reiniciar
+# (e o cache de respostas é esvaziado); uma versão inválida é ignorada.
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import traceback
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qsl
+
+from calculos import dados_atuais, ao_recarregar, recarregar_se_mudou, DadosInvalidos
+from consultas import responder, ConsultaInvalida
+
+HOST_PADRAO = "127.0.0.1"
+PORTA_PADRAO = 8765
+TAMANHO_CACHE = 4096
+LIMITE_CORPO = 64 * 1024
+INTERVALO_DADOS_S = 2.0
+
+ROTAS = {"/xp": "xp", "/pocoes": "pocoes", "/nivel": "nivel", "/niveis": "niveis",
+         "/receita": "receita", "/cristais": "cristais",
+         "/equipamento": "equipamento", "/orcamento": "orcamento"}
+
+STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+          413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class CacheRespostas:
+    """Cache LRU de respostas já serializadas, chaveado pelas entradas normalizadas."""
+    def __init__(self, tamanho=TAMANHO_CACHE):
+        self.tamanho = tamanho
+        self._dados = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, chave):
+        corpo = self._dados.get(chave)
+        if corpo is None:
+            self.falhas += 1
+            return None
+        self._dados.move_to_end(chave)
+        self.acertos += 1
+        return corpo
+
+    def guardar(self, chave, corpo):
+        self._dados[chave] = corpo
+        self._dados.move_to_end(chave)
+        if len(self._dados) > self.tamanho:
+            self._dados.popitem(last=False)
+
+    def __len__(self):
+        return len(self._dados)
+
+    def limpar(self):
+        self._dados.clear()
+
+
+class Metricas:
+    """Contadores de requisições e latência (em ms) por rota."""
+    def __init__(self):
+        self.inicio = time.time()
+        self.por_rota = {}
+
+    def registrar(self, rota, status, segundos):
+        m = self.por_rota.setdefault(rota, {"requisicoes": 0, "erros": 0, "latencia_total_ms": 0.0,
+                                            "latencia_max_ms": 0.0})
+        ms = segundos * 1000
+        m["requisicoes"] += 1
+        if status >= 400:
+            m["erros"] += 1
+        m["latencia_total_ms"] += ms
+        m["latencia_max_ms"] = max(m["latencia_max_ms"], ms)
+
+    def resumo(self, cache):
+        rotas = {}
+        for rota, m in self.por_rota.items():
+            r = dict(m)
+            r["latencia_media_ms"] = m["latencia_total_ms"] / m["requisicoes"]
+            rotas[rota] = r
+        return {
+            "uptime_s": time.time() - self.inicio,
+            "rotas": rotas,
+            "cache": {"itens": len(cache), "acertos": cache.acertos, "falhas": cache.falhas},
+            "dados": {"versao": dados_atuais["versao"], "hash": dados_atuais["hash"]}
+        }
+
+
+def _normalizar(params):
+    """Converte valores de query string (texto) para tipos canônicos."""
+    out = {}
+    for k, v in params.items():
+        if isinstance(v, str):
+            s = v.strip()
+            if s.lstrip("-").isdigit():
+                v = int(s)
+            elif s.lower() in ("true", "false"):
+                v = s.lower() == "true"
+            elif k in ("valores", "niveis", "pesos", "estoque", "precos", "pocoes",
+                       "niveis_iniciais", "xps", "progressos"):
+                try:
+                    v = json.loads(s)
+                except ValueError:
+                    raise ConsultaInvalida(f"{k} deve ser JSON válido")
+        out[k] = v
+    return out
+
+
+def _tamanho_corpo(valor):
+    """Content-Length como inteiro ≥ 0 (0 se ausente); None se inválido."""
+    if valor is None or valor == "":
+        return 0
+    if not valor.isdigit() or not valor.isascii():
+        return None
+    return int(valor)
+
+
+class ServidorGLA:
+    def __init__(self, tamanho_cache=TAMANHO_CACHE):
+        self.cache = CacheRespostas(tamanho_cache)
+        self.metricas = Metricas()
+        # respostas em cache foram calculadas com as tabelas antigas
+        ao_recarregar.append(lambda info: self.cache.limpar())
+
+    def responder_rota(self, metodo, alvo, corpo):
+        """Processa uma requisição já lida; devolve (status, corpo_bytes)."""
+        partes = urlsplit(alvo)
+        rota = partes.path.rstrip("/") or "/"
+        if rota == "/metricas":
+            return 200, json.dumps(self.metricas.resumo(self.cache), ensure_ascii=False).encode("utf-8")
+        tipo = ROTAS.get(rota)
+        if tipo is None:
+            return 404, b'{"erro": "rota desconhecida"}'
+        try:
+            if metodo == "GET":
+                params = dict(parse_qsl(partes.query))
+            elif metodo == "POST":
+                params = json.loads(corpo or b"{}")
+                if not isinstance(params, dict):
+                    raise ConsultaInvalida("corpo deve ser um objeto JSON")
+            else:
+                return 405, b'{"erro": "metodo nao suportado"}'
+            params = _normalizar(params)
+            params["tipo"] = tipo
+            chave = json.dumps(params, sort_keys=True, ensure_ascii=False)
+            em_cache = self.cache.obter(chave)
+            if em_cache is not None:
+                return 200, em_cache
+            # allow_nan=False: inf/nan não são JSON; viram 400 em vez de uma resposta inválida
+            resultado = json.dumps(responder(params), ensure_ascii=False, allow_nan=False).encode("utf-8")
+            self.cache.guardar(chave, resultado)
+            return 200, resultado
+        except (ValueError, OverflowError, ConsultaInvalida) as e:
+            return 400, json.dumps({"erro": str(e)}, ensure_ascii=False).encode("utf-8")
+
+    async def tratar_conexao(self, reader, writer):
+        try:
+            while True:
+                linha = await reader.readline()
+                if not linha:
+                    break
+                inicio = time.perf_counter()
+                try:
+                    metodo, alvo, versao = linha.decode("latin-1").split()
+                except ValueError:
+                    break
+                cabecalhos = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    nome, _, valor = h.decode("latin-1").partition(":")
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+                tamanho = _tamanho_corpo(cabecalhos.get("content-length"))
+                if tamanho is None:
+                    # sem saber onde o corpo termina, a conexão não dá para reaproveitar
+                    status, corpo = 400, b'{"erro": "content-length invalido"}'
+                    manter = False
+                elif tamanho > LIMITE_CORPO:
+                    status, corpo = 413, b'{"erro": "corpo muito grande"}'
+                    manter = False
+                else:
+                    dados = await reader.readexactly(tamanho) if tamanho else b""
+                    try:
+                        status, corpo = self.responder_rota(metodo.upper(), alvo, dados)
+                    except Exception:
+                        # entrada inválida vira 400 em consultas; o que escapar é
+                        # bug: responde 500 (e conta nas métricas) em vez de
+                        # fechar a conexão sem resposta
+                        traceback.print_exc(file=sys.stderr)
+                        status, corpo = 500, b'{"erro": "erro interno"}'
+                    conexao = cabecalhos.get("connection", "").lower()
+                    manter = conexao != "close" if versao == "HTTP/1.1" else conexao == "keep-alive"
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(corpo)}\r\n"
+                    f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode("latin-1") + corpo
+                )
+                await writer.drain()
+                rota = urlsplit(alvo).path.rstrip("/")
+                if rota not in ROTAS and rota != "/metricas":
+                    rota = "outras"
+                self.metricas.registrar(rota, status, time.perf_counter() - inicio)
+                if not manter:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            # conexão encerrada ou cabeçalhos malformados
+            pass
+        finally:
+            writer.close()
+
+    async def iniciar(self, host=HOST_PADRAO, porta=PORTA_PADRAO):
+        """Inicia o servidor (porta 0 escolhe uma porta livre) e devolve o asyncio.Server."""
+        return await asyncio.start_server(self.tratar_conexao, host, porta)
+
+
+async def vigiar_dados(intervalo=INTERVALO_DADOS_S):
+    """Recarrega os dados do jogo quando o arquivo muda (polling no próprio loop)."""
+    while True:
+        await asyncio.sleep(intervalo)
+        try:
+            if recarregar_se_mudou():
+                print(f"dados do jogo recarregados: versão {dados_atuais['versao']}")
+        except DadosInvalidos as e:
+            print(f"{e} — mantendo a versão {dados_atuais['versao']}")
+
+
+async def _rodar(host, porta):
+    servidor = await ServidorGLA().iniciar(host, porta)
+    enderecos = ", ".join(str(s.getsockname()) for s in servidor.sockets)
+    print(f"GLA Tools API escutando em {enderecos} (dados do jogo: versão {dados_atuais['versao']})")
+    vigia = asyncio.create_task(vigiar_dados())
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        vigia.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API HTTP local do GLA Tools")
+    parser.add_argument("--host", default=HOST_PADRAO)
+    parser.add_argument("--porta", type=int, default=PORTA_PADRAO)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_rodar(args.host, args.porta))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# Simulação Monte Carlo de upgrades de equipamento (com pity)
+# Requer numpy (pip install numpy). Não é usado pela interface Tk — serve para
+# validar "e se" de mecânicas (taxas alteradas etc.) que a fórmula fechada não cobre.
+#
+# Uso: python simulacao.py Peito --atual 3 --alvo 12 --trials 10000000 --processos 4
+
+import argparse
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from calculos import (
+    SUCCESS_TABLE, crystals_per_up, cristais_tipos, NIVEL_MAXIMO_CRISTAL,
+    get_crystal_type_for_level, get_transfer_cost
+)
+
+LOTE_PADRAO = 1_000_000
+
+
+def _tentativas(rng, p, guarantee, n):
+    """Sorteia `n` contagens de tentativas: geométrica truncada no pity."""
+    if p <= 0:
+        return np.full(n, guarantee, dtype=np.int64)
+    if p >= 1:
+        return np.ones(n, dtype=np.int64)
+    return np.minimum(rng.geometric(p, n), guarantee)
+
+
+def simular_lote(n, seed, niveis, por_up):
+    """Simula `n` execuções completas e devolve apenas agregados (memória constante).
+
+    `niveis` é uma lista de (nível, p, guarantee); `seed` é uma SeedSequence
+    (ou inteiro) — o mesmo seed sempre produz o mesmo lote.
+    """
+    rng = np.random.default_rng(seed)
+    total = np.zeros(n, dtype=np.int64)
+    por_tipo = {t: 0 for t in cristais_tipos}
+    for lvl, p, guarantee in niveis:
+        att = _tentativas(rng, p, guarantee, n)
+        total += att
+        por_tipo[get_crystal_type_for_level(lvl)] += int(att.sum()) * por_up
+    total *= por_up
+    return {
+        "n": n,
+        "soma": float(total.sum()),
+        "soma_quad": float(np.square(total, dtype=np.float64).sum()),
+        "minimo": int(total.min()) if n else 0,
+        "maximo": int(total.max()) if n else 0,
+        "histograma": np.bincount(total).tolist() if n else [],
+        "por_tipo": por_tipo
+    }
+
+
+def _juntar(acc, lote):
+    if acc is None:
+        return lote
+    hist_a, hist_b = acc["histograma"], lote["histograma"]
+    if len(hist_a) < len(hist_b):
+        hist_a, hist_b = hist_b, hist_a
+    hist = list(hist_a)
+    for i, c in enumerate(hist_b):
+        hist[i] += c
+    return {
+        "n": acc["n"] + lote["n"],
+        "soma": acc["soma"] + lote["soma"],
+        "soma_quad": acc["soma_quad"] + lote["soma_quad"],
+        "minimo": min(acc["minimo"], lote["minimo"]),
+        "maximo": max(acc["maximo"], lote["maximo"]),
+        "histograma": hist,
+        "por_tipo": {t: acc["por_tipo"][t] + lote["por_tipo"][t] for t in acc["por_tipo"]}
+    }
+
+
+def _percentil(hist, n, q):
+    alvo = q * n
+    acumulado = 0
+    for valor, c in enumerate(hist):
+        acumulado += c
+        if acumulado >= alvo:
+            return valor
+    return len(hist) - 1
+
+
+def simular(slot, atual=0, alvo=NIVEL_MAXIMO_CRISTAL, trials=LOTE_PADRAO, seed=None,
+            processos=1, lote=LOTE_PADRAO, largura_ic=None, confianca=0.95,
+            tabela=None, por_up=None, valores=None):
+    """Estima por Monte Carlo os cristais para levar `slot` de +`atual` a +`alvo`.
+
+    - `tabela`/`por_up` substituem `SUCCESS_TABLE`/`crystals_per_up` (cenários "e se").
+    - `processos` > 1 divide os lotes num pool de processos; cada lote i usa a
+      i-ésima semente derivada de `seed`, então o resultado não depende do
+      número de processos.
+    - `largura_ic`: para antes de `trials` quando a largura do intervalo de
+      confiança da média ficar ≤ esse valor (conferida a cada lote, na ordem
+      dos lotes — mesmo ponto de parada com qualquer número de processos).
+    - `valores`: preço em berry por tipo de cristal (para o custo médio).
+
+    Retorna um dict com média, desvio, intervalo de confiança, percentis e
+    divisão média por tipo de cristal.
+    """
+    tabela = SUCCESS_TABLE if tabela is None else tabela
+    if por_up is None:
+        por_up = crystals_per_up[slot]
+    atual = max(0, min(int(atual), NIVEL_MAXIMO_CRISTAL))
+    alvo = max(atual, min(int(alvo), NIVEL_MAXIMO_CRISTAL))
+    niveis = [(lvl,) + tuple(tabela[lvl]) for lvl in range(atual + 1, alvo + 1)]
+    z = NormalDist().inv_cdf((1 + confianca) / 2)
+    raiz = np.random.SeedSequence(seed)
+    processos = max(1, int(processos))
+    lote = max(1, int(lote))
+
+    acc = None
+    restante = int(trials)
+    pool = ProcessPoolExecutor(processos) if processos > 1 else None
+    try:
+        while restante > 0:
+            tamanhos = []
+            while restante > 0 and len(tamanhos) < processos:
+                tamanhos.append(min(lote, restante))
+                restante -= tamanhos[-1]
+            sementes = raiz.spawn(len(tamanhos))
+            if pool:
+                futuros = [pool.submit(simular_lote, t, s, niveis, por_up) for t, s in zip(tamanhos, sementes)]
+                resultados = (f.result() for f in futuros)
+            else:
+                futuros = []
+                resultados = (simular_lote(t, s, niveis, por_up) for t, s in zip(tamanhos, sementes))
+            # lotes juntados na ordem e o IC conferido após cada um: o ponto de
+            # parada (e o número de trials) não depende do número de processos
+            parar = False
+            for r in resultados:
+                acc = _juntar(acc, r)
+                if largura_ic is not None and acc["n"] > 1:
+                    var = (acc["soma_quad"] - acc["soma"] ** 2 / acc["n"]) / (acc["n"] - 1)
+                    if 2 * z * (max(var, 0.0) / acc["n"]) ** 0.5 <= largura_ic:
+                        parar = True
+                        break
+            if parar:
+                for f in futuros:
+                    f.cancel()
+                break
+    finally:
+        if pool:
+            pool.shutdown()
+
+    n = acc["n"] if acc else 0
+    if not n:
+        raise ValueError("trials deve ser ≥ 1")
+    media = acc["soma"] / n
+    var = (acc["soma_quad"] - acc["soma"] ** 2 / n) / (n - 1) if n > 1 else 0.0
+    var = max(var, 0.0)
+    meia = z * (var / n) ** 0.5
+    media_por_tipo = {t: acc["por_tipo"][t] / n for t in cristais_tipos}
+    resultado = {
+        "slot": slot,
+        "nivel_atual": atual,
+        "nivel_alvo": alvo,
+        "trials": n,
+        "media": media,
+        "variancia": var,
+        "desvio": var ** 0.5,
+        "ic": (media - meia, media + meia),
+        "confianca": confianca,
+        "minimo": acc["minimo"],
+        "maximo": acc["maximo"],
+        "p50": _percentil(acc["histograma"], n, 0.5),
+        "p90": _percentil(acc["histograma"], n, 0.9),
+        "p99": _percentil(acc["histograma"], n, 0.99),
+        "media_por_tipo": media_por_tipo,
+        # mesmo critério de plano_cristais: o custo depende do nível de partida
+        "gemas_transferencia": get_transfer_cost(slot, atual)
+    }
+    if valores:
+        resultado["custo_medio"] = sum(media_por_tipo[t] * valores.get(t, 0) for t in cristais_tipos)
+    return resultado
+
+
+def _positivo(texto):
+    """Tipo do argparse: inteiro ≥ 1 (erro de uso em vez de traceback)."""
+    try:
+        n = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"inteiro inválido: {texto!r}")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"deve ser ≥ 1: {n}")
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulação Monte Carlo de upgrades (GLA Tools)")
+    parser.add_argument("slot", choices=list(crystals_per_up))
+    parser.add_argument("--atual", type=int, default=0)
+    parser.add_argument("--alvo", type=int, default=NIVEL_MAXIMO_CRISTAL)
+    parser.add_argument("--trials", type=_positivo, default=LOTE_PADRAO)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--processos", type=_positivo, default=1)
+    parser.add_argument("--lote", type=_positivo, default=LOTE_PADRAO)
+    parser.add_argument("--largura-ic", type=float, default=None)
+    parser.add_argument("--confianca", type=float, default=0.95)
+    args = parser.parse_args(argv)
+    r = simular(args.slot, args.atual, args.alvo, trials=args.trials, seed=args.seed,
+                processos=args.processos, lote=args.lote, largura_ic=args.largura_ic,
+                confianca=args.confianca)
+    json.dump(r, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
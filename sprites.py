@@ -0,0 +1,276 @@
+# Atlas de sprites pré-redimensionados (app Tk e versão web)
+#
+# Build (requer Pillow):  python sprites.py
+#   assets/sprites.bin  pacote do app: um atlas PNG por tamanho + índice
+#   assets/sprites.png  atlas único da versão web (2x para telas de alta densidade)
+#   assets/sprites.css  classes .sprite-<nome> com a posição de cada sprite
+#
+# Em tempo de execução só a leitura do pacote é usada (mmap + índice lido uma
+# vez); Pillow é importado apenas pelo build.
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PASTA_ASSETS = os.path.join(BASE_DIR, "assets")
+ARQUIVO_PACOTE = os.path.join(PASTA_ASSETS, "sprites.bin")
+ARQUIVO_ATLAS_WEB = os.path.join(PASTA_ASSETS, "sprites.png")
+ARQUIVO_CSS_WEB = os.path.join(PASTA_ASSETS, "sprites.css")
+
+MAGICO = b"GLASPR1\n"
+VERSAO_PACOTE = 1
+
+# nome lógico → arquivo de origem em assets/
+FONTES = {
+    "logo": "logo.png",
+    "pocao/grande": "Bigexppot.png",
+    "pocao/média": "Medexppot.png",
+    "pocao/pequena": "Smallexppot.png",
+    "cristal/Cristais do Céu": "cristal do ceu.png",
+    "cristal/Cristais do Sábio": "cristal do sabio.png",
+    "cristal/Cristais Carmesim": "cristal carmesim.png",
+    "cristal/Cristais Radiante": "cristal radiante.png",
+    "equip/Emblema": "emblema.png",
+    "equip/Capacete": "capacete.png",
+    "equip/Calça": "calça.png",
+    "equip/Peito": "peito.png",
+    "equip/Arma": "Arma.png",
+    "equip/Colar": "colar.png",
+    "gema": "gema.png",
+}
+
+# Tamanhos usados pelos carregar_* do app (redimensionamento igual ao PIL .resize)
+SPRITES_APP = [
+    ("logo", (120, 40)), ("logo", (160, 80)), ("logo", (180, 90)),
+    ("pocao/grande", (60, 60)), ("pocao/média", (60, 60)), ("pocao/pequena", (60, 60)),
+    ("cristal/Cristais do Céu", (36, 36)), ("cristal/Cristais do Sábio", (36, 36)),
+    ("cristal/Cristais Carmesim", (36, 36)), ("cristal/Cristais Radiante", (36, 36)),
+    ("equip/Emblema", (28, 28)), ("equip/Capacete", (28, 28)), ("equip/Calça", (28, 28)),
+    ("equip/Peito", (28, 28)), ("equip/Arma", (28, 28)), ("equip/Colar", (28, 28)),
+    ("gema", (18, 18)), ("gema", (20, 20)),
+]
+
+# Versão web: (nome, classe CSS, tamanho exibido em px); o atlas guarda 2x,
+# com a imagem contida (proporção mantida) como no object-fit: contain do CSS
+ESCALA_WEB = 2
+SPRITES_WEB = [
+    ("logo", "logo", (64, 64)),
+    ("logo", "logo-rodape", (48, 48)),
+    ("pocao/grande", "pocao-grande", (64, 64)),
+    ("pocao/média", "pocao-media", (64, 64)),
+    ("pocao/pequena", "pocao-pequena", (64, 64)),
+    ("equip/Emblema", "equip-emblema", (28, 28)),
+    ("equip/Capacete", "equip-capacete", (28, 28)),
+    ("equip/Calça", "equip-calca", (28, 28)),
+    ("equip/Peito", "equip-peito", (28, 28)),
+    ("equip/Arma", "equip-arma", (28, 28)),
+    ("equip/Colar", "equip-colar", (28, 28)),
+    ("gema", "gema", (18, 18)),
+]
+
+
+def chave_sprite(nome, tamanho):
+    return f"{nome}@{tamanho[0]}x{tamanho[1]}"
+
+
+class PacoteSprites:
+    """Leitor do pacote `sprites.bin`: arquivo mapeado em memória, índice lido uma vez.
+
+    `sprite(nome, tamanho)` devolve o retângulo do sprite no seu atlas (ou None)
+    e `dados_atlas(grupo)` os bytes PNG do atlas, sem copiar o arquivo inteiro.
+    """
+    def __init__(self, caminho=ARQUIVO_PACOTE):
+        self._arquivo = open(caminho, "rb")
+        try:
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            self._arquivo.close()
+            raise
+        if self._mapa[:len(MAGICO)] != MAGICO:
+            self.fechar()
+            raise ValueError(f"pacote de sprites inválido: {caminho}")
+        inicio = len(MAGICO)
+        (tamanho_indice,) = struct.unpack_from("<I", self._mapa, inicio)
+        inicio += 4
+        indice = json.loads(self._mapa[inicio:inicio + tamanho_indice].decode("utf-8"))
+        self._base = inicio + tamanho_indice
+        self.assinatura = indice.get("assinatura")
+        self.atlas = indice["atlas"]
+        self.sprites = indice["sprites"]
+
+    def sprite(self, nome, tamanho):
+        return self.sprites.get(chave_sprite(nome, tamanho))
+
+    def dados_atlas(self, grupo):
+        a = self.atlas[grupo]
+        inicio = self._base + a["offset"]
+        return self._mapa[inicio:inicio + a["tamanho"]]
+
+    def fechar(self):
+        self._mapa.close()
+        self._arquivo.close()
+
+
+def abrir_pacote(caminho=ARQUIVO_PACOTE):
+    """Abre o pacote se existir; None se ausente ou inválido (o app cai no PNG avulso)."""
+    try:
+        return PacoteSprites(caminho)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+# ================= BUILD (Pillow) =================
+def _redimensionar(img, tamanho, conter=False):
+    from PIL import Image
+    img = img.convert("RGBA")
+    if not conter:
+        return img.resize(tamanho, Image.LANCZOS)
+    escala = min(tamanho[0] / img.width, tamanho[1] / img.height)
+    w, h = max(1, round(img.width * escala)), max(1, round(img.height * escala))
+    quadro = Image.new("RGBA", tamanho, (0, 0, 0, 0))
+    quadro.paste(img.resize((w, h), Image.LANCZOS), ((tamanho[0] - w) // 2, (tamanho[1] - h) // 2))
+    return quadro
+
+
+def _empacotar(imagens, espaco=1):
+    """Empacota em prateleiras (maiores primeiro); devolve (largura, altura, posições)."""
+    ordem = sorted(range(len(imagens)), key=lambda i: (-imagens[i].height, -imagens[i].width))
+    largura = max(256, max(img.width for img in imagens))
+    x = y = altura_prateleira = 0
+    posicoes = [None] * len(imagens)
+    for i in ordem:
+        img = imagens[i]
+        if x + img.width > largura:
+            x, y = 0, y + altura_prateleira + espaco
+            altura_prateleira = 0
+        posicoes[i] = (x, y)
+        x += img.width + espaco
+        altura_prateleira = max(altura_prateleira, img.height)
+    return largura, y + altura_prateleira, posicoes
+
+
+def _montar_atlas(imagens, espaco=1):
+    from PIL import Image
+    largura, altura, posicoes = _empacotar(imagens, espaco)
+    atlas = Image.new("RGBA", (largura, altura), (0, 0, 0, 0))
+    for img, pos in zip(imagens, posicoes):
+        atlas.paste(img, pos)
+    return atlas, posicoes
+
+
+def _png(img):
+    import io
+    buf = io.BytesIO()
+    img.save(buf, "PNG", optimize=True)
+    return buf.getvalue()
+
+
+def _abrir_fontes(pasta):
+    from PIL import Image
+    fontes = {}
+    for nome, arquivo in FONTES.items():
+        with Image.open(os.path.join(pasta, arquivo)) as img:
+            img.load()
+            fontes[nome] = img.copy()
+    return fontes
+
+
+def _assinatura(pasta):
+    h = hashlib.sha1()
+    h.update(repr((VERSAO_PACOTE, SPRITES_APP, SPRITES_WEB, ESCALA_WEB)).encode("utf-8"))
+    for nome, arquivo in sorted(FONTES.items()):
+        with open(os.path.join(pasta, arquivo), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def construir_pacote(fontes, assinatura, destino=ARQUIVO_PACOTE):
+    """Um atlas por tamanho (decodificado só quando um sprite daquele tamanho é pedido)."""
+    grupos = {}
+    for nome, tamanho in SPRITES_APP:
+        grupos.setdefault(f"{tamanho[0]}x{tamanho[1]}", []).append((nome, tamanho))
+    atlas_idx, sprites_idx, blobs = {}, {}, []
+    offset = 0
+    for grupo, itens in grupos.items():
+        atlas, posicoes = _montar_atlas([_redimensionar(fontes[n], t) for n, t in itens])
+        dados = _png(atlas)
+        atlas_idx[grupo] = {"offset": offset, "tamanho": len(dados), "largura": atlas.width, "altura": atlas.height}
+        for (nome, tamanho), (x, y) in zip(itens, posicoes):
+            sprites_idx[chave_sprite(nome, tamanho)] = {"atlas": grupo, "x": x, "y": y, "w": tamanho[0], "h": tamanho[1]}
+        blobs.append(dados)
+        offset += len(dados)
+    indice = json.dumps({"versao": VERSAO_PACOTE, "assinatura": assinatura,
+                         "atlas": atlas_idx, "sprites": sprites_idx}, ensure_ascii=False).encode("utf-8")
+    tmp = destino + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGICO)
+        f.write(struct.pack("<I", len(indice)))
+        f.write(indice)
+        for dados in blobs:
+            f.write(dados)
+    os.replace(tmp, destino)
+    return offset + len(indice)
+
+
+def construir_web(fontes, destino_png=ARQUIVO_ATLAS_WEB, destino_css=ARQUIVO_CSS_WEB):
+    """Atlas único da versão web e a folha de estilos com as posições (em px de CSS)."""
+    imagens = [_redimensionar(fontes[n], (t[0] * ESCALA_WEB, t[1] * ESCALA_WEB), conter=True)
+               for n, _, t in SPRITES_WEB]
+    # espaçamento múltiplo da escala mantém as posições em px inteiros no CSS
+    atlas, posicoes = _montar_atlas(imagens, espaco=ESCALA_WEB)
+    dados = _png(atlas)
+    with open(destino_png, "wb") as f:
+        f.write(dados)
+    versao = hashlib.sha1(dados).hexdigest()[:10]
+    linhas = [
+        "/* Gerado por sprites.py — não editar */",
+        f".sprite{{display:inline-block;vertical-align:middle;background:url(sprites.png?v={versao}) no-repeat;"
+        f"background-size:{atlas.width / ESCALA_WEB:g}px {atlas.height / ESCALA_WEB:g}px}}",
+    ]
+    for (_, classe, (w, h)), (x, y) in zip(SPRITES_WEB, posicoes):
+        linhas.append(f".sprite-{classe}{{width:{w}px;height:{h}px;"
+                      f"background-position:-{x / ESCALA_WEB:g}px -{y / ESCALA_WEB:g}px}}")
+    with open(destino_css, "w", encoding="utf-8", newline="\n") as f:
+        f.write("\n".join(linhas) + "\n")
+    return len(dados)
+
+
+def construir(pasta=PASTA_ASSETS, forcar=False):
+    """Gera pacote do app e atlas web; pula se as fontes não mudaram."""
+    assinatura = _assinatura(pasta)
+    atual = abrir_pacote(os.path.join(pasta, "sprites.bin"))
+    if atual is not None:
+        try:
+            em_dia = not forcar and atual.assinatura == assinatura and os.path.exists(
+                os.path.join(pasta, "sprites.png")) and os.path.exists(os.path.join(pasta, "sprites.css"))
+        finally:
+            atual.fechar()
+        if em_dia:
+            return None
+    fontes = _abrir_fontes(pasta)
+    return {
+        "pacote": construir_pacote(fontes, assinatura, os.path.join(pasta, "sprites.bin")),
+        "web": construir_web(fontes, os.path.join(pasta, "sprites.png"), os.path.join(pasta, "sprites.css")),
+    }
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Gera os atlas de sprites do GLA Tools")
+    parser.add_argument("--pasta", default=PASTA_ASSETS, help="pasta com os PNGs de origem")
+    parser.add_argument("--forcar", action="store_true", help="regera mesmo sem mudanças")
+    args = parser.parse_args(argv)
+    r = construir(args.pasta, args.forcar)
+    if r is None:
+        print("sprites em dia")
+    else:
+        print(f"sprites.bin: {r['pacote']:,} bytes | sprites.png (web): {r['web']:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+/* GLA Tools — service worker (offline-first)
+   Manifesto em precache.js (gerado por web_precache.py): {versao, arquivos: {url: hash}}.
+
+   - install: guarda cada arquivo do manifesto no cache da versão, com a chave
+     `url?v=hash`; o que não mudou desde a versão anterior é copiado do cache
+     antigo em vez de baixado de novo. Um arquivo baixado com hash diferente do
+     manifesto (deploy pela metade) falha a instalação, que é refeita depois.
+   - fetch: arquivos do manifesto saem do cache (cache-first, ignorando a query
+     string, como em sprites.png?v=...); o resto segue para a rede.
+   - atualização: o navegador confere sw.js e precache.js a cada visita; a
+     versão nova instala em segundo plano e assume quando a página pede
+     ('ativar', enviado por script.js quando a aba fica oculta) ou na próxima
+     visita, sem misturar arquivos de duas versões na mesma página.
+*/
+
+importScripts('precache.js');
+
+const PREFIXO_CACHE = 'gla-tools-';
+const CACHE = PREFIXO_CACHE + PRECACHE.versao;
+const ESCOPO = new URL(self.registration.scope);
+
+function chave(url){
+  return new URL(`${url}?v=${PRECACHE.arquivos[url]}`, ESCOPO).href;
+}
+
+// caminho relativo ao escopo, sem query; null se for de fora do site
+function relativo(endereco){
+  const url = new URL(endereco);
+  if(url.origin !== ESCOPO.origin || !url.pathname.startsWith(ESCOPO.pathname)) return null;
+  const rel = decodeURIComponent(url.pathname.slice(ESCOPO.pathname.length));
+  return rel === '' ? 'index.html' : rel;
+}
+
+async function hashConteudo(resposta){
+  const digest = await crypto.subtle.digest('SHA-256', await resposta.clone().arrayBuffer());
+  return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('').slice(0, 16);
+}
+
+async function precachear(){
+  const cache = await caches.open(CACHE);
+  await Promise.all(Object.keys(PRECACHE.arquivos).map(async url => {
+    const k = chave(url);
+    if(await cache.match(k)) return;
+    let resposta = await caches.match(k);   // mesmo conteúdo numa versão anterior
+    if(!resposta){
+      resposta = await fetch(new URL(url, ESCOPO), {cache: 'no-cache'});
+      if(!resposta.ok) throw new Error(`${url}: HTTP ${resposta.status}`);
+      if(await hashConteudo(resposta) !== PRECACHE.arquivos[url]) throw new Error(`${url}: conteúdo fora do manifesto`);
+    }
+    await cache.put(k, resposta);
+  }));
+}
+
+self.addEventListener('install', e => e.waitUntil(precachear()));
+
+self.addEventListener('activate', e => {
+  e.waitUntil((async () => {
+    for(const nome of await caches.keys()){
+      if(nome.startsWith(PREFIXO_CACHE) && nome !== CACHE) await caches.delete(nome);
+    }
+    await self.clients.claim();
+  })());
+});
+
+self.addEventListener('message', e => {
+  if(e.data === 'ativar') self.skipWaiting();
+});
+
+self.addEventListener('fetch', e => {
+  if(e.request.method !== 'GET') return;
+  const rel = relativo(e.request.url);
+  if(rel === null || !(rel in PRECACHE.arquivos)) return;
+  e.respondWith((async () => {
+    const cache = await caches.open(CACHE);
+    return (await cache.match(chave(rel))) || fetch(e.request);
+  })());
+});
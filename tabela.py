@@ -0,0 +1,208 @@
+# Tabela virtualizada (canvas) para relatórios com muitas linhas
+# Só as linhas visíveis existem como itens do canvas; rolar apenas troca os textos
+# de um conjunto fixo de itens. O modelo (linhas + ordenação) não depende do Tk.
+
+import math
+import tkinter as tk
+
+ALTURA_LINHA = 22
+ALTURA_CABECALHO = 26
+
+
+def _chave_ordenacao(valor):
+    # números antes de textos, sem comparar tipos diferentes
+    if isinstance(valor, str):
+        return (1, valor.lower())
+    return (0, valor)
+
+
+class ModeloTabela:
+    """Linhas (dicts) e ordenação por coluna, compartilhado pelas telas de cristais e receitas.
+
+    `colunas` é uma lista de dicts: chave, titulo, largura (peso), alinhar ("w"/"e")
+    e formato (texto de format, ex.: "{:,}", ou função valor → texto).
+    """
+    def __init__(self, colunas):
+        self.colunas = colunas
+        self.linhas = []
+        self.ordem = None
+        self.decrescente = False
+        self.versao = 0
+
+    def __len__(self):
+        return len(self.linhas)
+
+    def definir_linhas(self, linhas):
+        """Troca as linhas mantendo a ordenação escolhida pelo usuário."""
+        self.linhas = list(linhas)
+        self._ordenar()
+        self.versao += 1
+
+    def ordenar(self, chave):
+        """Ordena pela coluna; repetir a mesma coluna inverte o sentido."""
+        if self.ordem == chave:
+            self.decrescente = not self.decrescente
+        else:
+            self.ordem, self.decrescente = chave, False
+        self._ordenar()
+        self.versao += 1
+
+    def _ordenar(self):
+        if self.ordem is not None:
+            chave = self.ordem
+            # linhas sem valor na coluna ficam sempre no fim, nos dois sentidos
+            com_valor = [l for l in self.linhas if l.get(chave) is not None]
+            sem_valor = [l for l in self.linhas if l.get(chave) is None]
+            com_valor.sort(key=lambda l: _chave_ordenacao(l[chave]), reverse=self.decrescente)
+            self.linhas = com_valor + sem_valor
+
+    def texto(self, linha, coluna):
+        valor = linha.get(coluna["chave"])
+        if valor is None:
+            return ""
+        formato = coluna.get("formato")
+        if formato is None:
+            return str(valor)
+        if callable(formato):
+            return formato(valor)
+        return formato.format(valor)
+
+
+class TabelaVirtual(tk.Frame):
+    """Tabela com cabeçalho clicável (ordena) e corpo virtualizado num canvas."""
+    def __init__(self, master, modelo, bg="#1e293b", bg_alt="#223047", fg="#f1f5f9",
+                 bg_cabecalho="#0f172a", fg_cabecalho="#f59e0b", fonte=("Segoe UI", 9),
+                 comando=None, **kwargs):
+        super().__init__(master, bg=bg, **kwargs)
+        self.modelo = modelo
+        self.comando = comando
+        self.cores = (bg, bg_alt)
+        self.fg = fg
+        self.fonte = fonte
+        self.topo = 0
+        self._itens = []
+        self._textos = {}
+        self._xs = []
+
+        self.cabecalho = tk.Canvas(self, bg=bg_cabecalho, height=ALTURA_CABECALHO, highlightthickness=0)
+        self.corpo = tk.Canvas(self, bg=bg, highlightthickness=0)
+        self.barra = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.cabecalho.grid(row=0, column=0, sticky="ew")
+        self.corpo.grid(row=1, column=0, sticky="nsew")
+        self.barra.grid(row=0, column=1, rowspan=2, sticky="ns")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self._titulos = []
+        for coluna in modelo.colunas:
+            item = self.cabecalho.create_text(0, ALTURA_CABECALHO // 2, text=coluna["titulo"],
+                                              anchor=coluna.get("alinhar", "w"),
+                                              fill=fg_cabecalho, font=(fonte[0], fonte[1], "bold"))
+            self.cabecalho.tag_bind(item, "<Button-1>", lambda e, c=coluna["chave"]: self.ordenar(c))
+            self._titulos.append(item)
+
+        self.corpo.bind("<Configure>", self._ao_redimensionar)
+        self.corpo.bind("<MouseWheel>", self._roda)
+        self.corpo.bind("<Button-4>", lambda e: self._rolar(-3, "units"))
+        self.corpo.bind("<Button-5>", lambda e: self._rolar(3, "units"))
+        self.corpo.bind("<Button-1>", self._clique)
+
+    # ---------- layout ----------
+    def _ao_redimensionar(self, event=None):
+        largura = max(1, self.corpo.winfo_width())
+        pesos = [c.get("largura", 100) for c in self.modelo.colunas]
+        total = sum(pesos)
+        x, self._xs = 0, []
+        for peso in pesos:
+            w = largura * peso / total
+            self._xs.append((x, x + w))
+            x += w
+        for item, coluna, (x0, x1) in zip(self._titulos, self.modelo.colunas, self._xs):
+            self.cabecalho.coords(item, self._x_texto(coluna, x0, x1), ALTURA_CABECALHO // 2)
+        # conjunto de itens para as linhas visíveis (+1 para a linha parcialmente visível)
+        necessarias = math.ceil(max(1, self.corpo.winfo_height()) / ALTURA_LINHA) + 1
+        while len(self._itens) < necessarias:
+            fundo = self.corpo.create_rectangle(0, 0, 0, 0, width=0)
+            textos = [self.corpo.create_text(0, 0, text="", fill=self.fg, font=self.fonte,
+                                             anchor=coluna.get("alinhar", "w"))
+                      for coluna in self.modelo.colunas]
+            self._itens.append((fundo, textos))
+        self._textos.clear()
+        self.atualizar()
+
+    @staticmethod
+    def _x_texto(coluna, x0, x1):
+        return x1 - 6 if coluna.get("alinhar", "w") == "e" else x0 + 6
+
+    # ---------- desenho ----------
+    def atualizar(self):
+        """Redesenha só as linhas visíveis a partir do modelo (após mudar linhas ou ordem)."""
+        altura = max(1, self.corpo.winfo_height())
+        total = len(self.modelo) * ALTURA_LINHA
+        self.topo = max(0, min(self.topo, total - altura))
+        primeira, deslocamento = divmod(int(self.topo), ALTURA_LINHA)
+        largura = self._xs[-1][1] if self._xs else self.corpo.winfo_width()
+        for k, (fundo, textos) in enumerate(self._itens):
+            idx = primeira + k
+            y = k * ALTURA_LINHA - deslocamento
+            if idx >= len(self.modelo):
+                self.corpo.itemconfigure(fundo, state="hidden")
+                for item in textos:
+                    self.corpo.itemconfigure(item, state="hidden")
+                continue
+            linha = self.modelo.linhas[idx]
+            self.corpo.coords(fundo, 0, y, largura, y + ALTURA_LINHA)
+            self.corpo.itemconfigure(fundo, state="normal", fill=self.cores[idx % 2])
+            for item, coluna, (x0, x1) in zip(textos, self.modelo.colunas, self._xs):
+                self.corpo.coords(item, self._x_texto(coluna, x0, x1), y + ALTURA_LINHA // 2)
+                texto = self.modelo.texto(linha, coluna)
+                if self._textos.get(item) != texto:
+                    self._textos[item] = texto
+                    self.corpo.itemconfigure(item, text=texto)
+                self.corpo.itemconfigure(item, state="normal")
+        for item, coluna in zip(self._titulos, self.modelo.colunas):
+            seta = ""
+            if self.modelo.ordem == coluna["chave"]:
+                seta = " ▼" if self.modelo.decrescente else " ▲"
+            self.cabecalho.itemconfigure(item, text=coluna["titulo"] + seta)
+        if total <= 0:
+            self.barra.set(0, 1)
+        else:
+            self.barra.set(self.topo / total, min(1, (self.topo + altura) / total))
+
+    def definir_linhas(self, linhas):
+        self.modelo.definir_linhas(linhas)
+        self.atualizar()
+
+    def ordenar(self, chave):
+        self.modelo.ordenar(chave)
+        self.atualizar()
+
+    # ---------- rolagem ----------
+    def yview(self, *args):
+        total = len(self.modelo) * ALTURA_LINHA
+        if not args or total <= 0:
+            return
+        if args[0] == "moveto":
+            self.topo = float(args[1]) * total
+            self.atualizar()
+        elif args[0] == "scroll":
+            self._rolar(int(args[1]), args[2])
+
+    def _rolar(self, n, unidade):
+        passo = ALTURA_LINHA if unidade == "units" else max(ALTURA_LINHA, self.corpo.winfo_height() - ALTURA_LINHA)
+        self.topo += n * passo
+        self.atualizar()
+        return "break"
+
+    def _roda(self, event):
+        # Windows/macOS: delta em múltiplos de 120 (macOS: valores pequenos)
+        passos = -int(event.delta / 120) if abs(event.delta) >= 120 else (-1 if event.delta > 0 else 1)
+        return self._rolar(passos * 3, "units")
+
+    def _clique(self, event):
+        if self.comando is None:
+            return
+        idx = int((self.topo + event.y) // ALTURA_LINHA)
+        if 0 <= idx < len(self.modelo):
+            self.comando(self.modelo.linhas[idx])
@@ -0,0 +1,44 @@
+# Regressão: números que o json aceita mas não cabem num inteiro/preço
+# (1e400 e Infinity viram inf) são erro da linha, não do lote.
+#
+#   python -m pytest -q test_consultas.py
+
+import io
+import json
+
+import pytest
+
+from cli import processar
+from consultas import responder, ConsultaInvalida
+
+NAO_FINITOS = ("1e400", "-1e400", "Infinity", "-Infinity", "NaN")
+
+
+@pytest.mark.parametrize("numero", NAO_FINITOS)
+def test_inteiro_nao_finito_e_consulta_invalida(numero):
+    with pytest.raises(ConsultaInvalida):
+        responder(json.loads(f'{{"tipo": "nivel", "nivel_inicial": 1, "xp": {numero}}}'))
+
+
+@pytest.mark.parametrize("numero", NAO_FINITOS)
+def test_preco_nao_finito_e_consulta_invalida(numero):
+    with pytest.raises(ConsultaInvalida):
+        responder(json.loads(f'{{"tipo": "cristais", "slot": "Emblema", "valores": {{"Cristais do Céu": {numero}}}}}'))
+    with pytest.raises(ConsultaInvalida):
+        responder(json.loads(f'{{"tipo": "pocoes", "nivel_inicial": 1, "nivel_final": 10, '
+                             f'"precos": {{"grande": {numero}}}}}'))
+
+
+def test_lote_continua_depois_de_linha_com_overflow():
+    entrada = io.StringIO(
+        '{"id": 1, "tipo": "nivel", "nivel_inicial": 1, "xp": 1e400}\n'
+        '{"id": 2, "tipo": "nivel", "nivel_inicial": 1, "xp": Infinity}\n'
+        '{"id": 3, "tipo": "niveis", "niveis_iniciais": [1], "xps": [1e400]}\n'
+        '{"id": 4, "tipo": "xp", "nivel_inicial": 1, "nivel_final": 3}\n'
+    )
+    saida = io.StringIO()
+    total, erros = processar(entrada, saida)
+    respostas = [json.loads(linha) for linha in saida.getvalue().splitlines()]
+    assert (total, erros) == (4, 3)
+    assert [r["id"] for r in respostas] == [1, 2, 3, 4]
+    assert [r["ok"] for r in respostas] == [False, False, False, True]
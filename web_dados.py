@@ -0,0 +1,185 @@
+# Dados da versão web gerados a partir do núcleo Python (fonte única)
+#
+# Build:      python web_dados.py               → dados.js (não editar à mão)
+# Paridade:   python web_dados.py --paridade    → compara calculos.js (node) com
+#             calculos.py em todo o espaço de entradas: todo par de níveis e
+#             tier, todo slot e nível de cristal e todas as receitas
+#
+# dados.js traz as tabelas de assets/dados_jogo.json e as já pré-calculadas
+# (média/piso/pity de cristais por nível, totais a partir de cada nível atual,
+# gemas de transferência por nível): o navegador só consulta, sem laços.
+
+import json
+import os
+import subprocess
+import sys
+
+from calculos import (
+    receitas, XP_POCAO_POR_TIER, xpTotalByLevel, crystals_per_up, slots, cristais_tipos,
+    TAXA_VENDA, NIVEL_MAXIMO, NIVEL_MAXIMO_CRISTAL, dados_atuais,
+    plano_experiencia, custo_receita, plano_cristais, get_transfer_cost, get_crystal_type_for_level
+)
+from sprites import SPRITES_WEB
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_JS = os.path.join(BASE_DIR, "dados.js")
+ARQUIVO_CALCULOS_JS = os.path.join(BASE_DIR, "calculos.js")
+
+# quantidades e preços de receita conferidos na paridade
+QUANTIDADES_RECEITA = (0, 1, 7, 100, 999)
+VALORES_RECEITA = (0, 1, 3200, 12345)
+
+
+def _sprites_equip():
+    """Slot → classe do sprite no atlas web (a mesma lista usada por sprites.py)."""
+    return {nome.split("/", 1)[1]: classe for nome, classe, _ in SPRITES_WEB if nome.startswith("equip/")}
+
+
+def _tabela_cristais(slot):
+    base = plano_cristais(slot, 0)
+    planos = [plano_cristais(slot, atual) for atual in range(NIVEL_MAXIMO_CRISTAL + 1)]
+    return {
+        "niveis": [{"tipo": n["tipo"], "media": n["media"], "minimo": n["minimo"], "maximo": n["maximo"]}
+                   for n in base["niveis"]],
+        "total_media": [p["total_media"] for p in planos],
+        "total_maximo": [p["total_maximo"] for p in planos],
+        "transferencia": [get_transfer_cost(slot, nivel) for nivel in range(NIVEL_MAXIMO_CRISTAL + 1)],
+    }
+
+
+def montar_dados():
+    """Dict serializado em dados.js (chaves ASCII, como o JS usa)."""
+    return {
+        "versao": dados_atuais["versao"],
+        "hash": dados_atuais["hash"],
+        "xp_total": list(xpTotalByLevel),
+        "xp_pocao": {tier: {"grande": v["grande"], "media": v["média"], "pequena": v["pequena"]}
+                     for tier, v in XP_POCAO_POR_TIER.items()},
+        "taxa_venda": TAXA_VENDA,
+        "receitas": {r: {item: list(v) for item, v in itens.items()} for r, itens in receitas.items()},
+        "slots": list(slots),
+        "cristais_por_up": dict(crystals_per_up),
+        "tipos_cristal": list(cristais_tipos),
+        "tipo_cristal": [None] + [get_crystal_type_for_level(n) for n in range(1, NIVEL_MAXIMO_CRISTAL + 1)],
+        "cristais": {slot: _tabela_cristais(slot) for slot in slots},
+        "sprites_equip": _sprites_equip(),
+    }
+
+
+def gerar_js(dados=None):
+    dados = montar_dados() if dados is None else dados
+    corpo = json.dumps(dados, ensure_ascii=False, separators=(",", ":"))
+    return ("/* Gerado por web_dados.py a partir de assets/dados_jogo.json — não editar */\n"
+            f"const GLA_DADOS = {corpo};\n"
+            "if(typeof module !== 'undefined') module.exports = GLA_DADOS;\n")
+
+
+def gravar(destino=ARQUIVO_JS):
+    """Grava dados.js; devolve False se já estava em dia."""
+    texto = gerar_js()
+    try:
+        with open(destino, "r", encoding="utf-8") as f:
+            if f.read() == texto:
+                return False
+    except OSError:
+        pass
+    with open(destino, "w", encoding="utf-8", newline="\n") as f:
+        f.write(texto)
+    return True
+
+
+# ================= PARIDADE PYTHON × JS =================
+def casos():
+    """Todo o espaço de entradas das calculadoras web."""
+    for tier in XP_POCAO_POR_TIER:
+        for ini in range(0, NIVEL_MAXIMO + 2):
+            for fin in range(0, NIVEL_MAXIMO + 2):
+                yield {"tipo": "xp", "nivel_inicial": ini, "nivel_final": fin, "tier": tier}
+    # preços distintos por tipo denunciam um tipo trocado de nível
+    valores = {t: 10 ** i + i for i, t in enumerate(cristais_tipos)}
+    for slot in slots:
+        for atual in range(-1, NIVEL_MAXIMO_CRISTAL + 2):
+            yield {"tipo": "cristais", "slot": slot, "nivel_atual": atual, "valores": valores}
+    for receita in receitas:
+        for qtd in QUANTIDADES_RECEITA:
+            for valor in VALORES_RECEITA:
+                yield {"tipo": "receita", "receita": receita, "quantidade": qtd, "valor": valor}
+
+
+def esperado(caso):
+    """Resposta do núcleo Python no formato devolvido por calculos.js."""
+    if caso["tipo"] == "xp":
+        plano = plano_experiencia(caso["nivel_inicial"], caso["nivel_final"], caso["tier"])
+        if plano is None:
+            return None
+        p = plano["pocoes"]
+        return {"xp": plano["xp"], "grandes": p["grande"], "medias": p["média"], "pequenas": p["pequena"]}
+    if caso["tipo"] == "cristais":
+        plano = plano_cristais(caso["slot"], caso["nivel_atual"], caso["valores"])
+        plano["niveis"] = [dict(n) for n in plano["niveis"]]
+        return plano
+    r = custo_receita(caso["receita"], caso["quantidade"], caso["valor"])
+    # a página mostra a taxa arredondada para baixo
+    taxa = int(r["taxa"])
+    return {"itens": r["itens"], "custo": r["custo"], "venda": r["venda"], "taxa": taxa,
+            "lucro": r["venda"] - r["custo"] - taxa}
+
+
+_DRIVER_NODE = r"""
+const calc = require(process.argv[1]);
+let entrada = '';
+process.stdin.on('data', d => entrada += d);
+process.stdin.on('end', () => {
+  const saida = JSON.parse(entrada).map(c => {
+    if(c.tipo === 'xp') return calc.plano_experiencia(c.nivel_inicial, c.nivel_final, c.tier);
+    if(c.tipo === 'cristais') return calc.plano_cristais(c.slot, c.nivel_atual, c.valores);
+    return calc.custo_receita(c.receita, c.quantidade, c.valor);
+  });
+  process.stdout.write(JSON.stringify(saida));
+});
+"""
+
+
+def resultados_js(lista, node="node", calculos_js=ARQUIVO_CALCULOS_JS):
+    """Roda calculos.js no node com todos os casos de uma vez."""
+    proc = subprocess.run([node, "-e", _DRIVER_NODE, calculos_js], input=json.dumps(lista, ensure_ascii=False),
+                          capture_output=True, text=True, encoding="utf-8", check=True)
+    return json.loads(proc.stdout)
+
+
+def paridade(node="node"):
+    """Compara Python e JS caso a caso; devolve (total, lista de divergências)."""
+    lista = list(casos())
+    obtidos = resultados_js(lista, node)
+    # mesma serialização dos dois lados (tuplas viram listas, floats pelo repr)
+    esperados = json.loads(json.dumps([esperado(c) for c in lista], ensure_ascii=False))
+    divergencias = [(c, e, o) for c, e, o in zip(lista, esperados, obtidos) if e != o]
+    return len(lista), divergencias
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Gera dados.js da versão web e confere a paridade com o Python")
+    parser.add_argument("--paridade", action="store_true", help="compara calculos.js (node) com calculos.py")
+    parser.add_argument("--node", default="node", help="executável do node")
+    args = parser.parse_args(argv)
+
+    if gravar():
+        print(f"dados.js gerado (dados do jogo: versão {dados_atuais['versao']})")
+    else:
+        print("dados.js em dia")
+    if not args.paridade:
+        return 0
+    try:
+        total, divergencias = paridade(args.node)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"não foi possível rodar o node: {e}", file=sys.stderr)
+        return 2
+    for caso, esp, obt in divergencias[:10]:
+        print(f"divergência em {json.dumps(caso, ensure_ascii=False)}:\n  python: {esp}\n  js:     {obt}")
+    print(f"{total - len(divergencias)} de {total} casos iguais")
+    return 1 if divergencias else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
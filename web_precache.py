@@ -0,0 +1,104 @@
+# Manifesto de precache do service worker da versão web (sw.js)
+#
+# Build:   python web_precache.py            → precache.js (não editar à mão)
+# Teste:   python web_precache.py --servir   → gera e serve a pasta em
+#          http://localhost:8000 (localhost conta como origem segura, então o
+#          service worker registra; em DevTools > Application dá para ver o
+#          cache e marcar "Offline")
+#
+# O manifesto lista os arquivos que a página usa com o hash do conteúdo; a
+# versão é o hash do manifesto. Mudou um arquivo, muda precache.js — o
+# navegador vê o sw.js "novo", baixa em segundo plano só o que mudou e troca
+# de versão na próxima visita.
+
+import hashlib
+import json
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_MANIFESTO = os.path.join(BASE_DIR, "precache.js")
+
+# o que a página carrega (os PNGs avulsos de assets/ entram via sprites.png)
+ARQUIVOS = [
+    "index.html",
+    "styles.css",
+    "assets/sprites.css",
+    "assets/sprites.png",
+    "dados.js",
+    "calculos.js",
+    "script.js",
+    "worker.js",
+    "icon.ico",
+]
+
+
+def _hash_arquivo(caminho):
+    h = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(1 << 16), b""):
+            h.update(bloco)
+    return h.hexdigest()[:16]
+
+
+def montar_manifesto(pasta=BASE_DIR, arquivos=ARQUIVOS):
+    """{versao, arquivos: {url relativa: hash}}; FileNotFoundError se faltar um arquivo."""
+    hashes = {url: _hash_arquivo(os.path.join(pasta, *url.split("/"))) for url in arquivos}
+    versao = hashlib.sha256(json.dumps(hashes, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+    return {"versao": versao, "arquivos": hashes}
+
+
+def gerar_js(manifesto):
+    corpo = json.dumps(manifesto, ensure_ascii=False, indent=2)
+    return ("/* Gerado por web_precache.py — não editar */\n"
+            f"const PRECACHE = {corpo};\n")
+
+
+def gravar(pasta=BASE_DIR):
+    """Grava precache.js; devolve (manifesto, mudou)."""
+    manifesto = montar_manifesto(pasta)
+    texto = gerar_js(manifesto)
+    destino = os.path.join(pasta, "precache.js")
+    try:
+        with open(destino, "r", encoding="utf-8") as f:
+            if f.read() == texto:
+                return manifesto, False
+    except OSError:
+        pass
+    with open(destino, "w", encoding="utf-8", newline="\n") as f:
+        f.write(texto)
+    return manifesto, True
+
+
+def servir(pasta=BASE_DIR, porta=8000):
+    from functools import partial
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+    handler = partial(SimpleHTTPRequestHandler, directory=pasta)
+    with ThreadingHTTPServer(("127.0.0.1", porta), handler) as httpd:
+        print(f"servindo {pasta} em http://localhost:{porta}/ (Ctrl+C para parar)")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Gera o manifesto de precache do service worker")
+    parser.add_argument("--servir", action="store_true", help="serve a pasta localmente depois de gerar")
+    parser.add_argument("--porta", type=int, default=8000)
+    args = parser.parse_args(argv)
+    try:
+        manifesto, mudou = gravar()
+    except FileNotFoundError as e:
+        print(f"arquivo do manifesto ausente: {e.filename}", file=sys.stderr)
+        return 1
+    print(f"precache.js {'gerado' if mudou else 'em dia'}: versão {manifesto['versao']}, "
+          f"{len(manifesto['arquivos'])} arquivos")
+    if args.servir:
+        servir(porta=args.porta)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
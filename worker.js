@@ -0,0 +1,73 @@
+/* GLA Tools — worker de cálculo da versão web
+   Roda as TAREFAS de calculos.js fora da thread da página.
+
+   Mensagens recebidas:
+     {id, tipo, args}   enfileira a tarefa `tipo`
+     {cancelar: id}     descarta a tarefa (na fila ou em andamento)
+   Mensagens enviadas:
+     {id, progresso}            fração concluída (no máximo uma por fatia)
+     {id, ok: true, resultado}  |  {id, ok: false, erro}  |  {id, cancelado: true}
+
+   As tarefas rodam em fatias de FATIA_MS; entre uma fatia e outra o worker
+   devolve o controle ao loop de eventos, então um cancelamento enviado pela
+   página é atendido no máximo uma fatia depois.
+*/
+
+importScripts('dados.js', 'calculos.js');
+
+const FATIA_MS = 8;
+const fila = [];   // {id, it, progresso, cancelado}
+
+// MessageChannel agenda a próxima fatia sem o atraso mínimo do setTimeout aninhado
+const canal = new MessageChannel();
+let agendado = false;
+canal.port1.onmessage = rodar;
+function agendar(){
+  if(!agendado){ agendado = true; canal.port2.postMessage(null); }
+}
+
+self.onmessage = e => {
+  const m = e.data;
+  if(m.cancelar !== undefined){
+    const job = fila.find(j => j.id === m.cancelar);
+    if(job) job.cancelado = true;
+    agendar();
+    return;
+  }
+  const tarefa = TAREFAS[m.tipo];
+  if(!tarefa){
+    self.postMessage({id: m.id, ok: false, erro: `tipo desconhecido: ${m.tipo}`});
+    return;
+  }
+  fila.push({id: m.id, it: tarefa(m.args || {}), progresso: null, cancelado: false});
+  agendar();
+};
+
+function terminar(job, mensagem){
+  fila.splice(fila.indexOf(job), 1);
+  self.postMessage(Object.assign({id: job.id}, mensagem));
+}
+
+function rodar(){
+  agendado = false;
+  const inicio = performance.now();
+  let atual = null;
+  while(fila.length && performance.now() - inicio < FATIA_MS){
+    const cancelado = fila.find(j => j.cancelado);
+    if(cancelado){ terminar(cancelado, {cancelado: true}); continue; }
+    atual = fila[0];
+    let passo;
+    try{
+      passo = atual.it.next();
+    }catch(err){
+      terminar(atual, {ok: false, erro: String((err && err.message) || err)});
+      continue;
+    }
+    if(passo.done) terminar(atual, {ok: true, resultado: passo.value});
+    else if(typeof passo.value === 'number') atual.progresso = passo.value;
+  }
+  if(atual && fila[0] === atual && atual.progresso !== null){
+    self.postMessage({id: atual.id, progresso: atual.progresso});
+  }
+  if(fila.length) agendar();
+}